@@ -5,6 +5,7 @@ from gd.api.color_channels import (
     NormalColorChannel,
     PlayerColorChannel,
 )
+from gd.api.columnar import ColumnarEditor
 from gd.api.database import Database
 from gd.api.editor import Editor
 from gd.api.folder import Folder
@@ -68,6 +69,7 @@ from gd.api.objects import (
     object_to_binary,
     object_to_bytes,
 )
+from gd.api.packed import PackedObjects
 from gd.api.recording import Recording, RecordingItem
 from gd.api.rewards import Quest, Reward, RewardItem
 from gd.api.save_manager import SaveManager, create_database, save
@@ -94,6 +96,8 @@ __all__ = (
     "TimelyLevelAPI",
     # editor
     "Editor",
+    "ColumnarEditor",
+    "PackedObjects",
     # header
     "Header",
     # color channels
@@ -0,0 +1,117 @@
+from typing import Any, Iterable, List, Optional, TypeVar, Union
+
+from typing_extensions import Protocol
+
+__all__ = ("Owner", "Tracked", "TrackedList", "get_changes", "record_change", "change_tracked")
+
+changes = 0
+
+
+def get_changes() -> int:
+    """Returns the stamp of the latest change recorded."""
+    return changes
+
+
+def record_change() -> int:
+    """Records the change, returning its stamp; stamps only ever increase."""
+    global changes
+
+    changes += 1
+
+    return changes
+
+
+class Owner(Protocol):
+    """Represents owners of copy-on-write copies of shared values."""
+
+    def attach(self, value: Any) -> None:
+        """Stores the `value` (that is about to change) in place of the shared one."""
+        ...
+
+
+class Tracked(Protocol):
+    """Represents mutable values owned by objects, like HSVs and groups."""
+
+    owner: Optional[Owner]
+    """The owner of the copy-on-write copy, until it is changed for the first time."""
+    stamp: int
+    """The stamp of the latest change of the value."""
+
+
+def change_tracked(value: Tracked) -> None:
+    """Records the change of the `value`; this needs to be called before the value is changed.
+
+    Copy-on-write copies are attached to their owners beforehand.
+    """
+    owner = value.owner
+
+    if owner is not None:
+        value.owner = None
+
+        owner.attach(value)
+
+    value.stamp = record_change()
+
+
+T = TypeVar("T")
+
+L = TypeVar("L", bound="TrackedList[Any]")
+
+
+class TrackedList(List[T]):
+    """Represents lists that record their changes (see [`record_change`][gd.api.changes.record_change]).
+
+    Only changes of contents are recorded; reordering is not.
+    """
+
+    __slots__ = ()
+
+    def append(self, item: T) -> None:
+        record_change()
+
+        super().append(item)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        record_change()
+
+        super().extend(iterable)
+
+    def insert(self, index: int, item: T) -> None:
+        record_change()
+
+        super().insert(index, item)
+
+    def pop(self, index: int = -1) -> T:
+        record_change()
+
+        return super().pop(index)
+
+    def remove(self, item: T) -> None:
+        record_change()
+
+        super().remove(item)
+
+    def clear(self) -> None:
+        record_change()
+
+        super().clear()
+
+    def __setitem__(self, index: Any, item: Any) -> None:
+        record_change()
+
+        super().__setitem__(index, item)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        record_change()
+
+        super().__delitem__(index)
+
+    def __iadd__(self: L, iterable: Iterable[T]) -> L:  # type: ignore
+        record_change()
+
+        return super().__iadd__(iterable)
+
+    def __imul__(self: L, count: int) -> L:
+        record_change()
+
+        return super().__imul__(count)
@@ -0,0 +1,374 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Tuple, Type, TypeVar, Union, overload
+
+from attrs import define, field, fields
+from funcs.application import partial
+from iters.iters import iter, wrap_iter
+from typing_aliases import is_instance, is_slice
+
+from gd.api.editor import Editor
+from gd.api.header import Header
+from gd.api.hsv import DEFAULT_HSV, HSV
+from gd.api.objects import (
+    EMPTY_GROUPS,
+    STAMP,
+    Groups,
+    Object,
+    migrate_objects,
+    object_from_binary,
+    object_from_robtop,
+    object_to_binary,
+    object_to_robtop,
+    peek_attribute,
+    peek_base_color_hsv,
+    peek_detail_color_hsv,
+    peek_groups,
+)
+from gd.api.packed import FLAG_BITS, PACKED_VERSION, PackedObjects, write_packed_objects
+from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
+from gd.binary_utils import Reader, Writer
+from gd.enums import ByteOrder
+from gd.models_constants import OBJECTS_SEPARATOR
+from gd.models_utils import concat_objects, split_objects
+from gd.robtop import RobTop
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None  # type: ignore
+
+__all__ = ("ColumnarEditor",)
+
+ID_TYPE = "H"
+COORDINATE_TYPE = "d"
+FLAGS_TYPE = "H"
+Z_LAYER_TYPE = "b"
+Z_ORDER_TYPE = "h"
+EDITOR_LAYER_TYPE = "H"
+COLOR_ID_TYPE = "H"
+GROUP_OFFSET_TYPE = "I"
+GROUP_ID_TYPE = "H"
+
+COLUMN_NAMES = frozenset(
+    (
+        "id",
+        "x",
+        "y",
+        "rotation",
+        "scale",
+        "z_layer",
+        "z_order",
+        "base_editor_layer",
+        "additional_editor_layer",
+        "base_color_id",
+        "detail_color_id",
+        "link_id",
+        "groups",
+        *FLAG_BITS,
+    )
+)
+
+# `base_color_hsv` and `detail_color_hsv` are not columns; they are stored in the side table
+# if they are not default, along with the fields of non-plain objects (triggers, for instance)
+
+HSV_NAMES = ("base_color_hsv", "detail_color_hsv")
+
+IGNORED_NAMES = frozenset((STAMP, *HSV_NAMES))
+
+Extra = Tuple[Type[Object], Dict[str, Any]]
+
+EXTRA_NAMES: Dict[Type[Object], Tuple[str, ...]] = {}
+
+
+def extra_names(object_type: Type[Object]) -> Tuple[str, ...]:
+    names = EXTRA_NAMES.get(object_type)
+
+    if names is None:
+        names = EXTRA_NAMES[object_type] = tuple(
+            attribute.name
+            for attribute in fields(object_type)
+            if attribute.name not in COLUMN_NAMES and attribute.name not in IGNORED_NAMES
+        )
+
+    return names
+
+
+def copy_extra(value: Any) -> Any:
+    if is_instance(value, HSV) and value is not DEFAULT_HSV:
+        return value.copy()
+
+    return value
+
+
+def has_default_hsv(object: Object) -> bool:
+    default = DEFAULT_HSV
+
+    return peek_base_color_hsv(object) == default and peek_detail_color_hsv(object) == default
+
+
+NUMPY_REQUIRED = "`numpy` is required to view columns as arrays"
+UNKNOWN_COLUMN = "unknown column: `{}`"
+
+CE = TypeVar("CE", bound="ColumnarEditor")
+
+
+@define()
+class ColumnarEditor(RobTop, Binary):
+    """Represents editors that store objects column-wise (as the struct of arrays).
+
+    Common object fields are stored in typed arrays, groups are stored using the CSR layout
+    (`group_offsets` into `group_ids`), and everything else (HSVs that are not default,
+    as well as the fields of special objects, like triggers) is stored in the sparse `extras`
+    side table, keyed by object index.
+
+    Conversion to and from objects is lossless, and both RobTop and binary formats are
+    the same as the ones of [`Editor`][gd.api.editor.Editor].
+    """
+
+    header: Header = field(factory=Header)
+    """The header of the editor."""
+
+    ids: array = field(factory=partial(array, ID_TYPE))
+    xs: array = field(factory=partial(array, COORDINATE_TYPE))
+    ys: array = field(factory=partial(array, COORDINATE_TYPE))
+    rotations: array = field(factory=partial(array, COORDINATE_TYPE))
+    scales: array = field(factory=partial(array, COORDINATE_TYPE))
+    flags: array = field(factory=partial(array, FLAGS_TYPE))
+    z_layers: array = field(factory=partial(array, Z_LAYER_TYPE))
+    z_orders: array = field(factory=partial(array, Z_ORDER_TYPE))
+    base_editor_layers: array = field(factory=partial(array, EDITOR_LAYER_TYPE))
+    additional_editor_layers: array = field(factory=partial(array, EDITOR_LAYER_TYPE))
+    base_color_ids: array = field(factory=partial(array, COLOR_ID_TYPE))
+    detail_color_ids: array = field(factory=partial(array, COLOR_ID_TYPE))
+    link_ids: array = field(factory=partial(array, ID_TYPE))
+
+    group_offsets: array = field(factory=partial(array, GROUP_OFFSET_TYPE, (0,)))
+    group_ids: array = field(factory=partial(array, GROUP_ID_TYPE))
+
+    extras: Dict[int, Extra] = field(factory=dict)
+
+    @classmethod
+    def from_objects(cls: Type[CE], *objects: Object, header: Header) -> CE:
+        return cls.from_object_iterable(objects, header)
+
+    @classmethod
+    def from_object_iterable(cls: Type[CE], objects: Iterable[Object], header: Header) -> CE:
+        editor = cls(header)
+
+        editor.extend(objects)
+
+        return editor
+
+    @classmethod
+    def from_editor(cls: Type[CE], editor: Editor) -> CE:
+        return cls.from_object_iterable(editor.objects, editor.header)
+
+    def into_editor(self) -> Editor:
+        return Editor(self.header, self.iter_objects().list())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self: CE, index: slice) -> CE:
+        ...
+
+    def __getitem__(self: CE, index: Union[int, slice]) -> Union[Object, CE]:
+        if is_slice(index):
+            return self.from_object_iterable(
+                map(self.get_object, range(len(self))[index]), self.header
+            )
+
+        return self.get_object(range(len(self))[index])  # type: ignore
+
+    def __iter__(self) -> Iterator[Object]:
+        return self.iter_objects().unwrap()
+
+    def append(self: CE, object: Object) -> CE:
+        index = len(self.ids)
+
+        self.ids.append(object.id)
+        self.xs.append(object.x)
+        self.ys.append(object.y)
+        self.rotations.append(object.rotation)
+        self.scales.append(object.scale)
+
+        value = 0
+
+        for name, bit in FLAG_BITS.items():
+            if getattr(object, name):
+                value |= bit
+
+        self.flags.append(value)
+
+        self.z_layers.append(object.z_layer)
+        self.z_orders.append(object.z_order)
+        self.base_editor_layers.append(object.base_editor_layer)
+        self.additional_editor_layers.append(object.additional_editor_layer)
+        self.base_color_ids.append(object.base_color_id)
+        self.detail_color_ids.append(object.detail_color_id)
+        self.link_ids.append(object.link_id)
+
+        group_ids = self.group_ids
+
+        group_ids.extend(peek_groups(object))
+
+        self.group_offsets.append(len(group_ids))
+
+        object_type = type(object)
+
+        if object_type is not Object or not has_default_hsv(object):
+            extra = {name: peek_attribute(object, name) for name in extra_names(object_type)}
+
+            if not has_default_hsv(object):
+                extra.update(
+                    base_color_hsv=peek_base_color_hsv(object),
+                    detail_color_hsv=peek_detail_color_hsv(object),
+                )
+
+            self.extras[index] = (object_type, extra)
+
+        return self
+
+    def extend(self: CE, objects: Iterable[Object]) -> CE:
+        for object in objects:
+            self.append(object)
+
+        return self
+
+    def get_groups(self, index: int) -> Groups:
+        group_offsets = self.group_offsets
+
+        start = group_offsets[index]
+        end = group_offsets[index + 1]
+
+        if start == end:
+            return EMPTY_GROUPS
+
+        return Groups(self.group_ids[start:end])
+
+    def get_object(self, index: int) -> Object:
+        extra = self.extras.get(index)
+
+        if extra is None:
+            object_type = Object
+            values = {}
+
+        else:
+            object_type, extra_values = extra
+
+            # stored values are shared between decoded objects, so mutable ones are copied
+            values = {name: copy_extra(value) for name, value in extra_values.items()}
+
+        value = self.flags[index]
+
+        return object_type(
+            id=self.ids[index],
+            x=self.xs[index],
+            y=self.ys[index],
+            rotation=self.rotations[index],
+            scale=self.scales[index],
+            z_layer=self.z_layers[index],
+            z_order=self.z_orders[index],
+            base_editor_layer=self.base_editor_layers[index],
+            additional_editor_layer=self.additional_editor_layers[index],
+            base_color_id=self.base_color_ids[index],
+            detail_color_id=self.detail_color_ids[index],
+            link_id=self.link_ids[index],
+            groups=self.get_groups(index),
+            **{name: value & bit == bit for name, bit in FLAG_BITS.items()},
+            **values,
+        )
+
+    @wrap_iter
+    def iter_objects(self) -> Iterator[Object]:
+        return map(self.get_object, range(len(self)))
+
+    def numpy_column(self, name: str) -> Any:
+        """Returns the zero-copy NumPy view of the column named `name` (for instance, `xs`).
+
+        Raises:
+            RuntimeError: `numpy` is not installed.
+            LookupError: The column is not found.
+        """
+        if numpy is None:
+            raise RuntimeError(NUMPY_REQUIRED)
+
+        column = getattr(self, name, None)
+
+        if not isinstance(column, array):
+            raise LookupError(UNKNOWN_COLUMN.format(name))
+
+        return numpy.frombuffer(column, dtype=column.typecode)
+
+    @classmethod
+    def from_binary(
+        cls: Type[CE],
+        binary: BinaryReader,
+        order: ByteOrder = ByteOrder.DEFAULT,
+        version: int = VERSION,
+    ) -> CE:
+        header = Header.from_binary(binary, order, version)
+
+        if version >= PACKED_VERSION:
+            return cls.from_object_iterable(PackedObjects.from_binary(binary, order), header)
+
+        reader = Reader(binary, order)
+
+        iterable_length = reader.read_u32()
+
+        object_from_binary_function = partial(object_from_binary, binary, order, version)
+
+        iterable = iter.repeat_exactly_with(object_from_binary_function, iterable_length).unwrap()
+
+        return cls.from_object_iterable(iterable, header)
+
+    def to_binary(
+        self, binary: BinaryWriter, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+    ) -> None:
+        self.header.to_binary(binary, order, version)
+
+        if version >= PACKED_VERSION:
+            write_packed_objects(self.iter_objects().unwrap(), binary, order)
+
+            return
+
+        writer = Writer(binary, order)
+
+        writer.write_u32(len(self))
+
+        for object in self.iter_objects().unwrap():
+            object_to_binary(object, binary, order, version)
+
+    @classmethod
+    def from_robtop(cls: Type[CE], string: str) -> CE:
+        iterator = iter(split_objects(string)).filter(None)
+
+        header_option = iterator.next().extract()
+
+        if header_option is None:
+            header = Header()
+
+        else:
+            header = Header.from_robtop(header_option)
+
+        objects = migrate_objects(iterator.map(object_from_robtop).unwrap())
+
+        return cls.from_object_iterable(objects, header)
+
+    def to_robtop(self) -> str:
+        return (
+            self.iter_objects()
+            .map(object_to_robtop)
+            .prepend(self.header.to_robtop())
+            .collect(concat_objects)
+        )
+
+    @staticmethod
+    def can_be_in(string: str) -> bool:
+        return OBJECTS_SEPARATOR in string
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple, Type, TypeVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
 from uuid import UUID
 from uuid import uuid4 as generate_uuid
 
@@ -10,6 +10,7 @@ from funcs.unpacking import unpack_binary
 from iters.iters import iter
 from iters.ordered_set import OrderedSet, ordered_set
 from iters.utils import unary_tuple
+from named import get_type_name
 from typing_aliases import StringDict, StringMapping, is_instance, is_true
 
 from gd.api.database.completed import Completed
@@ -18,7 +19,9 @@ from gd.api.database.storage import Storage
 from gd.api.database.unlock_values import UnlockValues
 from gd.api.database.values import Values
 from gd.api.folder import Folder
+from gd.api.levels import NAME as LEVEL_NAME
 from gd.api.levels import (
+    BaseLevelAPI,
     CreatedLevelAPI,
     GauntletLevelAPI,
     OfficialLevelAPI,
@@ -195,6 +198,172 @@ key = KEY.format
 EXPECTED_STRING_DICT = "expected string dict"
 
 
+NOT_LAZY = "the database is not lazy"
+NO_ATTRIBUTE = "`{}` object has no attribute `{}`"
+
+
+def load_string_dict(data: bytes) -> StringDict[Any]:
+    payload = PARSER.load(data)
+
+    if is_instance(payload, Dict):
+        return payload
+
+    raise ValueError(EXPECTED_STRING_DICT)
+
+
+def objects_from_robtop(iterable: Iterable[str]) -> List[Object]:
+    return iter(iterable).filter(None).map(object_from_robtop).collect_iter(migrate_objects).list()
+
+
+def values_from_main_data(main_data: StringMapping[Any]) -> Values:
+    return Values.from_robtop_data(main_data.get(VALUES, {}))
+
+
+def unlock_values_from_main_data(main_data: StringMapping[Any]) -> UnlockValues:
+    return UnlockValues.from_robtop_data(main_data.get(UNLOCK_VALUES, {}))
+
+
+def custom_objects_from_main_data(main_data: StringMapping[Any]) -> List[List[Object]]:
+    custom_objects_data = main_data.get(CUSTOM_OBJECTS, {})
+
+    return iter(custom_objects_data.values()).map(split_objects).map(objects_from_robtop).list()
+
+
+def completed_from_main_data(main_data: StringMapping[Any]) -> Completed:
+    return Completed.from_robtop_data(main_data.get(COMPLETED, {}))
+
+
+def statistics_from_main_data(main_data: StringMapping[Any]) -> Statistics:
+    return Statistics.from_robtop_data(main_data.get(STATISTICS, {}))
+
+
+def songs_from_main_data(main_data: StringMapping[Any]) -> OrderedSet[SongAPI]:
+    return iter(main_data.get(SONGS, {}).values()).map(SongAPI.from_robtop_data).ordered_set()
+
+
+L = TypeVar("L", bound=BaseLevelAPI)
+
+
+def levels_from_data(
+    levels_data: StringMapping[Any],
+    level_type: Type[L],
+    materialized: Optional[StringMapping[L]] = None,
+) -> OrderedSet[L]:
+    if not materialized:
+        return iter(levels_data.values()).map(level_type.from_robtop_data).ordered_set()
+
+    # levels that were already looked up individually are reused, so that changes persist
+    def level_from_item(key: str, data: StringMapping[Any]) -> L:
+        level = materialized.get(key)
+
+        if level is None:
+            level = level_type.from_robtop_data(data)
+
+        return level
+
+    return iter(levels_data.items()).map(unpack_binary(level_from_item)).ordered_set()
+
+
+def is_array_item(item: Tuple[str, Any]) -> bool:
+    _, value = item
+
+    return is_true(value)
+
+
+def iter_created_levels_data(
+    created_levels_data: StringMapping[Any],
+) -> Iterator[Tuple[str, StringMapping[Any]]]:
+    return iter(created_levels_data.items()).skip_while(is_array_item).unwrap()
+
+
+def created_levels_from_levels_data(
+    levels_data: StringMapping[Any],
+    materialized: Optional[StringMapping[CreatedLevelAPI]] = None,
+) -> OrderedSet[CreatedLevelAPI]:
+    created_levels_data = dict(iter_created_levels_data(levels_data.get(CREATED_LEVELS, {})))
+
+    return levels_from_data(created_levels_data, CreatedLevelAPI, materialized)
+
+
+def binary_version_from_levels_data(
+    levels_data: StringMapping[Any], materialized: Optional[StringMapping[Any]] = None
+) -> RobTopVersion:
+    binary_version_data = levels_data.get(BINARY_VERSION_LEVELS)
+
+    if binary_version_data is None:
+        return CURRENT_BINARY_VERSION
+
+    return RobTopVersion.from_value(binary_version_data)
+
+
+OFFICIAL_LEVELS_NAME = "official_levels"
+SAVED_LEVELS_NAME = "saved_levels"
+TIMELY_LEVELS_NAME = "timely_levels"
+GAUNTLET_LEVELS_NAME = "gauntlet_levels"
+CREATED_LEVELS_NAME = "created_levels"
+
+MAIN_SECTIONS = {
+    "values": values_from_main_data,
+    "unlock_values": unlock_values_from_main_data,
+    "custom_objects": custom_objects_from_main_data,
+    "storage": Storage.from_robtop_data,
+    "completed": completed_from_main_data,
+    "statistics": statistics_from_main_data,
+    "songs": songs_from_main_data,
+}
+
+LEVEL_SECTIONS = {
+    OFFICIAL_LEVELS_NAME: (OFFICIAL_LEVELS, OfficialLevelAPI),
+    SAVED_LEVELS_NAME: (SAVED_LEVELS, SavedLevelAPI),
+    TIMELY_LEVELS_NAME: (TIMELY_LEVELS, TimelyLevelAPI),
+    GAUNTLET_LEVELS_NAME: (GAUNTLET_LEVELS, GauntletLevelAPI),
+}
+
+LEVELS_SECTIONS = {
+    CREATED_LEVELS_NAME: created_levels_from_levels_data,
+    "binary_version": binary_version_from_levels_data,
+}
+
+LAZY_NAMES = (*MAIN_SECTIONS, *LEVEL_SECTIONS, *LEVELS_SECTIONS)
+"""The names of sections that lazy databases load on first access."""
+
+MAIN_SECTION_KEYS = {
+    "values": VALUES,
+    "unlock_values": UNLOCK_VALUES,
+    "custom_objects": CUSTOM_OBJECTS,
+    "completed": COMPLETED,
+    "statistics": STATISTICS,
+    "songs": SONGS,
+    **{name: key for name, (key, _) in LEVEL_SECTIONS.items()},
+}
+"""The keys of the raw main data of sections, dropped once the sections are loaded.
+
+The storage is spread over many small entries, which are dropped along with the rest
+of the raw data, once no sections are deferred.
+"""
+
+LEVELS_SECTION_KEYS = {
+    CREATED_LEVELS_NAME: CREATED_LEVELS,
+    "binary_version": BINARY_VERSION_LEVELS,
+}
+"""The keys of the raw levels data of sections, dropped once the sections are loaded."""
+
+
+def load_sections(
+    main_data: StringMapping[Any], levels_data: StringMapping[Any]
+) -> StringDict[Any]:
+    sections = {name: load(main_data) for name, load in MAIN_SECTIONS.items()}
+
+    sections.update(
+        (name, levels_from_data(main_data.get(key, {}), level_type))
+        for name, (key, level_type) in LEVEL_SECTIONS.items()
+    )
+
+    sections.update((name, load(levels_data)) for name, load in LEVELS_SECTIONS.items())
+
+    return sections
+
+
 D = TypeVar("D", bound="Database")
 
 
@@ -285,19 +454,29 @@ class Database(Binary):
     created_levels: OrderedSet[CreatedLevelAPI] = field(factory=ordered_set)
     binary_version: RobTopVersion = field(default=CURRENT_BINARY_VERSION)
 
+    lazy_main_data: Optional[StringDict[Any]] = field(
+        default=None, init=False, repr=False, eq=False
+    )
+    lazy_levels: Optional[bytes] = field(default=None, init=False, repr=False, eq=False)
+    lazy_levels_data: Optional[StringDict[Any]] = field(
+        default=None, init=False, repr=False, eq=False
+    )
+    materialized_levels: Dict[str, Dict[str, Any]] = field(
+        factory=dict, init=False, repr=False, eq=False
+    )
+
     # keybindings: Keybindings = field(factory=Keybindings)
 
     @classmethod
-    def load_parts(cls: Type[D], main: bytes, levels: bytes) -> D:
-        parser = PARSER
-
-        main_payload = parser.load(main)
+    def load_parts(cls: Type[D], main: bytes, levels: bytes, lazy: bool = False) -> D:
+        """Loads the database from the `main` and `levels` parts.
 
-        if is_instance(main_payload, Dict):
-            main_data: StringMapping[Any] = main_payload
-
-        else:
-            raise ValueError(EXPECTED_STRING_DICT)
+        If `lazy` is true, only simple values are loaded from the main part, and everything else
+        (see [`LAZY_NAMES`][gd.api.database.database.LAZY_NAMES]) is loaded on first access;
+        levels can also be looked up individually, for instance, via
+        [`get_saved_level`][gd.api.database.database.Database.get_saved_level].
+        """
+        main_data = load_string_dict(main)
 
         volume = main_data.get(VOLUME, DEFAULT_VOLUME)
         sfx_volume = main_data.get(SFX_VOLUME, DEFAULT_VOLUME)
@@ -381,51 +560,6 @@ class Database(Binary):
 
         achievements = {name: int(progress) for name, progress in achievements_data.items()}
 
-        values_data = main_data.get(VALUES, {})
-
-        values = Values.from_robtop_data(values_data)
-
-        unlock_values_data = main_data.get(UNLOCK_VALUES, {})
-
-        unlock_values = UnlockValues.from_robtop_data(unlock_values_data)
-
-        custom_objects_data = main_data.get(CUSTOM_OBJECTS, {})
-
-        def objects_from_robtop(iterable: Iterable[str]) -> List[Object]:
-            return (
-                iter(iterable)
-                .filter(None)
-                .map(object_from_robtop)
-                .collect_iter(migrate_objects)
-                .list()
-            )
-
-        custom_objects = (
-            iter(custom_objects_data.values()).map(split_objects).map(objects_from_robtop).list()
-        )
-
-        storage = Storage.from_robtop_data(main_data)
-
-        completed_data = main_data.get(COMPLETED, {})
-
-        completed = Completed.from_robtop_data(completed_data)
-
-        statistics_data = main_data.get(STATISTICS, {})
-
-        statistics = Statistics.from_robtop_data(statistics_data)
-
-        official_levels_data = main_data.get(OFFICIAL_LEVELS, {})
-
-        official_levels = (
-            iter(official_levels_data.values()).map(OfficialLevelAPI.from_robtop_data).ordered_set()
-        )
-
-        saved_levels_data = main_data.get(SAVED_LEVELS, {})
-
-        saved_levels = (
-            iter(saved_levels_data.values()).map(SavedLevelAPI.from_robtop_data).ordered_set()
-        )
-
         followed_data = main_data.get(FOLLOWED, {})
 
         followed = iter(followed_data.keys()).map(int).ordered_set()
@@ -434,12 +568,6 @@ class Database(Binary):
 
         last_played = iter(last_played_data.keys()).map(int).ordered_set()
 
-        timely_levels_data = main_data.get(TIMELY_LEVELS, {})
-
-        timely_levels = (
-            iter(timely_levels_data.values()).map(TimelyLevelAPI.from_robtop_data).ordered_set()
-        )
-
         daily_id = main_data.get(DAILY_ID, DEFAULT_ID)
         weekly_id = main_data.get(WEEKLY_ID, DEFAULT_ID) % WEEKLY_ID_ADD
 
@@ -459,12 +587,6 @@ class Database(Binary):
 
         demon_rated = iter(demon_rated_data.keys()).map(int).ordered_set()
 
-        gauntlet_levels_data = main_data.get(GAUNTLET_LEVELS, {})
-
-        gauntlet_levels = (
-            iter(gauntlet_levels_data.values()).map(GauntletLevelAPI.from_robtop_data).ordered_set()
-        )
-
         def create_folder(string: str, name: str) -> Folder:
             return Folder(int(string), name)
 
@@ -480,37 +602,15 @@ class Database(Binary):
             iter(created_folders_data.items()).map(unpack_binary(create_folder)).ordered_set()
         )
 
-        songs_data = main_data.get(SONGS, {})
-
-        songs = iter(songs_data.values()).map(SongAPI.from_robtop_data).ordered_set()
-
         priority = main_data.get(PRIORITY, DEFAULT_PRIORITY)
 
-        levels_payload = parser.load(levels)
-
-        if is_instance(levels_payload, Dict):
-            levels_data: StringMapping[Any] = levels_payload
-
-        else:
-            raise ValueError(EXPECTED_STRING_DICT)
-
-        created_levels_data = levels_data.get(CREATED_LEVELS, {})
-        binary_version_data = levels_data.get(BINARY_VERSION_LEVELS)
-
-        if binary_version_data is None:
-            binary_version = CURRENT_BINARY_VERSION
+        if lazy:
+            sections: StringDict[Any] = {}
 
         else:
-            binary_version = RobTopVersion.from_value(binary_version_data)
+            sections = load_sections(main_data, load_string_dict(levels))
 
-        created_levels = (
-            iter(created_levels_data.values())
-            .skip_while(is_true)
-            .map(CreatedLevelAPI.from_robtop_data)
-            .ordered_set()
-        )
-
-        return cls(
+        database = cls(
             volume=volume,
             sfx_volume=sfx_volume,
             uuid=uuid,
@@ -548,34 +648,172 @@ class Database(Binary):
             resolution=resolution,
             quality=quality,
             achievements=achievements,
-            values=values,
-            unlock_values=unlock_values,
-            custom_objects=custom_objects,
-            storage=storage,
-            completed=completed,
-            statistics=statistics,
-            official_levels=official_levels,
-            saved_levels=saved_levels,
             followed=followed,
             last_played=last_played,
             # filters=filters,  # TODO
-            timely_levels=timely_levels,
             daily_id=daily_id,
             weekly_id=weekly_id,
             liked=liked,
             rated=rated,
             reported=reported,
             demon_rated=demon_rated,
-            gauntlet_levels=gauntlet_levels,
             saved_folders=saved_folders,
             created_folders=created_folders,
-            songs=songs,
             priority=priority,
-            created_levels=created_levels,
-            binary_version=binary_version,
             # keybindings=keybindings,
+            **sections,
+        )
+
+        if lazy:
+            database.defer_sections(main_data, levels)
+
+        return database
+
+    def defer_sections(self, main_data: StringDict[Any], levels: bytes) -> None:
+        self.lazy_main_data = main_data
+        self.lazy_levels = levels
+
+        for name in LAZY_NAMES:
+            delattr(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when the attribute is missing, that is, when the section is deferred
+        if name in MAIN_SECTIONS:
+            value = MAIN_SECTIONS[name](self.get_lazy_main_data())
+
+        elif name in LEVEL_SECTIONS:
+            key, level_type = LEVEL_SECTIONS[name]
+
+            value = levels_from_data(
+                self.get_lazy_main_data().get(key, {}),
+                level_type,
+                self.materialized_levels.pop(name, None),
+            )
+
+        elif name in LEVELS_SECTIONS:
+            value = LEVELS_SECTIONS[name](
+                self.get_lazy_levels_data(), self.materialized_levels.pop(name, None)
+            )
+
+        else:
+            raise AttributeError(NO_ATTRIBUTE.format(get_type_name(self), name))
+
+        setattr(self, name, value)
+
+        self.release_section(name)
+
+        return value
+
+    def release_section(self, name: str) -> None:
+        """Drops the raw data of the section named `name`, which has just been loaded.
+
+        Once no sections are deferred, all the raw data is dropped.
+        """
+        if all(map(self.is_loaded, LAZY_NAMES)):
+            self.lazy_main_data = None
+            self.lazy_levels = None
+            self.lazy_levels_data = None
+
+            self.materialized_levels.clear()
+
+            return
+
+        main_data = self.lazy_main_data
+
+        if main_data is not None and name in MAIN_SECTION_KEYS:
+            main_data.pop(MAIN_SECTION_KEYS[name], None)
+
+        levels_data = self.lazy_levels_data
+
+        if levels_data is not None and name in LEVELS_SECTION_KEYS:
+            levels_data.pop(LEVELS_SECTION_KEYS[name], None)
+
+    def is_loaded(self, name: str) -> bool:
+        """Checks whether the section named `name` is loaded, without loading it."""
+        try:
+            object.__getattribute__(self, name)
+
+        except AttributeError:
+            return False
+
+        return True
+
+    def get_lazy_main_data(self) -> StringDict[Any]:
+        main_data = self.lazy_main_data
+
+        if main_data is None:
+            raise AttributeError(NOT_LAZY)
+
+        return main_data
+
+    def get_lazy_levels_data(self) -> StringDict[Any]:
+        levels_data = self.lazy_levels_data
+
+        if levels_data is None:
+            levels = self.lazy_levels
+
+            if levels is None:
+                raise AttributeError(NOT_LAZY)
+
+            levels_data = self.lazy_levels_data = load_string_dict(levels)
+
+            self.lazy_levels = None
+
+        return levels_data
+
+    def materialize_level(
+        self, name: str, key: str, level_type: Type[L], data: Optional[StringMapping[Any]]
+    ) -> Optional[L]:
+        materialized = self.materialized_levels.setdefault(name, {})
+
+        level = materialized.get(key)
+
+        if level is None and data is not None:
+            level = materialized[key] = level_type.from_robtop_data(data)
+
+        return level
+
+    def get_level_by_id(self, name: str, id: int) -> Optional[Any]:
+        if self.is_loaded(name):
+            return iter(getattr(self, name)).find(lambda level: level.id == id).extract()
+
+        key, level_type = LEVEL_SECTIONS[name]
+
+        string = str(id)
+
+        return self.materialize_level(
+            name, string, level_type, self.get_lazy_main_data().get(key, {}).get(string)
         )
 
+    def get_official_level(self, id: int) -> Optional[OfficialLevelAPI]:
+        """Looks up the official level by its `id`, loading only that level if deferred."""
+        return self.get_level_by_id(OFFICIAL_LEVELS_NAME, id)
+
+    def get_saved_level(self, id: int) -> Optional[SavedLevelAPI]:
+        """Looks up the saved level by its `id`, loading only that level if deferred."""
+        return self.get_level_by_id(SAVED_LEVELS_NAME, id)
+
+    def get_timely_level(self, id: int) -> Optional[TimelyLevelAPI]:
+        """Looks up the timely level by its `id`, loading only that level if deferred."""
+        return self.get_level_by_id(TIMELY_LEVELS_NAME, id)
+
+    def get_gauntlet_level(self, id: int) -> Optional[GauntletLevelAPI]:
+        """Looks up the gauntlet level by its `id`, loading only that level if deferred."""
+        return self.get_level_by_id(GAUNTLET_LEVELS_NAME, id)
+
+    def get_created_level(self, name: str) -> Optional[CreatedLevelAPI]:
+        """Looks up the created level by its `name`, loading only that level if deferred."""
+        if self.is_loaded(CREATED_LEVELS_NAME):
+            return iter(self.created_levels).find(lambda level: level.name == name).extract()
+
+        created_levels_data = self.get_lazy_levels_data().get(CREATED_LEVELS, {})
+
+        for key, data in iter_created_levels_data(created_levels_data):
+            if data.get(LEVEL_NAME, EMPTY) == name:
+                return self.materialize_level(CREATED_LEVELS_NAME, key, CreatedLevelAPI, data)
+
+        return None
+
     def dump_main(self) -> bytes:
         parser = PARSER
 
@@ -751,8 +989,8 @@ class Database(Binary):
         return SaveManager(cls)
 
     @classmethod
-    def load(cls: Type[D]) -> D:
-        return cls.create_save_manager().load()
+    def load(cls: Type[D], lazy: bool = False) -> D:
+        return cls.create_save_manager().load(lazy=lazy)
 
     def dump(self) -> None:
         self.create_save_manager().dump(self)
@@ -1,15 +1,31 @@
+from bisect import bisect_right
 from operator import attrgetter as get_attribute_factory
-from typing import Iterable, Iterator, List, Sequence, Set, Type, TypeVar, Union, overload
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from attrs import define, field
+from attrs import define, field, setters
 from funcs.application import partial
 from iters.iters import iter, wrap_iter
-from typing_aliases import is_slice
+from typing_aliases import Predicate, Unary, is_instance, is_slice
 
+from gd.api.changes import TrackedList, get_changes, record_change
 from gd.api.color_channels import ColorChannels
 from gd.api.header import Header
+from gd.api.id_index import IDIndex
 from gd.api.objects import (
     Object,
+    ObjectCache,
     StartPosition,
     Trigger,
     has_additional_group,
@@ -21,15 +37,28 @@ from gd.api.objects import (
     object_from_robtop,
     object_to_binary,
     object_to_robtop,
+    peek_groups,
 )
+from gd.api.packed import PACKED_VERSION, PackedObjects, write_packed_objects
+from gd.api.selection import Selection
+from gd.api.spatial import SpatialIndex
+from gd.asyncio import run_cpu_bound
 from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
 from gd.binary_utils import Reader, Writer
+from gd.encoding import iter_unzip_level_string
 from gd.enums import ByteOrder, Speed, SpeedChangeType, SpeedMagic
+from gd.memo import LEVEL_DATA_MEMO, LevelDataMemo
 from gd.models_constants import OBJECTS_SEPARATOR
-from gd.models_utils import concat_objects, split_objects
+from gd.models_utils import concat_objects, iter_split_objects, split_objects
 from gd.robtop import RobTop
 
-__all__ = ("Editor", "time_length")
+__all__ = (
+    "Editor",
+    "TimeTable",
+    "iter_objects_to_robtop",
+    "open_level_editor",
+    "time_length",
+)
 
 SPEED_TO_MAGIC = {
     Speed.SLOW: SpeedMagic.SLOW,
@@ -110,6 +139,87 @@ X = "x"
 
 get_x = get_attribute_factory(X)
 
+T = TypeVar("T", bound="TimeTable")
+
+
+@define()
+class TimeTable:
+    """Represents piecewise-linear mappings between `x` positions and time (in seconds).
+
+    The table is built once from the starting speed and speed changes,
+    after which both conversions take `O(log n)` time.
+    """
+
+    xs: List[float] = field(factory=list)
+    times: List[float] = field(factory=list)
+    magics: List[float] = field(factory=list)
+
+    @classmethod
+    def create(
+        cls: Type[T], start_speed: Speed = Speed.NORMAL, speed_changes: Iterable[Object] = ()
+    ) -> T:
+        magic = SPEED_TO_MAGIC[start_speed].value
+
+        last_x = 0.0
+        total = 0.0
+
+        xs = [last_x]
+        times = [total]
+        magics = [magic]
+
+        for speed_change in sorted(speed_changes, key=get_x):
+            x = speed_change.x
+
+            total += (x - last_x) / magic
+
+            magic = SPEED_CHANGE_TO_MAGIC[SpeedChangeType(speed_change.id)].value
+
+            last_x = x
+
+            xs.append(x)
+            times.append(total)
+            magics.append(magic)
+
+        return cls(xs, times, magics)
+
+    def time_at(self, x: float) -> float:
+        """Converts the `x` position to time (in seconds)."""
+        xs = self.xs
+
+        index = max(bisect_right(xs, x) - 1, 0)
+
+        return self.times[index] + (x - xs[index]) / self.magics[index]
+
+    def x_at(self, time: float) -> float:
+        """Converts `time` (in seconds) to the `x` position."""
+        times = self.times
+
+        index = max(bisect_right(times, time) - 1, 0)
+
+        return self.xs[index] + (time - times[index]) * self.magics[index]
+
+    def times_at(self, xs: Iterable[float]) -> List[float]:
+        """Converts the `xs` positions to times (in seconds)."""
+        return list(map(self.time_at, xs))
+
+    def xs_at(self, times: Iterable[float]) -> List[float]:
+        """Converts `times` (in seconds) to `x` positions."""
+        return list(map(self.x_at, times))
+
+
+def tracked_list(objects: Iterable[Object]) -> TrackedList[Object]:
+    if is_instance(objects, TrackedList):
+        return objects
+
+    return TrackedList(objects)
+
+
+def change_objects(editor: Any, attribute: Any, objects: Any) -> Any:
+    record_change()
+
+    return objects
+
+
 E = TypeVar("E", bound="Editor")
 
 
@@ -118,6 +228,18 @@ class Editor(Sequence[Object], RobTop, Binary):
     """Represents editors.
 
     Binary:
+        Since version 2, objects are stored in the packed format
+        (see [`PackedObjects`][gd.api.packed.PackedObjects]):
+
+        ```rust
+        struct Editor {
+            header: Header,
+            objects: PackedObjects,
+        }
+        ```
+
+        Before that, objects were stored one after another:
+
         ```rust
         struct Editor {
             header: Header,
@@ -129,9 +251,38 @@ class Editor(Sequence[Object], RobTop, Binary):
 
     header: Header = field(factory=Header)
     """The header of the editor."""
-    objects: List[Object] = field(factory=list)
+    objects: List[Object] = field(
+        factory=TrackedList,
+        converter=tracked_list,
+        on_setattr=setters.pipe(setters.convert, change_objects),
+    )
     """The objects of the editor."""
 
+    spatial_index_option: Optional[SpatialIndex] = field(
+        default=None, init=False, repr=False, eq=False
+    )
+    group_index_option: Optional[IDIndex] = field(default=None, init=False, repr=False, eq=False)
+    color_index_option: Optional[IDIndex] = field(default=None, init=False, repr=False, eq=False)
+
+    reserved_groups: Set[int] = field(factory=set, init=False, repr=False, eq=False)
+    """The groups reserved via [`allocate_group`][gd.api.editor.Editor.allocate_group]."""
+    reserved_color_ids: Set[int] = field(factory=set, init=False, repr=False, eq=False)
+    """The color IDs reserved via [`allocate_color_id`][gd.api.editor.Editor.allocate_color_id]."""
+
+    indexes_stamp: int = field(default=0, init=False, repr=False, eq=False)
+    """The stamp of the latest change the indexes are up to date with
+    (see [`get_changes`][gd.api.changes.get_changes]).
+    """
+
+    cached: bool = field(default=False, eq=False)
+    """Whether to cache serialized objects, only re-encoding objects changed since."""
+
+    cache: ObjectCache = field(factory=ObjectCache, init=False, repr=False, eq=False)
+    """The cache of serialized objects, used if [`cached`][gd.api.editor.Editor.cached] is true.
+
+    The cache is kept here, keyed by object identity, rather than on the objects themselves.
+    """
+
     @classmethod
     def from_objects(cls: Type[E], *objects: Object, header: Header) -> E:
         return cls(header, list(objects))
@@ -157,6 +308,193 @@ class Editor(Sequence[Object], RobTop, Binary):
 
         return self.objects[index]  # type: ignore
 
+    def check_indexes(self) -> None:
+        """Drops the indexes if anything has changed since they were last brought up to date.
+
+        Changes are tracked globally (see [`record_change`][gd.api.changes.record_change]),
+        so changing any object (or its groups and HSVs), as well as the list of objects,
+        invalidates the indexes, unless the change is made via the editor methods
+        that keep the indexes up to date.
+        """
+        changes = get_changes()
+
+        if self.indexes_stamp != changes:
+            self.drop_indexes()
+
+            self.indexes_stamp = changes
+
+    def sync_indexes(self) -> None:
+        """Marks the indexes as up to date with the changes made so far.
+
+        This is called by the editor methods after updating the indexes themselves.
+        """
+        self.indexes_stamp = get_changes()
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """The spatial index over the objects, built on first access.
+
+        The index is rebuilt after objects are changed, except when objects are added,
+        removed and moved via the editor (and selection) methods, which keep it up to date.
+        """
+        index = self.valid_spatial_index
+
+        if index is None:
+            index = self.spatial_index_option = SpatialIndex.from_object_iterable(self.objects)
+
+        return index
+
+    @property
+    def valid_spatial_index(self) -> Optional[SpatialIndex]:
+        """The spatial index, if it is built and up to date."""
+        self.check_indexes()
+
+        return self.spatial_index_option
+
+    @property
+    def group_index(self) -> IDIndex:
+        """The index mapping group IDs to objects, built on first access.
+
+        The index is rebuilt after objects are changed, except when objects are added
+        and removed via the editor methods, which keep it up to date.
+        """
+        index = self.valid_group_index
+
+        if index is None:
+            index = self.group_index_option = create_id_index(
+                self.objects, iter_object_groups, self.reserved_groups
+            )
+
+        return index
+
+    @property
+    def valid_group_index(self) -> Optional[IDIndex]:
+        """The group index, if it is built and up to date."""
+        self.check_indexes()
+
+        return self.group_index_option
+
+    @property
+    def color_index(self) -> IDIndex:
+        """The index mapping color IDs to objects, built on first access.
+
+        The index is rebuilt after objects are changed, except when objects are added
+        and removed (and recolored via selections) via the editor methods,
+        which keep it up to date.
+        """
+        index = self.valid_color_index
+
+        if index is None:
+            index = self.color_index_option = create_id_index(
+                self.objects, iter_object_color_ids, self.reserved_color_ids
+            )
+
+        return index
+
+    @property
+    def valid_color_index(self) -> Optional[IDIndex]:
+        """The color ID index, if it is built and up to date."""
+        self.check_indexes()
+
+        return self.color_index_option
+
+    def drop_indexes(self: E) -> E:
+        """Drops all indexes; they are going to be rebuilt on next access."""
+        self.spatial_index_option = None
+        self.group_index_option = None
+        self.color_index_option = None
+
+        return self
+
+    def add_objects(self: E, *objects: Object) -> E:
+        self.check_indexes()
+
+        self.objects.extend(objects)
+
+        spatial_index = self.spatial_index_option
+
+        if spatial_index is not None:
+            spatial_index.add_objects(objects)
+
+        group_index = self.group_index_option
+        color_index = self.color_index_option
+
+        for object in objects:
+            if group_index is not None:
+                group_index.add(object, iter_object_groups(object))
+
+            if color_index is not None:
+                color_index.add(object, iter_object_color_ids(object))
+
+        self.sync_indexes()
+
+        return self
+
+    def remove_objects(self: E, *objects: Object) -> E:
+        """Removes the `objects` (compared by identity) from the editor."""
+        self.check_indexes()
+
+        spatial_index = self.spatial_index_option
+
+        if spatial_index is not None:
+            spatial_index.remove_objects(objects)
+
+        group_index = self.group_index_option
+        color_index = self.color_index_option
+
+        for object in objects:
+            if group_index is not None:
+                group_index.remove(object, iter_object_groups(object))
+
+            if color_index is not None:
+                color_index.remove(object, iter_object_color_ids(object))
+
+        identities = {id(object) for object in objects}
+
+        self.objects = [object for object in self.objects if id(object) not in identities]
+
+        self.sync_indexes()
+
+        return self
+
+    def objects_between(self, x_start: float, x_end: float) -> List[Object]:
+        return self.spatial_index.between(x_start, x_end)
+
+    def objects_in_rectangle(
+        self, x_start: float, y_start: float, x_end: float, y_end: float
+    ) -> List[Object]:
+        return self.spatial_index.in_rectangle(x_start, y_start, x_end, y_end)
+
+    def nearest_objects(self, x: float, y: float, count: int = 1) -> List[Object]:
+        return self.spatial_index.nearest(x, y, count)
+
+    @wrap_iter
+    def iter_sorted_by_x(self) -> Iterator[Object]:
+        """Iterates over the objects sorted by `x`, using the
+        [`spatial_index`][gd.api.editor.Editor.spatial_index].
+        """
+        return iter(self.spatial_index.ordered).unwrap()
+
+    def select(self, predicate: Predicate[Object]) -> Selection:
+        return Selection(self, [object for object in self.objects if predicate(object)])
+
+    def select_all(self) -> Selection:
+        return Selection(self, list(self.objects))
+
+    def select_group(self, group_id: int) -> Selection:
+        return Selection(self, self.objects_in_group(group_id))
+
+    def select_ids(self, ids: Iterable[int]) -> Selection:
+        """Selects the objects with their IDs in `ids`."""
+        ids = set(ids)
+
+        return self.select(lambda object: object.id in ids)
+
+    def select_region(
+        self, x_start: float, y_start: float, x_end: float, y_end: float
+    ) -> Selection:
+        return Selection(self, self.objects_in_rectangle(x_start, y_start, x_end, y_end))
+
     @property
     def color_channels(self) -> ColorChannels:
         return self.header.color_channels
@@ -174,13 +512,7 @@ class Editor(Sequence[Object], RobTop, Binary):
     @wrap_iter
     def iter_groups(self) -> Iterator[int]:
         for object in self.objects:
-            yield from object.groups
-
-            if has_target_group(object):
-                yield object.target_group_id
-
-            if has_additional_group(object):
-                yield object.additional_group_id
+            yield from iter_object_groups(object)
 
     @property
     def groups(self) -> Set[int]:
@@ -188,13 +520,33 @@ class Editor(Sequence[Object], RobTop, Binary):
 
     @property
     def free_group(self) -> int:
-        return find_next(self.groups)
+        """The next free group according to the
+        [`group_index`][gd.api.editor.Editor.group_index], excluding reserved groups.
+        """
+        return self.group_index.next_free()
+
+    def allocate_group(self) -> int:
+        """Finds the [`free_group`][gd.api.editor.Editor.free_group] and reserves it,
+        so that it is not returned again.
+
+        Reservations are kept by the editor, so they outlive rebuilding the index.
+        """
+        group_id = self.group_index.allocate()
+
+        self.reserved_groups.add(group_id)
+
+        return group_id
+
+    def objects_in_group(self, group_id: int) -> List[Object]:
+        """Returns the objects in the group with `group_id`, using the
+        [`group_index`][gd.api.editor.Editor.group_index].
+        """
+        return self.group_index.get(group_id)
 
     @wrap_iter
     def iter_color_ids(self) -> Iterator[int]:
         for object in self.objects:
-            yield object.base_color_id
-            yield object.detail_color_id
+            yield from iter_object_color_ids(object)
 
         yield from self.color_channels
 
@@ -204,7 +556,29 @@ class Editor(Sequence[Object], RobTop, Binary):
 
     @property
     def free_color_id(self) -> int:
-        return find_next(self.color_ids)
+        """The next free color ID according to the
+        [`color_index`][gd.api.editor.Editor.color_index] and the color channels,
+        excluding reserved color IDs.
+        """
+        return self.color_index.next_free(self.color_channels)
+
+    def allocate_color_id(self) -> int:
+        """Finds the [`free_color_id`][gd.api.editor.Editor.free_color_id] and reserves it,
+        so that it is not returned again.
+
+        Reservations are kept by the editor, so they outlive rebuilding the index.
+        """
+        color_id = self.color_index.allocate(self.color_channels)
+
+        self.reserved_color_ids.add(color_id)
+
+        return color_id
+
+    def objects_with_color_id(self, color_id: int) -> List[Object]:
+        """Returns the objects using the color ID `color_id`, using the
+        [`color_index`][gd.api.editor.Editor.color_index].
+        """
+        return self.color_index.get(color_id)
 
     @wrap_iter
     def iter_start_positions(self) -> Iterator[StartPosition]:
@@ -250,6 +624,9 @@ class Editor(Sequence[Object], RobTop, Binary):
     def length(self) -> float:
         return time_length(self.x_length, self.start_speed, self.speed_changes)
 
+    def create_time_table(self) -> TimeTable:
+        return TimeTable.create(self.start_speed, self.speed_changes)
+
     @classmethod
     def from_binary(
         cls: Type[E],
@@ -259,6 +636,9 @@ class Editor(Sequence[Object], RobTop, Binary):
     ) -> E:
         header = Header.from_binary(binary, order, version)
 
+        if version >= PACKED_VERSION:
+            return cls(header, PackedObjects.from_binary(binary, order).objects())
+
         reader = Reader(binary, order)
 
         iterable_length = reader.read_u32()
@@ -274,17 +654,35 @@ class Editor(Sequence[Object], RobTop, Binary):
     ) -> None:
         self.header.to_binary(binary, order, version)
 
-        writer = Writer(binary, order)
-
         objects = self.objects
 
-        writer.write_u32(len(objects))
+        cache = self.cache if self.cached else None
 
-        for object in objects:
-            object_to_binary(object, binary, order, version)
+        if version >= PACKED_VERSION:
+            write_packed_objects(objects, binary, order, cache)
+
+        else:
+            writer = Writer(binary, order)
+
+            writer.write_u32(len(objects))
+
+            convert = object_to_binary if cache is None else cache.object_to_binary
+
+            for object in objects:
+                convert(object, binary, order, version)
+
+        if cache is not None:
+            cache.prune(objects)
 
     @classmethod
-    def from_robtop(cls: Type[E], string: str) -> E:
+    def from_robtop(cls: Type[E], string: str, cached: bool = False) -> E:
+        """Decodes the editor from the level `string`.
+
+        If `cached` is true, the returned editor is [`cached`][gd.api.editor.Editor.cached],
+        and its cache is populated with the decoded strings, so that even the first
+        [`to_robtop`][gd.api.editor.Editor.to_robtop] call only encodes objects changed since.
+        Note that unchanged objects are then encoded exactly as they were given.
+        """
         iterator = iter(split_objects(string)).filter(None)
 
         header_option = iterator.next().extract()
@@ -295,21 +693,153 @@ class Editor(Sequence[Object], RobTop, Binary):
         else:
             header = Header.from_robtop(header_option)
 
-        objects = iterator.map(object_from_robtop).collect_iter(migrate_objects).list()
+        if not cached:
+            objects = iterator.map(object_from_robtop).collect_iter(migrate_objects).list()
+
+            return cls(header, objects)
+
+        cache = ObjectCache()
 
-        return cls(header, objects)
+        def decode_object(string: str) -> Object:
+            object = object_from_robtop(string)
+
+            cache.store_robtop(object, string)
+
+            return object
+
+        objects = iterator.map(decode_object).collect_iter(migrate_objects).list()
+
+        editor = cls(header, objects, cached=True)
+
+        editor.cache = cache
+
+        return editor
 
     def to_robtop(self) -> str:
-        return (
-            iter(self.objects)
-            .map(object_to_robtop)
+        if not self.cached:
+            return (
+                iter(self.objects)
+                .map(object_to_robtop)
+                .prepend(self.header.to_robtop())
+                .collect(concat_objects)
+            )
+
+        cache = self.cache
+        objects = self.objects
+
+        string = (
+            iter(objects)
+            .map(cache.object_to_robtop)
             .prepend(self.header.to_robtop())
             .collect(concat_objects)
         )
 
+        cache.prune(objects)
+
+        return string
+
+    @classmethod
+    async def from_robtop_async(cls: Type[E], string: str) -> E:
+        """Same as [`from_robtop`][gd.api.editor.Editor.from_robtop],
+        except decoding is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        return await run_cpu_bound(cls.from_robtop, string)
+
+    async def to_robtop_async(self) -> str:
+        """Same as [`to_robtop`][gd.api.editor.Editor.to_robtop],
+        except encoding is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        return await run_cpu_bound(self.to_robtop)
+
+    @classmethod
+    @wrap_iter
+    def iter_robtop(cls, string: str) -> Iterator[Object]:
+        """Lazily decodes objects from the level `string`, which can be compressed.
+
+        Only one object is kept in memory at a time; the header is skipped.
+        """
+        if cls.can_be_in(string):
+            chunks: Iterable[str] = (string,)
+
+        else:
+            chunks = iter_unzip_level_string(string)
+
+        iterator = iter(iter_split_objects(chunks))
+
+        iterator.next()  # skip the header
+
+        return migrate_objects(iterator.map(object_from_robtop).unwrap())
+
+    @wrap_iter
+    def iter_to_robtop(self) -> Iterator[str]:
+        """Lazily encodes the editor, yielding the chunks of the
+        [`to_robtop`][gd.api.editor.Editor.to_robtop] string.
+        """
+        return iter_objects_to_robtop(self.header, self.objects)
+
     @staticmethod
     def can_be_in(string: str) -> bool:
         return OBJECTS_SEPARATOR in string
 
 
+def iter_object_groups(object: Object) -> Iterator[int]:
+    yield from peek_groups(object)
+
+    if has_target_group(object):
+        yield object.target_group_id
+
+    if has_additional_group(object):
+        yield object.additional_group_id
+
+
+def iter_object_color_ids(object: Object) -> Iterator[int]:
+    yield object.base_color_id
+    yield object.detail_color_id
+
+
+def create_id_index(
+    objects: Iterable[Object], iter_ids: Unary[Object, Iterable[int]], reserved: Iterable[int] = ()
+) -> IDIndex:
+    index = IDIndex()
+
+    for object in objects:
+        index.add(object, iter_ids(object))
+
+    for id in reserved:
+        index.reserve(id)
+
+    return index
+
+
+def iter_objects_to_robtop(header: Header, objects: Iterable[Object]) -> Iterator[str]:
+    """Lazily encodes the `header` and the `objects`, one object at a time."""
+    yield header.to_robtop()
+
+    for object in objects:
+        yield OBJECTS_SEPARATOR
+
+        yield object_to_robtop(object)
+
+
+def open_level_editor(unprocessed_data: str, memo: LevelDataMemo = LEVEL_DATA_MEMO) -> Editor:
+    """Parses the editor from the compressed level data, going through the `memo`.
+
+    If the `memo` memoizes editors, the editor is decoded from the memoized binary data,
+    which is faster than parsing it again.
+    """
+    if not unprocessed_data or not memo.memoize_editors:
+        return Editor.from_robtop(memo.unzip(unprocessed_data))
+
+    editor_data = memo.get_editor_data(unprocessed_data)
+
+    if editor_data is not None:
+        return Editor.from_bytes(editor_data)
+
+    editor = Editor.from_robtop(memo.unzip(unprocessed_data))
+
+    memo.remember_editor_data(unprocessed_data, editor.to_bytes())
+
+    return editor
+
+
 DEFAULT_DATA = Editor().to_bytes()
@@ -20,7 +20,7 @@ from gd.api.color_channels import (
 )
 from gd.api.guidelines import Guidelines
 from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
-from gd.binary_constants import BYTE, HALF_BITS, HALF_BYTE
+from gd.binary_constants import BYTE, F32, HALF_BITS, HALF_BYTE, U8
 from gd.binary_utils import Reader, Writer
 from gd.color import Color
 from gd.constants import DEFAULT_ID, DEFAULT_ROUNDING
@@ -75,6 +75,8 @@ SONG_FADE_IN_BIT = 0b00010000
 SONG_FADE_OUT_BIT = 0b00100000
 PLATFORMER_MODE_BIT = 0b01000000
 
+HEADER_START = U8 + U8 + U8 + U8 + U8 + U8 + F32  # IDs, speed and game mode, bits, offset
+
 H = TypeVar("H", bound="Header")
 
 
@@ -172,12 +174,15 @@ class Header(Binary, RobTop):
 
         reader = Reader(binary, order)
 
-        background_id = reader.read_u8()
-        ground_id = reader.read_u8()
-        ground_line_id = reader.read_u8()
-        font_id = reader.read_u8()
-
-        value = reader.read_u8()
+        (
+            background_id,
+            ground_id,
+            ground_line_id,
+            font_id,
+            value,
+            flags,
+            song_offset,
+        ) = reader.unpack_record(HEADER_START)
 
         speed = Speed(value & HALF_BYTE)
 
@@ -185,7 +190,7 @@ class Header(Binary, RobTop):
 
         game_mode = GameMode(value)
 
-        value = reader.read_u8()
+        value = flags
 
         mini_mode = value & mini_mode_bit == mini_mode_bit
         dual_mode = value & dual_mode_bit == dual_mode_bit
@@ -195,7 +200,7 @@ class Header(Binary, RobTop):
         song_fade_out = value & song_fade_out_bit == song_fade_out_bit
         platformer_mode = value & platformer_mode_bit == platformer_mode_bit
 
-        song_offset = round(reader.read_f32(), rounding)
+        song_offset = round(song_offset, rounding)
 
         guidelines = Guidelines.from_binary(binary, order, version)
 
@@ -228,16 +233,9 @@ class Header(Binary, RobTop):
     ) -> None:
         writer = Writer(binary, order)
 
-        writer.write_u8(self.background_id)
-        writer.write_u8(self.ground_id)
-        writer.write_u8(self.ground_line_id)
-        writer.write_u8(self.font_id)
-
-        value = self.speed.value
+        speed_and_game_mode = self.speed.value
 
-        value |= self.game_mode.value << HALF_BITS
-
-        writer.write_u8(value)
+        speed_and_game_mode |= self.game_mode.value << HALF_BITS
 
         value = 0
 
@@ -262,9 +260,16 @@ class Header(Binary, RobTop):
         if self.is_platformer_mode():
             value |= PLATFORMER_MODE_BIT
 
-        writer.write_u8(value)
-
-        writer.write_f32(self.song_offset)
+        writer.pack_record(
+            HEADER_START,
+            self.background_id,
+            self.ground_id,
+            self.ground_line_id,
+            self.font_id,
+            speed_and_game_mode,
+            value,
+            self.song_offset,
+        )
 
         self.guidelines.to_binary(binary, order, version)
 
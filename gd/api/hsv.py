@@ -1,8 +1,9 @@
-from typing import Type, TypeVar
+from typing import Any, Optional, Tuple, Type, TypeVar
 
 from attrs import define, field
 from typing_aliases import Unary
 
+from gd.api.changes import Owner, change_tracked
 from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
 from gd.binary_constants import BITS, BYTE
 from gd.binary_utils import Reader, Writer
@@ -11,7 +12,7 @@ from gd.models_constants import HSV_SEPARATOR
 from gd.models_utils import bool_str, concat_hsv, float_str, int_bool, round_float, split_hsv
 from gd.robtop import RobTop
 
-__all__ = ("HSV",)
+__all__ = ("HSV", "DEFAULT_HSV", "intern_hsv", "hsv_from_robtop_interned")
 
 S_MIN = 0.0
 V_MIN = 0.0
@@ -77,16 +78,50 @@ V_MULTIPLY = 100
 
 ROUNDING = 2
 
+HSVTuple = Tuple[int, float, float, bool, bool]
+
 T = TypeVar("T", bound="HSV")
 
+DEFAULT_HSV_IS_READ_ONLY = "`DEFAULT_HSV` is shared and read-only; assign a copy instead"
+
+
+def before_change(hsv: "HSV", attribute: Any, value: Any) -> Any:
+    if hsv is DEFAULT_HSV:
+        raise ValueError(DEFAULT_HSV_IS_READ_ONLY)
+
+    change_tracked(hsv)
+
+    return value
+
 
 @define()
 class HSV(Binary, RobTop):
-    h: int = field(default=H_INITIAL)
-    s: float = field(default=S_INITIAL)
-    v: float = field(default=V_INITIAL)
-    s_checked: bool = field(default=S_CHECKED)
-    v_checked: bool = field(default=V_CHECKED)
+    """Represents HSV adjustments.
+
+    Objects share [`DEFAULT_HSV`][gd.api.hsv.DEFAULT_HSV] by default; reading it through
+    objects returns its copy, which the object starts using once it is changed.
+    """
+
+    h: int = field(default=H_INITIAL, on_setattr=before_change)
+    s: float = field(default=S_INITIAL, on_setattr=before_change)
+    v: float = field(default=V_INITIAL, on_setattr=before_change)
+    s_checked: bool = field(default=S_CHECKED, on_setattr=before_change)
+    v_checked: bool = field(default=V_CHECKED, on_setattr=before_change)
+
+    owner: Optional[Owner] = field(default=None, init=False, repr=False, eq=False)
+    stamp: int = field(default=0, init=False, repr=False, eq=False)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        if self.owner is not None or self is DEFAULT_HSV:  # unchanged copies of the default
+            return (get_default_hsv, ())
+
+        return (type(self), self.to_tuple())
+
+    def copy(self: T) -> T:
+        return type(self)(self.h, self.s, self.v, self.s_checked, self.v_checked)
+
+    def to_tuple(self) -> HSVTuple:
+        return (self.h, self.s, self.v, self.s_checked, self.v_checked)
 
     def is_default(self) -> bool:
         return (
@@ -207,3 +242,28 @@ class HSV(Binary, RobTop):
         writer = Writer(binary, order)
 
         writer.write_u32(self.to_value())
+
+
+DEFAULT_HSV = HSV()
+DEFAULT_HSV_STRING = DEFAULT_HSV.to_robtop()
+
+
+def get_default_hsv() -> HSV:
+    return DEFAULT_HSV
+
+
+def intern_hsv(hsv: HSV) -> HSV:
+    """Returns [`DEFAULT_HSV`][gd.api.hsv.DEFAULT_HSV] if the `hsv` is equal to it,
+    and the `hsv` itself otherwise.
+    """
+    return DEFAULT_HSV if hsv.is_default() else hsv
+
+
+def hsv_from_robtop_interned(string: str) -> HSV:
+    """Parses the HSV from the `string`, returning [`DEFAULT_HSV`][gd.api.hsv.DEFAULT_HSV]
+    instead of its copies.
+    """
+    if string == DEFAULT_HSV_STRING:
+        return DEFAULT_HSV
+
+    return intern_hsv(HSV.from_robtop(string))
@@ -0,0 +1,130 @@
+from heapq import heappop, heappush
+from typing import Container, Dict, Iterable, List, Set
+
+from attrs import define, field
+
+from gd.api.objects import Object
+
+__all__ = ("IDIndex",)
+
+DEFAULT_START = 1
+
+
+@define()
+class IDIndex:
+    """Represents indexes mapping IDs (groups or color IDs, for instance) to objects using them.
+
+    Free IDs are found in amortized `O(1)` time: every ID below the `cursor` is known
+    to be used, except for the ones that were freed since, which are kept in the heap.
+
+    Objects are tracked by identity; therefore, objects need to be removed before
+    their IDs are changed, and then added back.
+    """
+
+    start: int = field(default=DEFAULT_START)
+
+    objects: Dict[int, List[Object]] = field(factory=dict, init=False, repr=False)
+    reserved: Set[int] = field(factory=set, init=False, repr=False)
+
+    count: int = field(default=0, init=False)
+
+    cursor: int = field(init=False, repr=False)
+    freed: List[int] = field(factory=list, init=False, repr=False)
+
+    @cursor.default
+    def default_cursor(self) -> int:
+        return self.start
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.objects or id in self.reserved
+
+    def ids(self) -> Set[int]:
+        return self.reserved.union(self.objects)
+
+    def get(self, id: int) -> List[Object]:
+        """Returns the objects using the given `id`."""
+        return list(self.objects.get(id, ()))
+
+    def add(self, object: Object, ids: Iterable[int]) -> None:
+        objects = self.objects
+
+        for id in set(ids):
+            objects.setdefault(id, []).append(object)
+
+        self.count += 1
+
+    def remove(self, object: Object, ids: Iterable[int]) -> None:
+        objects = self.objects
+
+        for id in set(ids):
+            bucket = objects.get(id)
+
+            if bucket is None:
+                continue
+
+            for position, item in enumerate(bucket):
+                if item is object:
+                    del bucket[position]
+
+                    break
+
+            if not bucket:
+                del objects[id]
+
+                self.release(id)
+
+        self.count -= 1
+
+    def reserve(self, id: int) -> None:
+        self.reserved.add(id)
+
+    def unreserve(self, id: int) -> None:
+        self.reserved.discard(id)
+
+        if id not in self.objects:
+            self.release(id)
+
+    def release(self, id: int) -> None:
+        if self.start <= id < self.cursor:
+            heappush(self.freed, id)
+
+    def next_free(self, exclude: Container[int] = ()) -> int:
+        """Returns the smallest ID that is not used, and is not in `exclude`."""
+        freed = self.freed
+
+        while freed and freed[0] in self:
+            heappop(freed)  # used again since it was freed
+
+        cursor = self.cursor
+
+        while cursor in self:
+            cursor += 1
+
+        self.cursor = cursor
+
+        if freed:
+            candidate = freed[0]
+
+            if candidate not in exclude:
+                return candidate
+
+            # slow path: look through freed IDs first, then past the cursor
+            for candidate in sorted(freed):
+                if candidate not in exclude and candidate not in self:
+                    return candidate
+
+        while cursor in self or cursor in exclude:
+            cursor += 1
+
+        return cursor
+
+    def allocate(self, exclude: Container[int] = ()) -> int:
+        """Finds the next free ID and reserves it."""
+        id = self.next_free(exclude)
+
+        self.reserve(id)
+
+        return id
@@ -1,12 +1,15 @@
-from typing import Any, ClassVar, Optional, Type, TypeVar
+from typing import Any, ClassVar, Iterator, Optional, Type, TypeVar, Union
 
 from attrs import define, field
+from iters.iters import wrap_iter
 from pendulum import Duration, duration
-from typing_aliases import StringDict, StringMapping
+from typing_aliases import StringDict, StringMapping, is_instance
 
-from gd.api.editor import Editor
+from gd.api.editor import Editor, open_level_editor
+from gd.api.objects import Object
 from gd.api.recording import Recording
 from gd.api.songs import SongReferenceAPI
+from gd.asyncio import run_cpu_bound
 from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
 from gd.binary_utils import Reader, Writer
 from gd.capacity import Capacity
@@ -58,7 +61,6 @@ from gd.encoding import (
     decompress,
     encode_base64_string_url_safe,
     generate_leaderboard_seed,
-    unzip_level_string,
     zip_level_string,
 )
 from gd.enums import (
@@ -71,6 +73,7 @@ from gd.enums import (
     RateType,
     TimelyType,
 )
+from gd.memo import LEVEL_DATA_MEMO, unzip_level_data
 from gd.models_constants import OBJECTS_SEPARATOR
 from gd.password import Password
 from gd.progress import Progress
@@ -613,13 +616,79 @@ LOW_DETAIL_TOGGLED_BIT = 0b00001000
 DEFAULT_LENGTH_VALUE = LevelLength.DEFAULT.value
 
 
+@define(eq=False)
+class BinaryLevelData:
+    """Represents level data loaded from binary, along with its binary version.
+
+    The data is converted to the compressed level string on first access.
+    """
+
+    data: bytes
+    version: int = VERSION
+
+    unprocessed_data_option: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __eq__(self, other: Any) -> bool:
+        if not is_instance(other, BinaryLevelData):
+            return NotImplemented
+
+        return self.version == other.version and self.data == other.data
+
+    @property
+    def unprocessed_data(self) -> str:
+        unprocessed_data = self.unprocessed_data_option
+
+        if unprocessed_data is None:
+            processed_data = processed_data_from_binary(self.data, self.version)
+
+            unprocessed_data = self.unprocessed_data_option = zip_level_string(processed_data)
+
+            LEVEL_DATA_MEMO.remember(unprocessed_data, processed_data)
+
+        return unprocessed_data
+
+
+LevelData = Union[str, BinaryLevelData]
+
+
+def unprocessed_data_of(level_data: LevelData) -> str:
+    if is_instance(level_data, BinaryLevelData):
+        return level_data.unprocessed_data
+
+    return level_data
+
+
+@define(eq=False)
+class LevelDataComparer:
+    """Compares level data, comparing binary data as-is if possible,
+    so that it is not converted needlessly.
+    """
+
+    level_data: LevelData
+
+    def __eq__(self, other: Any) -> bool:
+        if not is_instance(other, LevelDataComparer):
+            return NotImplemented
+
+        level_data = self.level_data
+        other_level_data = other.level_data
+
+        if level_data == other_level_data:
+            return True
+
+        return unprocessed_data_of(level_data) == unprocessed_data_of(other_level_data)
+
+
 C = TypeVar("C", bound="CustomLevelAPI")
 
 
 @define()
 class CustomLevelAPI(BaseLevelAPI):
     description: str = field(default=EMPTY)
-    unprocessed_data: str = field(default=EMPTY, repr=False)
+    level_data: LevelData = field(
+        default=EMPTY, repr=False, eq=LevelDataComparer, alias=UNPROCESSED_DATA
+    )
+    """The level data; either compressed level string or binary data pending conversion."""
     length: LevelLength = field(default=LevelLength.DEFAULT)
     password_data: Password = field(factory=Password)
     original_id: int = field(default=DEFAULT_ID)
@@ -637,6 +706,9 @@ class CustomLevelAPI(BaseLevelAPI):
     def __hash__(self) -> int:
         return hash(type(self)) ^ self.id
 
+    def is_data_pending(self) -> bool:
+        return is_instance(self.level_data, BinaryLevelData)
+
     @classmethod
     def from_binary(
         cls: Type[C],
@@ -663,7 +735,7 @@ class CustomLevelAPI(BaseLevelAPI):
 
         data_length = reader.read_u32()
 
-        data = decompress(reader.read(data_length))
+        data = reader.read(data_length)
 
         length_value = reader.read_u8()
 
@@ -698,7 +770,8 @@ class CustomLevelAPI(BaseLevelAPI):
 
         level.description = description
 
-        level.data = data
+        # level data is encoded using the same binary version; it is converted on first access
+        level.level_data = BinaryLevelData(data, version)
 
         level.length = length
 
@@ -744,7 +817,18 @@ class CustomLevelAPI(BaseLevelAPI):
 
         writer.write(data)
 
-        data = compress(self.data)
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData) and level_data.version == version:
+            data = level_data.data
+
+        else:
+            # level data is encoded using the same binary version
+            if version == VERSION:
+                data = compress(self.data)
+
+            else:
+                data = compress(self.open_editor().to_bytes(version=version))
 
         writer.write_u32(len(data))
 
@@ -786,18 +870,47 @@ class CustomLevelAPI(BaseLevelAPI):
 
         writer.write_u8(self.folder_id)
 
+    @property
+    def unprocessed_data(self) -> str:
+        """The compressed level data.
+
+        Levels loaded from binary convert their data on first access.
+        """
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData):
+            level_data = self.level_data = level_data.unprocessed_data
+
+        return level_data
+
+    @unprocessed_data.setter
+    def unprocessed_data(self, unprocessed_data: str) -> None:
+        self.level_data = unprocessed_data
+
     @property
     @cache_by(UNPROCESSED_DATA)
     def processed_data(self) -> str:
-        return unzip_level_string(self.unprocessed_data)
+        return LEVEL_DATA_MEMO.unzip(self.unprocessed_data)
 
     @processed_data.setter
     def processed_data(self, processed_data: str) -> None:
-        self.unprocessed_data = zip_level_string(processed_data)
+        unprocessed_data = zip_level_string(processed_data)
+
+        LEVEL_DATA_MEMO.remember(unprocessed_data, processed_data)
+
+        self.unprocessed_data = unprocessed_data
 
     @property
-    @cache_by(UNPROCESSED_DATA)
     def data(self) -> bytes:
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData) and level_data.version == VERSION:
+            return decompress(level_data.data)
+
+        return self.compute_data()
+
+    @cache_by(UNPROCESSED_DATA)
+    def compute_data(self) -> bytes:
         return self.open_editor().to_bytes()
 
     @data.setter
@@ -805,7 +918,45 @@ class CustomLevelAPI(BaseLevelAPI):
         self.processed_data = Editor.from_bytes(data).to_robtop()
 
     def open_editor(self) -> Editor:
-        return Editor.from_robtop(self.processed_data)
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData):
+            return open_binary_editor(level_data.data, level_data.version)
+
+        return open_level_editor(level_data)
+
+    async def processed_data_async(self) -> str:
+        """Same as [`processed_data`][gd.api.levels.CustomLevelAPI.processed_data],
+        except unzipping is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        # the data is passed instead of the level, which does not need to be pickled then
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData):
+            return await run_cpu_bound(
+                processed_data_from_binary, level_data.data, level_data.version
+            )
+
+        return await run_cpu_bound(unzip_level_data, level_data)
+
+    async def set_processed_data_async(self, processed_data: str) -> None:
+        self.unprocessed_data = await run_cpu_bound(zip_level_string, processed_data)
+
+    async def open_editor_async(self) -> Editor:
+        """Same as [`open_editor`][gd.api.levels.CustomLevelAPI.open_editor],
+        except decoding is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        level_data = self.level_data
+
+        if is_instance(level_data, BinaryLevelData):
+            return await run_cpu_bound(open_binary_editor, level_data.data, level_data.version)
+
+        return await run_cpu_bound(open_level_editor, level_data)
+
+    @wrap_iter
+    def iter_objects(self) -> Iterator[Object]:
+        """Lazily decodes the objects of the level, without unzipping the data at once."""
+        return Editor.iter_robtop(self.unprocessed_data).unwrap()
 
     @property
     def password(self) -> Optional[int]:
@@ -937,6 +1088,17 @@ class CustomLevelAPI(BaseLevelAPI):
         return data
 
 
+# module-level functions can be pickled, which process executors require
+
+
+def open_binary_editor(data: bytes, version: int = VERSION) -> Editor:
+    return Editor.from_bytes(decompress(data), version=version)
+
+
+def processed_data_from_binary(data: bytes, version: int = VERSION) -> str:
+    return open_binary_editor(data, version).to_robtop()
+
+
 VERIFIED_BIT = 0b00000001
 UPLOADED_BIT = 0b00000010
 UNLISTED_BIT = 0b00000100
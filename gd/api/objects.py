@@ -1,16 +1,39 @@
 from abc import abstractmethod as required
+from array import array
 from builtins import hasattr as has_attribute
+from builtins import iter as standard_iter
 from enum import Enum, Flag
 from io import BytesIO
-from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type, TypeVar, Union
+from operator import attrgetter as get_attribute_factory
+from sys import byteorder
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from attrs import define, field
+from attrs import define, field, fields
+from attrs.setters import NO_OP
 from iters.iters import iter
-from iters.ordered_set import OrderedSet
+from iters.ordered_set import OrderedSet, item_not_in_ordered_set
 from named import get_type_name
-from typing_aliases import is_instance
+from typing_aliases import Unary, is_instance, is_slice
 from typing_extensions import Literal, Never, Protocol, TypeGuard, runtime_checkable
+from wraps.wraps import wrap_option
 
+from gd.api.changes import Owner, Tracked, change_tracked, get_changes, record_change
 from gd.api.color_channels import (
     BACKGROUND_COLOR_ID,
     COLOR_1_ID,
@@ -23,9 +46,21 @@ from gd.api.color_channels import (
     OBJECT_COLOR_ID,
     SECONDARY_GROUND_COLOR_ID,
 )
-from gd.api.hsv import HSV
-from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter
-from gd.binary_constants import BITS, BYTE, HALF_BITS, HALF_BYTE
+from gd.api.hsv import DEFAULT_HSV, HSV, hsv_from_robtop_interned, intern_hsv
+from gd.binary import VERSION, Binary, BinaryReader, BinaryWriter, Buffer, BufferReader
+from gd.binary_constants import (
+    BITS,
+    BYTE,
+    F32,
+    HALF_BITS,
+    HALF_BYTE,
+    I8,
+    I16,
+    U8,
+    U16,
+    U16_SIZE,
+    U32,
+)
 from gd.binary_utils import Reader, Writer
 from gd.color import Color
 from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, DEFAULT_ID, DEFAULT_ROUNDING, EMPTY
@@ -65,9 +100,7 @@ from gd.models_utils import (
     float_str,
     int_bool,
     parse_get_or,
-    parse_get_or_else,
     partial_parse_enum,
-    split_any_object,
     split_groups,
     split_object,
 )
@@ -128,6 +161,7 @@ __all__ = (
     "object_to_binary",
     "object_from_bytes",
     "object_to_bytes",
+    "ObjectCache",
     # migration
     "migrate_objects",
 )
@@ -265,16 +299,205 @@ class ObjectFlag(Flag):
         return type(self).HAS_Z in self
 
 
+GROUP_TYPE = "H"  # `u16`
+
+LAST = -1
+
+LITTLE_ENDIAN = byteorder == "little"
+
+NATIVE_ORDER = ByteOrder.LITTLE if LITTLE_ENDIAN else ByteOrder.BIG
+
+
+def unique_array(iterable: Iterable[int]) -> array:
+    data = array(GROUP_TYPE, iterable)
+
+    if len(data) > 1 and len(set(data)) != len(data):
+        data = array(GROUP_TYPE, dict.fromkeys(data))
+
+    return data
+
+
 G = TypeVar("G", bound="Groups")
 
 
 class Groups(OrderedSet[int], Binary, RobTop):
+    """Represents groups of objects.
+
+    Groups are stored compactly in the array of `u16` values; most objects have
+    only a handful of groups, so linear lookups are faster than hashing.
+    """
+
+    __slots__ = ("data", "owner", "stamp")
+
+    def __init__(self, iterable: Iterable[int] = ()) -> None:
+        self.data = unique_array(iterable)
+        self.owner: Optional[Owner] = None
+        self.stamp = 0
+
+    @classmethod
+    def create_unchecked(cls: Type[G], iterable: Iterable[int] = ()) -> G:  # type: ignore
+        self = cls.__new__(cls)
+
+        self.data = array(GROUP_TYPE, iterable)
+        self.owner = None
+        self.stamp = 0
+
+        return self
+
+    @classmethod
+    def from_raw(cls: Type[G], data: Buffer, order: ByteOrder = ByteOrder.DEFAULT) -> G:
+        """Creates groups from the raw `u16` values in the given byte `order`."""
+        self = cls.create_unchecked()
+
+        values = self.data
+
+        values.frombytes(data)
+
+        if order is not NATIVE_ORDER:
+            values.byteswap()
+
+        if len(values) > 1 and len(set(values)) != len(values):
+            self.data = unique_array(values)
+
+        return self
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @overload  # type: ignore
+    def __getitem__(self, index: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self: G, index: slice) -> G:
+        ...
+
+    def __getitem__(self: G, index: Union[int, slice]) -> Union[int, G]:
+        if is_slice(index):
+            return self.create_unchecked(self.data[index])
+
+        return self.data[index]  # type: ignore
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.data
+
+    def __iter__(self) -> Iterator[int]:
+        return standard_iter(self.data)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self.data)
+
+    def __repr__(self) -> str:
+        data = self.data
+
+        if not data:
+            return GROUPS_EMPTY_REPRESENTATION.format(get_type_name(self))
+
+        return GROUPS_REPRESENTATION.format(get_type_name(self), data.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, Groups):
+            return self.data == other.data
+
+        if is_instance(other, Sequence):
+            return self.data.tolist() == list(other)
+
+        if is_instance(other, Iterable):
+            return set(self.data) == set(other)
+
+        return False
+
+    def __getstate__(self) -> bytes:
+        return self.data.tobytes()
+
+    def __setstate__(self, state: bytes) -> None:
+        self.data = array(GROUP_TYPE)
+        self.data.frombytes(state)
+
+        self.owner = None
+        self.stamp = 0
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        if self.owner is not None:  # unchanged copies of the shared groups
+            return (get_empty_groups, ())
+
+        return super().__reduce_ex__(protocol)
+
+    def add(self, item: int) -> None:
+        data = self.data
+
+        if item not in data:
+            change_tracked(self)
+
+            data.append(item)
+
+    append = add
+
+    def update(self, iterable: Iterable[int]) -> None:
+        for item in iterable:
+            self.add(item)
+
+    extend = update
+
+    def index(self, item: int, start: Optional[int] = None, stop: Optional[int] = None) -> int:
+        if item not in self.data:
+            raise item_not_in_ordered_set(item)
+
+        index = self.data.index(item)
+
+        if start is not None and index < start or stop is not None and index >= stop:
+            raise item_not_in_ordered_set(item)
+
+        return index
+
+    def count(self, item: int) -> int:
+        return int(item in self.data)
+
+    def pop(self, index: int = LAST) -> int:
+        data = self.data
+
+        item = data[index]
+
+        change_tracked(self)
+
+        del data[index]
+
+        return item
+
+    # the inherited aliases wrap the original methods, which expect the other layout
+    get_index = wrap_option(index)
+    get_pop = wrap_option(pop)
+
+    def discard(self, item: int) -> None:
+        data = self.data
+
+        if item in data:
+            change_tracked(self)
+
+            data.remove(item)
+
+    def insert(self, index: int, item: int) -> None:
+        data = self.data
+
+        if item not in data:
+            change_tracked(self)
+
+            data.insert(index, item)
+
+    def clear(self) -> None:
+        data = self.data
+
+        if data:
+            change_tracked(self)
+
+            del data[:]
+
     @classmethod
     def from_robtop(cls: Type[G], string: str) -> G:
-        return iter(split_groups(string)).map(int).collect(cls)
+        return cls(map(int, split_groups(string)))
 
     def to_robtop(self) -> str:
-        return iter(self).map(str).collect(concat_groups)
+        return concat_groups(map(str, self.data))
 
     @classmethod
     def from_binary(
@@ -287,7 +510,7 @@ class Groups(OrderedSet[int], Binary, RobTop):
 
         length = reader.read_u16()
 
-        return iter.repeat_exactly_with(reader.read_u16, length).collect(cls)
+        return cls.from_raw(reader.read(length * U16_SIZE), order)
 
     def to_binary(
         self,
@@ -297,14 +520,163 @@ class Groups(OrderedSet[int], Binary, RobTop):
     ) -> None:
         writer = Writer(binary, order)
 
-        writer.write_u16(len(self))
+        data = self.data
 
-        iter(self).for_each(writer.write_u16)
+        writer.write_u16(len(data))
+
+        if order is not NATIVE_ORDER:
+            data = array(GROUP_TYPE, data)
+            data.byteswap()
+
+        writer.write(data.tobytes())
 
     @staticmethod
     def can_be_in(string: str) -> bool:
         return GROUPS_SEPARATOR in string
 
+    def copy(self) -> "Groups":
+        return Groups.create_unchecked(self.data)
+
+
+GROUPS_EMPTY_REPRESENTATION = "{}()"
+GROUPS_REPRESENTATION = "{}({})"
+
+SHARED_GROUPS_ARE_READ_ONLY = "shared groups are read-only; assign a copy instead"
+
+
+def read_only(*args: Any, **kwargs: Any) -> Never:
+    raise ValueError(SHARED_GROUPS_ARE_READ_ONLY)
+
+
+EMPTY_GROUPS_NAME = "EMPTY_GROUPS"
+
+
+class SharedGroups(Groups):
+    """Represents shared (read-only) empty groups, used as the default for objects.
+
+    Only in-place changes are rejected; new groups are created as usual.
+    """
+
+    __slots__ = ()
+
+    add = append = insert = update = extend = read_only
+    discard = remove = pop = get_pop = clear = read_only
+    difference_update = intersection_update = symmetric_difference_update = read_only
+
+    @classmethod
+    def create(cls, iterable: Iterable[int] = ()) -> Groups:  # type: ignore
+        return Groups(iterable)
+
+    @classmethod
+    def create_unchecked(cls, iterable: Iterable[int] = ()) -> Groups:  # type: ignore
+        return Groups.create_unchecked(iterable)
+
+    def __repr__(self) -> str:
+        return EMPTY_GROUPS_REPRESENTATION
+
+    def __reduce__(self) -> str:
+        return EMPTY_GROUPS_NAME  # unpickle as the singleton
+
+
+EMPTY_GROUPS_REPRESENTATION = "Groups()"
+
+EMPTY_GROUPS = SharedGroups()
+
+
+def get_empty_groups() -> Groups:
+    return EMPTY_GROUPS
+
+
+V = TypeVar("V", HSV, Groups)
+
+
+@define()
+class CopyOnWriteOwner(Generic[V]):
+    instance: Any
+    descriptor: "CopyOnWrite[V]"
+
+    def attach(self, value: V) -> None:
+        self.descriptor.attach(self.instance, value)
+
+
+class CopyOnWrite(Generic[V]):
+    """Wraps slots of fields that default to the `shared` (read-only) value, namely
+    [`DEFAULT_HSV`][gd.api.hsv.DEFAULT_HSV] and [`EMPTY_GROUPS`][gd.api.objects.EMPTY_GROUPS].
+
+    Reading the shared value returns its copy-on-write copy: the instance keeps referring
+    to the shared value until the copy is changed, at which point the copy is stored instead.
+    Reading never stores anything, so comparing, representing and pickling instances
+    keeps sharing intact.
+
+    [`peek`][gd.api.objects.CopyOnWrite.peek] returns the stored value as-is.
+    """
+
+    __slots__ = ("slot", "shared")
+
+    def __init__(self, slot: Any, shared: V) -> None:
+        self.slot = slot
+        self.shared = shared
+
+    def __get__(self, instance: Any, type: Optional[Type[Any]] = None) -> Any:
+        if instance is None:
+            return self
+
+        value = self.slot.__get__(instance, type)
+
+        if value is self.shared:
+            value = value.copy()
+            value.owner = CopyOnWriteOwner(instance, self)
+
+        return value
+
+    def __set__(self, instance: Any, value: V) -> None:
+        if getattr(value, OWNER, None) is not None:  # unchanged copy of the shared value
+            value.owner = CopyOnWriteOwner(instance, self)
+            value = self.shared
+
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.slot.__delete__(instance)
+
+    def peek(self, instance: Any) -> V:
+        return self.slot.__get__(instance, type(instance))
+
+    def attach(self, instance: Any, value: V) -> None:
+        slot = self.slot
+
+        if slot.__get__(instance, type(instance)) is self.shared:
+            slot.__set__(instance, value)
+
+
+OWNER = "owner"
+
+COPIED_COLOR_HSV_NAME = "copied_color_hsv"
+
+
+def copy_on_write(type: Type[Any], name: str, shared: V) -> CopyOnWrite[V]:
+    descriptor = CopyOnWrite(vars(type)[name], shared)
+
+    setattr(type, name, descriptor)
+
+    return descriptor
+
+
+def peek_attribute_factory(type: Type[Any], name: str) -> Unary[Any, Any]:
+    """Returns the function to get the attribute named `name`
+    of the instances of `type`, without copying shared values.
+    """
+    descriptor = getattr(type, name, None)
+
+    if is_instance(descriptor, CopyOnWrite):
+        return descriptor.peek
+
+    return get_attribute_factory(name)
+
+
+def peek_attribute(instance: Any, name: str) -> Any:
+    return peek_attribute_factory(type(instance), name)(instance)
+
 
 DEFAULT_X = 0.0
 DEFAULT_Y = 0.0
@@ -351,10 +723,37 @@ UNKNOWN_BIT = 0b00000001
 OBJECT_STRING = "{object_type} (ID: {object.id}) at ({object.x}, {object.y})"
 object_string = OBJECT_STRING.format
 
+STAMP = "stamp"
+
 O = TypeVar("O", bound="Object")
 
 
-@define()
+def change_object(object: Any, attribute: Any, value: Any) -> Any:
+    """Records the change of the `object`, stamping it."""
+    object.stamp = record_change()
+
+    return value
+
+
+def define_object(cls: Type[O]) -> Type[O]:
+    """Same as [`define`][attrs.define], except changes of objects are recorded
+    (see [`Object.stamp`][gd.api.objects.Object.stamp]).
+
+    Every object type needs to be defined this way, as `attrs` does not inherit hooks.
+    """
+    return define(on_setattr=change_object)(cls)
+
+
+OBJECT_START = U8 + U16 + F32 + F32 + U8  # flag, ID, x, y, bits
+ROTATION_AND_SCALE = F32 + F32
+Z = I8 + I16
+EDITOR_LAYERS = U16 + U16
+COLORS = U16 + U16 + U32 + U32  # color IDs and HSVs
+LINK_END = U16 + U8
+END = U8
+
+
+@define_object
 class Object(Binary, RobTop):
     id: int = field()
     x: float = field(default=DEFAULT_X)
@@ -379,10 +778,10 @@ class Object(Binary, RobTop):
     base_color_id: int = field(default=DEFAULT_ID)
     detail_color_id: int = field(default=DEFAULT_ID)
 
-    base_color_hsv: HSV = field(factory=HSV)
-    detail_color_hsv: HSV = field(factory=HSV)
+    base_color_hsv: HSV = field(default=DEFAULT_HSV)
+    detail_color_hsv: HSV = field(default=DEFAULT_HSV)
 
-    groups: Groups = field(factory=Groups)
+    groups: Groups = field(default=EMPTY_GROUPS)
 
     group_parent: bool = field(default=DEFAULT_GROUP_PARENT)
 
@@ -396,6 +795,11 @@ class Object(Binary, RobTop):
 
     unknown: bool = field(default=DEFAULT_UNKNOWN)
 
+    stamp: int = field(default=0, init=False, repr=False, eq=False, on_setattr=NO_OP)
+    """The stamp of the latest change of the object, excluding changes of its
+    groups and HSVs, which are stamped separately.
+    """
+
     @classmethod
     def from_binary(
         cls: Type[O],
@@ -418,16 +822,12 @@ class Object(Binary, RobTop):
 
         reader = Reader(binary, order)
 
-        flag_value = reader.read_u8()
+        flag_value, id, x, y, value = reader.unpack_record(OBJECT_START)
 
         flag = ObjectFlag(flag_value)
 
-        id = reader.read_u16()
-
-        x = round(reader.read_f32(), rounding)
-        y = round(reader.read_f32(), rounding)
-
-        value = reader.read_u8()
+        x = round(x, rounding)
+        y = round(y, rounding)
 
         h_flipped = value & h_flipped_bit == h_flipped_bit
         v_flipped = value & v_flipped_bit == v_flipped_bit
@@ -439,56 +839,60 @@ class Object(Binary, RobTop):
         special_checked = value & special_checked_bit == special_checked_bit
 
         if flag.has_rotation_and_scale():
-            rotation = round(reader.read_f32(), rounding)
-            scale = round(reader.read_f32(), rounding)
+            rotation, scale = reader.unpack_record(ROTATION_AND_SCALE)
+
+            rotation = round(rotation, rounding)
+            scale = round(scale, rounding)
 
         else:
             rotation = DEFAULT_ROTATION
             scale = DEFAULT_SCALE
 
         if flag.has_z():
-            z_layer = reader.read_i8()
-            z_order = reader.read_i16()
+            z_layer, z_order = reader.unpack_record(Z)
 
         else:
             z_layer = DEFAULT_Z_LAYER
             z_order = DEFAULT_Z_ORDER
 
         if flag.has_editor_layer():
-            base_editor_layer = reader.read_u16()
-            additional_editor_layer = reader.read_u16()
+            base_editor_layer, additional_editor_layer = reader.unpack_record(EDITOR_LAYERS)
 
         else:
             base_editor_layer = DEFAULT_BASE_EDITOR_LAYER
             additional_editor_layer = DEFAULT_ADDITIONAL_EDITOR_LAYER
 
         if flag.has_colors():
-            base_color_id = reader.read_u16()
-            detail_color_id = reader.read_u16()
+            (
+                base_color_id,
+                detail_color_id,
+                base_color_hsv_value,
+                detail_color_hsv_value,
+            ) = reader.unpack_record(COLORS)
 
-            base_color_hsv = HSV.from_binary(binary, order, version)
-            detail_color_hsv = HSV.from_binary(binary, order, version)
+            base_color_hsv = intern_hsv(HSV.from_value(base_color_hsv_value))
+            detail_color_hsv = intern_hsv(HSV.from_value(detail_color_hsv_value))
 
         else:
             base_color_id = DEFAULT_ID
             detail_color_id = DEFAULT_ID
 
-            base_color_hsv = HSV()
-            detail_color_hsv = HSV()
+            base_color_hsv = DEFAULT_HSV
+            detail_color_hsv = DEFAULT_HSV
 
         if flag.has_groups():
             groups = Groups.from_binary(binary, order, version)
 
         else:
-            groups = Groups()
+            groups = EMPTY_GROUPS
 
         if flag.has_link():
-            link_id = reader.read_u16()
+            link_id, value = reader.unpack_record(LINK_END)
 
         else:
             link_id = DEFAULT_ID
 
-        value = reader.read_u8()
+            value = reader.read_u8()
 
         unknown = value & unknown_bit == unknown_bit
 
@@ -547,8 +951,8 @@ class Object(Binary, RobTop):
         base_color_id = self.base_color_id
         detail_color_id = self.detail_color_id
 
-        base_color_hsv = self.base_color_hsv
-        detail_color_hsv = self.detail_color_hsv
+        base_color_hsv = peek_base_color_hsv(self)
+        detail_color_hsv = peek_detail_color_hsv(self)
 
         if (
             base_color_id
@@ -558,7 +962,7 @@ class Object(Binary, RobTop):
         ):
             flag |= ObjectFlag.HAS_COLORS
 
-        groups = self.groups
+        groups = peek_groups(self)
 
         if groups:
             flag |= ObjectFlag.HAS_GROUPS
@@ -568,13 +972,6 @@ class Object(Binary, RobTop):
         if link_id:
             flag |= ObjectFlag.HAS_LINK
 
-        writer.write_u8(flag.value)
-
-        writer.write_u16(self.id)
-
-        writer.write_f32(self.x)
-        writer.write_f32(self.y)
-
         value = 0
 
         if self.is_h_flipped():
@@ -601,40 +998,39 @@ class Object(Binary, RobTop):
         if self.is_special_checked():
             value |= SPECIAL_CHECKED_BIT
 
-        writer.write_u8(value)
+        writer.pack_record(OBJECT_START, flag.value, self.id, self.x, self.y, value)
 
         if flag.has_rotation_and_scale():
-            writer.write_f32(self.rotation)
-            writer.write_f32(self.scale)
+            writer.pack_record(ROTATION_AND_SCALE, rotation, scale)
 
         if flag.has_z():
-            writer.write_i8(self.z_layer)
-
-            writer.write_i16(self.z_order)
+            writer.pack_record(Z, z_layer, z_order)
 
         if flag.has_editor_layer():
-            writer.write_u16(base_editor_layer)
-            writer.write_u16(additional_editor_layer)
+            writer.pack_record(EDITOR_LAYERS, base_editor_layer, additional_editor_layer)
 
         if flag.has_colors():
-            writer.write_u16(base_color_id)
-            writer.write_u16(detail_color_id)
-
-            base_color_hsv.to_binary(binary, order, version)
-            detail_color_hsv.to_binary(binary, order, version)
+            writer.pack_record(
+                COLORS,
+                base_color_id,
+                detail_color_id,
+                base_color_hsv.to_value(),
+                detail_color_hsv.to_value(),
+            )
 
         if flag.has_groups():
-            self.groups.to_binary(binary, order, version)
-
-        if flag.has_link():
-            writer.write_u16(link_id)
+            groups.to_binary(binary, order, version)
 
         value = 0
 
         if self.is_unknown():
             value |= UNKNOWN_BIT
 
-        writer.write_u8(value)
+        if flag.has_link():
+            writer.pack_record(LINK_END, link_id, value)
+
+        else:
+            writer.write_u8(value)
 
     @classmethod
     def from_robtop(cls: Type[O], string: str) -> O:
@@ -688,14 +1084,21 @@ class Object(Binary, RobTop):
             base_color_id = parse_get_or(int, DEFAULT_ID, data.get(BASE_COLOR_ID))
             detail_color_id = parse_get_or(int, DEFAULT_ID, data.get(DETAIL_COLOR_ID))
 
-        base_color_hsv = parse_get_or_else(HSV.from_robtop, HSV, data.get(BASE_COLOR_HSV))
-        detail_color_hsv = parse_get_or_else(HSV.from_robtop, HSV, data.get(DETAIL_COLOR_HSV))
+        base_color_hsv = parse_get_or(
+            hsv_from_robtop_interned, DEFAULT_HSV, data.get(BASE_COLOR_HSV)
+        )
+        detail_color_hsv = parse_get_or(
+            hsv_from_robtop_interned, DEFAULT_HSV, data.get(DETAIL_COLOR_HSV)
+        )
 
         single_group_id = parse_get_or(int, DEFAULT_ID, data.get(SINGLE_GROUP_ID))
 
-        groups = parse_get_or_else(Groups.from_robtop, Groups, data.get(GROUPS))
+        groups = parse_get_or(Groups.from_robtop, EMPTY_GROUPS, data.get(GROUPS))
 
         if single_group_id:
+            if groups is EMPTY_GROUPS:
+                groups = Groups()
+
             groups.append(single_group_id)
 
         group_parent = parse_get_or(int_bool, DEFAULT_GROUP_PARENT, data.get(GROUP_PARENT))
@@ -800,7 +1203,7 @@ class Object(Binary, RobTop):
         if detail_color_id:
             data[DETAIL_COLOR_ID] = str(detail_color_id)
 
-        base_color_hsv = self.base_color_hsv
+        base_color_hsv = peek_base_color_hsv(self)
 
         base_color_hsv_modified = not base_color_hsv.is_default()
 
@@ -808,7 +1211,7 @@ class Object(Binary, RobTop):
             data[BASE_COLOR_HSV] = base_color_hsv.to_robtop()
             data[BASE_COLOR_HSV_MODIFIED] = bool_str(base_color_hsv_modified)
 
-        detail_color_hsv = self.detail_color_hsv
+        detail_color_hsv = peek_detail_color_hsv(self)
 
         detail_color_hsv_modified = not detail_color_hsv.is_default()
 
@@ -816,7 +1219,7 @@ class Object(Binary, RobTop):
             data[DETAIL_COLOR_HSV] = detail_color_hsv.to_robtop()
             data[DETAIL_COLOR_HSV_MODIFIED] = bool_str(detail_color_hsv_modified)
 
-        groups = self.groups
+        groups = peek_groups(self)
 
         if groups:
             data[GROUPS] = groups.to_robtop()
@@ -960,6 +1363,11 @@ class Object(Binary, RobTop):
         return object_string(object_type=get_type_name(self), object=self)
 
 
+peek_base_color_hsv = copy_on_write(Object, "base_color_hsv", DEFAULT_HSV).peek
+peek_detail_color_hsv = copy_on_write(Object, "detail_color_hsv", DEFAULT_HSV).peek
+peek_groups = copy_on_write(Object, "groups", EMPTY_GROUPS).peek
+
+
 PORTAL_IDS = {portal.id for portal in PortalType}
 SPEED_CHANGE_IDS = {speed_change.id for speed_change in SpeedChangeType}
 
@@ -987,12 +1395,10 @@ START_POSITION_FLIP_GRAVITY_BIT = 0b00000100
 
 SP = TypeVar("SP", bound="StartPosition")
 
-SPECIAL_HANDLING = (
-    "special handling is required for start positions; consider using `from_robtop` and `to_robtop`"
-)
+SPECIAL_HANDLING = "special handling is required for start positions; consider using `to_robtop`"
 
 
-@define()
+@define_object
 class StartPosition(Object):
     game_mode: GameMode = field(default=GameMode.DEFAULT)
     mini_mode: bool = field(default=DEFAULT_START_POSITION_MINI_MODE)
@@ -1065,18 +1471,16 @@ class StartPosition(Object):
         writer.write_u8(value)
 
     @classmethod
-    def from_robtop(cls: Type[SP], string: str) -> SP:
-        data = split_any_object(string)
-
-        id_option = data.get(ID_STRING)
+    def from_robtop_data(cls: Type[SP], data: Mapping[Any, str]) -> SP:  # type: ignore
+        id_option = data.get(ID)
 
         if id_option is None:
             raise ValueError(OBJECT_ID_NOT_PRESENT)
 
         id = int(id_option)
 
-        x = parse_get_or(float, DEFAULT_X, data.get(X_STRING))
-        y = parse_get_or(float, DEFAULT_Y, data.get(Y_STRING))
+        x = parse_get_or(float, DEFAULT_X, data.get(X))
+        y = parse_get_or(float, DEFAULT_Y, data.get(Y))
 
         game_mode = parse_get_or(
             partial_parse_enum(int, GameMode),
@@ -1126,10 +1530,6 @@ class StartPosition(Object):
 
         return concat_any_object(data)
 
-    @classmethod
-    def from_robtop_data(cls, data: Mapping[int, str]) -> Never:
-        raise NotImplementedError(SPECIAL_HANDLING)
-
     def to_robtop_data(self) -> Never:
         raise NotImplementedError(SPECIAL_HANDLING)
 
@@ -1153,7 +1553,7 @@ def is_start_position(object: Object) -> TypeGuard[StartPosition]:
 SC = TypeVar("SC", bound="SecretCoin")
 
 
-@define()
+@define_object
 class SecretCoin(Object):
     coin_id: int = DEFAULT_ID
 
@@ -1211,7 +1611,7 @@ DEFAULT_DISABLE_ROTATION = False
 RO = TypeVar("RO", bound="RotatingObject")
 
 
-@define()
+@define_object
 class RotatingObject(Object):
     rotation_speed: float = DEFAULT_ROTATION_SPEED
     disable_rotation: bool = DEFAULT_DISABLE_ROTATION
@@ -1298,7 +1698,7 @@ class RotatingObject(Object):
 S = TypeVar("S", bound="Text")
 
 
-@define()
+@define_object
 class Text(Object):
     content: str = EMPTY
 
@@ -1371,7 +1771,7 @@ DEFAULT_PORTAL_OFFSET = 100.0
 P = TypeVar("P", bound="Teleport")
 
 
-@define()
+@define_object
 class Teleport(Object):
     portal_offset: float = DEFAULT_PORTAL_OFFSET
     smooth: bool = DEFAULT_SMOOTH
@@ -1456,7 +1856,7 @@ RANDOMIZE_START_BIT = 0b00000001
 PO = TypeVar("PO", bound="PulsatingObject")
 
 
-@define()
+@define_object
 class PulsatingObject(Object):
     randomize_start: bool = DEFAULT_RANDOMIZE_START
     animation_speed: float = DEFAULT_ANIMATION_SPEED
@@ -1543,7 +1943,7 @@ DEFAULT_DYNAMIC = False
 CB = TypeVar("CB", bound="CollisionBlock")
 
 
-@define()
+@define_object
 class CollisionBlock(Object):
     block_id: int = DEFAULT_ID
     dynamic: bool = DEFAULT_DYNAMIC
@@ -1623,7 +2023,7 @@ DEFAULT_MULTI_ACTIVATE = False
 OP = TypeVar("OP", bound="Orb")
 
 
-@define()
+@define_object
 class Orb(Object):
     multi_activate: bool = DEFAULT_MULTI_ACTIVATE
 
@@ -1694,7 +2094,7 @@ DEFAULT_ACTIVATE_GROUP = False
 TO = TypeVar("TO", bound="TriggerOrb")
 
 
-@define()
+@define_object
 class TriggerOrb(Orb):
     target_group_id: int = DEFAULT_ID
 
@@ -1780,7 +2180,7 @@ class TriggerOrb(Orb):
 IC = TypeVar("IC", bound="ItemCounter")
 
 
-@define()
+@define_object
 class ItemCounter(Object):
     item_id: int = DEFAULT_ID
 
@@ -1834,7 +2234,7 @@ class ItemCounter(Object):
 TI = TypeVar("TI", bound="ToggleItem")
 
 
-@define()
+@define_object
 class ToggleItem(Object):
     target_group_id: int = DEFAULT_ID
 
@@ -1912,7 +2312,7 @@ DEFAULT_SUBTRACT_COUNT = False
 PI = TypeVar("PI", bound="PickupItem")
 
 
-@define()
+@define_object
 class PickupItem(Object):
     item_id: int = DEFAULT_ID
 
@@ -2007,7 +2407,7 @@ DEFAULT_MULTI_TRIGGER = False
 T = TypeVar("T", bound="Trigger")
 
 
-@define()
+@define_object
 class Trigger(Object):
     touch_triggered: bool = DEFAULT_TOUCH_TRIGGERED
     spawn_triggered: bool = DEFAULT_SPAWN_TRIGGERED
@@ -2113,7 +2513,7 @@ DEFAULT_DURATION = 0.0
 BCT = TypeVar("BCT", bound="BaseColorTrigger")
 
 
-@define()
+@define_object
 class BaseColorTrigger(Trigger):
     target_color_id: int = DEFAULT_ID
 
@@ -2206,7 +2606,7 @@ DEFAULT_OPACITY = 1.0
 PLCT = TypeVar("PLCT", bound="PlayerColorTrigger")
 
 
-@define()
+@define_object
 class PlayerColorTrigger(BaseColorTrigger):
     blending: bool = DEFAULT_BLENDING
     opacity: float = DEFAULT_OPACITY
@@ -2320,7 +2720,7 @@ DEFAULT_BLUE = BYTE
 NCT = TypeVar("NCT", bound="NormalColorTrigger")
 
 
-@define()
+@define_object
 class NormalColorTrigger(BaseColorTrigger):
     blending: bool = field(default=DEFAULT_BLENDING)
     opacity: float = field(default=DEFAULT_OPACITY)
@@ -2430,12 +2830,12 @@ DEFAULT_COPY_OPACITY = False
 CCT = TypeVar("CCT", bound="CopiedColorTrigger")
 
 
-@define()
+@define_object
 class CopiedColorTrigger(BaseColorTrigger):
     blending: bool = field(default=DEFAULT_BLENDING)
 
     copied_color_id: int = field(default=DEFAULT_ID)
-    copied_color_hsv: HSV = field(factory=HSV)
+    copied_color_hsv: HSV = field(default=DEFAULT_HSV)
 
     opacity: Optional[float] = field(default=None)
 
@@ -2473,7 +2873,7 @@ class CopiedColorTrigger(BaseColorTrigger):
             opacity = round(reader.read_f32(), rounding)
 
         copied_color_id = reader.read_u16()
-        copied_color_hsv = HSV.from_binary(binary, order, version)
+        copied_color_hsv = intern_hsv(HSV.from_binary(binary, order, version))
 
         copied_color_trigger.blending = blending
         copied_color_trigger.opacity = opacity
@@ -2507,7 +2907,7 @@ class CopiedColorTrigger(BaseColorTrigger):
 
         writer.write_u16(self.copied_color_id)
 
-        self.copied_color_hsv.to_binary(binary, order, version)
+        peek_copied_color_hsv(self).to_binary(binary, order, version)
 
     @classmethod
     def from_robtop_data(cls: Type[CCT], data: Mapping[int, str]) -> CCT:
@@ -2516,7 +2916,9 @@ class CopiedColorTrigger(BaseColorTrigger):
         blending = parse_get_or(int_bool, DEFAULT_BLENDING, data.get(BLENDING))
 
         copied_color_id = parse_get_or(int, DEFAULT_ID, data.get(COPIED_COLOR_ID))
-        copied_color_hsv = parse_get_or_else(HSV.from_robtop, HSV, data.get(COPIED_COLOR_HSV))
+        copied_color_hsv = parse_get_or(
+            hsv_from_robtop_interned, DEFAULT_HSV, data.get(COPIED_COLOR_HSV)
+        )
 
         copy_opacity = parse_get_or(int_bool, DEFAULT_COPY_OPACITY, data.get(COPY_OPACITY))
 
@@ -2540,7 +2942,7 @@ class CopiedColorTrigger(BaseColorTrigger):
 
         actual = {
             COPIED_COLOR_ID: str(self.copied_color_id),
-            COPIED_COLOR_HSV: self.copied_color_hsv.to_robtop(),
+            COPIED_COLOR_HSV: peek_copied_color_hsv(self).to_robtop(),
             COPY_OPACITY: bool_str(self.is_copy_opacity()),
         }
 
@@ -2559,6 +2961,13 @@ class CopiedColorTrigger(BaseColorTrigger):
         return data
 
 
+copy_on_write(CopiedColorTrigger, COPIED_COLOR_HSV_NAME, DEFAULT_HSV)
+
+
+def peek_copied_color_hsv(trigger: Object) -> HSV:
+    return peek_attribute(trigger, COPIED_COLOR_HSV_NAME)
+
+
 ColorTrigger = Union[PlayerColorTrigger, NormalColorTrigger, CopiedColorTrigger]
 
 
@@ -2567,6 +2976,8 @@ ColorTrigger = Union[PlayerColorTrigger, NormalColorTrigger, CopiedColorTrigger]
 
 @runtime_checkable
 class Compatibility(Protocol):
+    __slots__ = ()
+
     @required
     def migrate(self) -> Object:
         ...
@@ -2601,6 +3012,7 @@ MIGRATE = (
 BCMCT = TypeVar("BCMCT", bound="BaseCompatibilityColorTrigger")
 
 
+@define_object
 class BaseCompatibilityColorTrigger(Compatibility, Trigger):
     duration: float = DEFAULT_DURATION
 
@@ -2638,7 +3050,7 @@ class BaseCompatibilityColorTrigger(Compatibility, Trigger):
 PCMCT = TypeVar("PCMCT", bound="PlayerCompatibilityColorTrigger")
 
 
-@define()
+@define_object
 class PlayerCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
     blending: bool = DEFAULT_BLENDING
     opacity: float = DEFAULT_OPACITY
@@ -2706,7 +3118,7 @@ class PlayerCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
 NCMCT = TypeVar("NCMCT", bound="NormalCompatibilityColorTrigger")
 
 
-@define()
+@define_object
 class NormalCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
     blending: bool = field(default=DEFAULT_BLENDING)
     opacity: float = field(default=DEFAULT_OPACITY)
@@ -2774,12 +3186,12 @@ class NormalCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
 CCMCT = TypeVar("CCMCT", bound="CopiedCompatibilityColorTrigger")
 
 
-@define()
+@define_object
 class CopiedCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
     blending: bool = field(default=DEFAULT_BLENDING)
 
     copied_color_id: int = field(default=DEFAULT_ID)
-    copied_color_hsv: HSV = field(factory=HSV)
+    copied_color_hsv: HSV = field(default=DEFAULT_HSV)
 
     opacity: Optional[float] = field(default=None)
 
@@ -2797,7 +3209,9 @@ class CopiedCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
 
         copied_color_id = parse_get_or(int, DEFAULT_ID, data.get(COPIED_COLOR_ID))
 
-        copied_color_hsv = parse_get_or_else(HSV.from_robtop, HSV, data.get(COPIED_COLOR_HSV))
+        copied_color_hsv = parse_get_or(
+            hsv_from_robtop_interned, DEFAULT_HSV, data.get(COPIED_COLOR_HSV)
+        )
 
         copy_opacity = parse_get_or(int_bool, DEFAULT_COPY_OPACITY, data.get(COPY_OPACITY))
 
@@ -2854,6 +3268,9 @@ class CopiedCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
         )
 
 
+copy_on_write(CopiedCompatibilityColorTrigger, COPIED_COLOR_HSV_NAME, DEFAULT_HSV)
+
+
 CompatibilityColorTrigger = Union[
     PlayerCompatibilityColorTrigger,
     NormalCompatibilityColorTrigger,
@@ -2867,7 +3284,7 @@ DEFAULT_TINT_GROUND = False
 PBGT = TypeVar("PBGT", bound="PlayerBackgroundTrigger")
 
 
-@define()
+@define_object
 class PlayerBackgroundTrigger(PlayerCompatibilityColorTrigger):
     tint_ground: bool = DEFAULT_TINT_GROUND
 
@@ -2894,7 +3311,7 @@ class PlayerBackgroundTrigger(PlayerCompatibilityColorTrigger):
 NBGT = TypeVar("NBGT", bound="NormalBackgroundTrigger")
 
 
-@define()
+@define_object
 class NormalBackgroundTrigger(NormalCompatibilityColorTrigger):
     tint_ground: bool = DEFAULT_TINT_GROUND
 
@@ -2921,7 +3338,7 @@ class NormalBackgroundTrigger(NormalCompatibilityColorTrigger):
 CBGT = TypeVar("CBGT", bound="CopiedBackgroundTrigger")
 
 
-@define()
+@define_object
 class CopiedBackgroundTrigger(CopiedCompatibilityColorTrigger):
     tint_ground: bool = DEFAULT_TINT_GROUND
 
@@ -2945,163 +3362,163 @@ class CopiedBackgroundTrigger(CopiedCompatibilityColorTrigger):
         return self.generate_migration(GROUND_COLOR_ID) if self.is_tint_ground() else None
 
 
-@define()
+@define_object
 class PlayerGroundTrigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class NormalGroundTrigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class CopiedGroundTrigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class PlayerLineTrigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(LINE_COLOR_ID)
 
 
-@define()
+@define_object
 class NormalLineTrigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(LINE_COLOR_ID)
 
 
-@define()
+@define_object
 class CopiedLineTrigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(LINE_COLOR_ID)
 
 
-@define()
+@define_object
 class PlayerObjectTrigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(OBJECT_COLOR_ID)
 
 
-@define()
+@define_object
 class NormalObjectTrigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(OBJECT_COLOR_ID)
 
 
-@define()
+@define_object
 class CopiedObjectTrigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(OBJECT_COLOR_ID)
 
 
-@define()
+@define_object
 class PlayerLine3DTrigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(LINE_3D_COLOR_ID)
 
 
-@define()
+@define_object
 class NormalLine3DTrigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(LINE_3D_COLOR_ID)
 
 
-@define()
+@define_object
 class CopiedLine3DTrigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(LINE_3D_COLOR_ID)
 
 
-@define()
+@define_object
 class PlayerSecondaryGroundTrigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(SECONDARY_GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class NormalSecondaryGroundTrigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(SECONDARY_GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class CopiedSecondaryGroundTrigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(SECONDARY_GROUND_COLOR_ID)
 
 
-@define()
+@define_object
 class PlayerColor1Trigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(COLOR_1_ID)
 
 
-@define()
+@define_object
 class NormalColor1Trigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(COLOR_1_ID)
 
 
-@define()
+@define_object
 class CopiedColor1Trigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(COLOR_1_ID)
 
 
-@define()
+@define_object
 class PlayerColor2Trigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(COLOR_2_ID)
 
 
-@define()
+@define_object
 class NormalColor2Trigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(COLOR_2_ID)
 
 
-@define()
+@define_object
 class CopiedColor2Trigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(COLOR_2_ID)
 
 
-@define()
+@define_object
 class PlayerColor3Trigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(COLOR_3_ID)
 
 
-@define()
+@define_object
 class NormalColor3Trigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(COLOR_3_ID)
 
 
-@define()
+@define_object
 class CopiedColor3Trigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(COLOR_3_ID)
 
 
-@define()
+@define_object
 class PlayerColor4Trigger(PlayerCompatibilityColorTrigger):
     def migrate(self) -> PlayerColorTrigger:
         return self.generate_migration(COLOR_4_ID)
 
 
-@define()
+@define_object
 class NormalColor4Trigger(NormalCompatibilityColorTrigger):
     def migrate(self) -> NormalColorTrigger:
         return self.generate_migration(COLOR_4_ID)
 
 
-@define()
+@define_object
 class CopiedColor4Trigger(CopiedCompatibilityColorTrigger):
     def migrate(self) -> CopiedColorTrigger:
         return self.generate_migration(COLOR_4_ID)
@@ -3110,7 +3527,7 @@ class CopiedColor4Trigger(CopiedCompatibilityColorTrigger):
 ALT = TypeVar("ALT", bound="AlphaTrigger")
 
 
-@define()
+@define_object
 class AlphaTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
     duration: float = DEFAULT_DURATION
@@ -3188,7 +3605,7 @@ DEFAULT_FADE_OUT = 0.0
 BPT = TypeVar("BPT", bound="BasePulseTrigger")
 
 
-@define()
+@define_object
 class BasePulseTrigger(Trigger):
     fade_in: float = DEFAULT_FADE_IN
     hold: float = DEFAULT_HOLD
@@ -3268,7 +3685,7 @@ EXCLUSIVE_BIT = 0b00000001
 PCT = TypeVar("PCT", bound="PulseColorTrigger")
 
 
-@define()
+@define_object
 class PulseColorTrigger(BasePulseTrigger):
     exclusive: bool = field(default=DEFAULT_EXCLUSIVE)
 
@@ -3364,12 +3781,12 @@ class PulseColorTrigger(BasePulseTrigger):
 PHT = TypeVar("PHT", bound="PulseHSVTrigger")
 
 
-@define()
+@define_object
 class PulseHSVTrigger(BasePulseTrigger):
     exclusive: bool = field(default=DEFAULT_EXCLUSIVE)
 
     copied_color_id: int = field(default=DEFAULT_ID)
-    copied_color_hsv: HSV = field(factory=HSV)
+    copied_color_hsv: HSV = field(default=DEFAULT_HSV)
 
     def is_exclusive(self) -> bool:
         return self.exclusive
@@ -3388,7 +3805,7 @@ class PulseHSVTrigger(BasePulseTrigger):
         reader = Reader(binary, order)
 
         copied_color_id = reader.read_u16()
-        copied_color_hsv = HSV.from_binary(binary, order, version)
+        copied_color_hsv = intern_hsv(HSV.from_binary(binary, order, version))
 
         value = reader.read_u8()
 
@@ -3412,7 +3829,7 @@ class PulseHSVTrigger(BasePulseTrigger):
         writer = Writer(binary, order)
 
         writer.write_u16(self.copied_color_id)
-        self.copied_color_hsv.to_binary(binary, order, version)
+        peek_copied_color_hsv(self).to_binary(binary, order, version)
 
         value = 0
 
@@ -3426,7 +3843,9 @@ class PulseHSVTrigger(BasePulseTrigger):
         pulse_hsv_trigger = super().from_robtop_data(data)
 
         copied_color_id = parse_get_or(int, DEFAULT_ID, data.get(COPIED_COLOR_ID))
-        copied_color_hsv = parse_get_or_else(HSV.from_robtop, HSV, data.get(COPIED_COLOR_HSV))
+        copied_color_hsv = parse_get_or(
+            hsv_from_robtop_interned, DEFAULT_HSV, data.get(COPIED_COLOR_HSV)
+        )
 
         exclusive = parse_get_or(int_bool, DEFAULT_EXCLUSIVE, data.get(EXCLUSIVE))
 
@@ -3442,7 +3861,7 @@ class PulseHSVTrigger(BasePulseTrigger):
 
         actual = {
             COPIED_COLOR_ID: str(self.copied_color_id),
-            COPIED_COLOR_HSV: self.copied_color_hsv.to_robtop(),
+            COPIED_COLOR_HSV: peek_copied_color_hsv(self).to_robtop(),
             PULSE_MODE: str(PulseMode.HSV.value),
         }
 
@@ -3456,10 +3875,13 @@ class PulseHSVTrigger(BasePulseTrigger):
         return data
 
 
+copy_on_write(PulseHSVTrigger, COPIED_COLOR_HSV_NAME, DEFAULT_HSV)
+
+
 PCCT = TypeVar("PCCT", bound="PulseColorChannelTrigger")
 
 
-@define()
+@define_object
 class PulseColorChannelTrigger(PulseColorTrigger):
     target_color_id: int = DEFAULT_ID
 
@@ -3514,7 +3936,7 @@ class PulseColorChannelTrigger(PulseColorTrigger):
 PHCT = TypeVar("PHCT", bound="PulseHSVChannelTrigger")
 
 
-@define()
+@define_object
 class PulseHSVChannelTrigger(PulseHSVTrigger):
     target_color_id: int = DEFAULT_ID
 
@@ -3583,7 +4005,7 @@ def compute_pulse_type(main_only: bool, detail_only: bool) -> PulseType:
 PCGT = TypeVar("PCGT", bound="PulseColorGroupTrigger")
 
 
-@define()
+@define_object
 class PulseColorGroupTrigger(PulseColorTrigger):
     target_group_id: int = DEFAULT_ID
     pulse_type: PulseType = PulseType.DEFAULT
@@ -3663,7 +4085,7 @@ class PulseColorGroupTrigger(PulseColorTrigger):
 PHGT = TypeVar("PHGT", bound="PulseHSVGroupTrigger")
 
 
-@define()
+@define_object
 class PulseHSVGroupTrigger(PulseHSVTrigger):
     target_group_id: int = DEFAULT_ID
 
@@ -3755,7 +4177,7 @@ DEFAULT_EASING_RATE = 2.0
 BMT = TypeVar("BMT", bound="BaseMoveTrigger")
 
 
-@define()
+@define_object
 class BaseMoveTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -3864,7 +4286,7 @@ DEFAULT_LOCKED_TO_PLAYER_Y = False
 NMT = TypeVar("NMT", bound="NormalMoveTrigger")
 
 
-@define()
+@define_object
 class NormalMoveTrigger(BaseMoveTrigger):
     x_offset: float = DEFAULT_X_OFFSET
     y_offset: float = DEFAULT_Y_OFFSET
@@ -3978,7 +4400,7 @@ USE_TARGET_TRUE = True
 TMT = TypeVar("TMT", bound="TargetMoveTrigger")
 
 
-@define()
+@define_object
 class TargetMoveTrigger(BaseMoveTrigger):
     additional_group_id: int = DEFAULT_ID
 
@@ -4068,7 +4490,7 @@ EDITOR_DISABLE_BIT = 0b00000001
 SPT = TypeVar("SPT", bound="SpawnTrigger")
 
 
-@define()
+@define_object
 class SpawnTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -4164,7 +4586,7 @@ class SpawnTrigger(Trigger):
 ST = TypeVar("ST", bound="StopTrigger")
 
 
-@define()
+@define_object
 class StopTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -4221,7 +4643,7 @@ DEFAULT_TOGGLED = False
 TT = TypeVar("TT", bound="ToggleTrigger")
 
 
-@define()
+@define_object
 class ToggleTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -4319,7 +4741,7 @@ DEFAULT_ROTATION_LOCKED = False
 RT = TypeVar("RT", bound="RotateTrigger")
 
 
-@define()
+@define_object
 class RotateTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
     additional_group_id: int = DEFAULT_ID
@@ -4485,7 +4907,7 @@ DEFAULT_Y_MODIFIER = 1.0
 FT = TypeVar("FT", bound="FollowTrigger")
 
 
-@define()
+@define_object
 class FollowTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
     additional_group_id: int = DEFAULT_ID
@@ -4608,7 +5030,7 @@ DEFAULT_INTERVAL = 0.0
 SHT = TypeVar("SHT", bound="ShakeTrigger")
 
 
-@define()
+@define_object
 class ShakeTrigger(Trigger):
     duration: float = DEFAULT_DURATION
     strength: float = DEFAULT_STRENGTH
@@ -4675,7 +5097,7 @@ class ShakeTrigger(Trigger):
 AT = TypeVar("AT", bound="AnimateTrigger")
 
 
-@define()
+@define_object
 class AnimateTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -4748,7 +5170,7 @@ DEFAULT_DUAL_MODE = False
 THT = TypeVar("THT", bound="TouchTrigger")
 
 
-@define()
+@define_object
 class TouchTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -4863,7 +5285,7 @@ DEFAULT_COUNT = 0
 CT = TypeVar("CT", bound="CountTrigger")
 
 
-@define()
+@define_object
 class CountTrigger(Trigger):
     item_id: int = DEFAULT_ID
 
@@ -4993,7 +5415,7 @@ COMPARISON_MASK = 0b00000110
 COMPARISON_SHIFT = ACTIVATE_GROUP_BIT.bit_length()
 
 
-@define()
+@define_object
 class InstantCountTrigger(Trigger):
     item_id: int = DEFAULT_ID
     count: int = DEFAULT_COUNT
@@ -5106,7 +5528,7 @@ class InstantCountTrigger(Trigger):
 PT = TypeVar("PT", bound="PickupTrigger")
 
 
-@define()
+@define_object
 class PickupTrigger(Trigger):
     item_id: int = DEFAULT_ID
     count: int = DEFAULT_COUNT
@@ -5175,7 +5597,7 @@ DEFAULT_OFFSET = 0.0
 FPYT = TypeVar("FPYT", bound="FollowPlayerYTrigger")
 
 
-@define()
+@define_object
 class FollowPlayerYTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -5283,7 +5705,7 @@ class FollowPlayerYTrigger(Trigger):
 ODT = TypeVar("ODT", bound="OnDeathTrigger")
 
 
-@define()
+@define_object
 class OnDeathTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -5370,7 +5792,7 @@ DEFAULT_TRIGGER_ON_EXIT = False
 CBT = TypeVar("CBT", bound="CollisionTrigger")
 
 
-@define()
+@define_object
 class CollisionTrigger(Trigger):
     target_group_id: int = DEFAULT_ID
 
@@ -5613,9 +6035,9 @@ def object_from_binary(
 
 
 def object_from_bytes(
-    data: bytes, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+    data: Buffer, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
 ) -> Object:
-    return object_from_binary(BytesIO(data), order, version)
+    return object_from_binary(BufferReader(data), order, version)
 
 
 def object_to_binary(
@@ -5800,27 +6222,14 @@ COLOR_TRIGGER_IDS = {
     COLOR_TRIGGER_ID,
 }
 
-PLAYER_COLOR_1_STRING = str(PLAYER_COLOR_1)
-PLAYER_COLOR_2_STRING = str(PLAYER_COLOR_2)
-
-PULSE_MODE_STRING = str(PULSE_MODE)
-
-COPIED_COLOR_ID_STRING = str(COPIED_COLOR_ID)
-
-PULSE_TARGET_TYPE_STRING = str(PULSE_TARGET_TYPE)
-
-ITEM_MODE_STRING = str(ITEM_MODE)
-
-USE_TARGET_STRING = str(USE_TARGET)
-
 
 DEFAULT_USE_TARGET = False
 
 
 def object_from_robtop(string: str) -> Object:
-    data = split_any_object(string)
+    data = split_object(string)
 
-    object_id = parse_get_or(int, DEFAULT_ID, data.get(ID_STRING))
+    object_id = parse_get_or(int, DEFAULT_ID, data.get(ID))
 
     if not object_id:
         raise ValueError(OBJECT_ID_NOT_PRESENT)
@@ -5828,12 +6237,8 @@ def object_from_robtop(string: str) -> Object:
     object_type: Type[Object]
 
     if object_id in COLOR_TRIGGER_IDS:
-        player_color_1 = parse_get_or(
-            int_bool, DEFAULT_PLAYER_COLOR_1, data.get(PLAYER_COLOR_1_STRING)
-        )
-        player_color_2 = parse_get_or(
-            int_bool, DEFAULT_PLAYER_COLOR_2, data.get(PLAYER_COLOR_2_STRING)
-        )
+        player_color_1 = parse_get_or(int_bool, DEFAULT_PLAYER_COLOR_1, data.get(PLAYER_COLOR_1))
+        player_color_2 = parse_get_or(int_bool, DEFAULT_PLAYER_COLOR_2, data.get(PLAYER_COLOR_2))
 
         player_color = compute_player_color(player_color_1, player_color_2)
 
@@ -5841,7 +6246,7 @@ def object_from_robtop(string: str) -> Object:
             object_type = PLAYER_COLOR_TRIGGER_MAPPING[object_id]  # type: ignore
 
         else:
-            copied_color_id = parse_get_or(int, DEFAULT_ID, data.get(COPIED_COLOR_ID_STRING))
+            copied_color_id = parse_get_or(int, DEFAULT_ID, data.get(COPIED_COLOR_ID))
 
             if copied_color_id:
                 object_type = COPIED_COLOR_TRIGGER_MAPPING[object_id]  # type: ignore
@@ -5850,7 +6255,7 @@ def object_from_robtop(string: str) -> Object:
                 object_type = NORMAL_COLOR_TRIGGER_MAPPING[object_id]  # type: ignore
 
     elif object_id == MOVE_TRIGGER_ID:
-        use_target = parse_get_or(int_bool, DEFAULT_USE_TARGET, data.get(USE_TARGET_STRING))
+        use_target = parse_get_or(int_bool, DEFAULT_USE_TARGET, data.get(USE_TARGET))
 
         if use_target:
             object_type = TargetMoveTrigger
@@ -5860,20 +6265,20 @@ def object_from_robtop(string: str) -> Object:
 
     elif object_id == PULSE_TRIGGER_ID:
         pulse_mode = parse_get_or(
-            partial_parse_enum(int, PulseMode), PulseMode.DEFAULT, data.get(PULSE_MODE_STRING)
+            partial_parse_enum(int, PulseMode), PulseMode.DEFAULT, data.get(PULSE_MODE)
         )
 
         pulse_target_type = parse_get_or(
             partial_parse_enum(int, PulseTargetType),
             PulseTargetType.DEFAULT,
-            data.get(PULSE_TARGET_TYPE_STRING),
+            data.get(PULSE_TARGET_TYPE),
         )
 
         object_type = PULSE_TRIGGER_MAPPING[pulse_mode, pulse_target_type]
 
     elif object_id in ITEM_IDS:
         item_mode = parse_get_or(
-            partial_parse_enum(int, ItemMode), ItemMode.DEFAULT, data.get(ITEM_MODE_STRING)
+            partial_parse_enum(int, ItemMode), ItemMode.DEFAULT, data.get(ITEM_MODE)
         )
 
         if item_mode.is_pickup():
@@ -5885,10 +6290,141 @@ def object_from_robtop(string: str) -> Object:
     else:
         object_type = OBJECT_ID_TO_TYPE.get(object_id, Object)
 
-    object = object_type.from_robtop(string)
+    # parse the data we have already split, instead of splitting the string again
+    object = object_type.from_robtop_data(data)
 
     return object
 
 
 def object_to_robtop(object: Object) -> str:
     return object.to_robtop()
+
+
+TRACKED_TYPES = (HSV, Groups)
+
+TRACKED: Dict[Type[Object], List[Unary[Object, Tracked]]] = {}
+
+
+def create_tracked(object_type: Type[Object]) -> List[Unary[Object, Tracked]]:
+    return [
+        peek_attribute_factory(object_type, attribute.name)
+        for attribute in fields(object_type)
+        if attribute.type in TRACKED_TYPES
+    ]
+
+
+def is_unchanged_since(object: Object, stamp: int) -> bool:
+    """Checks whether the `object`, including its groups and HSVs,
+    has not changed since the `stamp` (see [`get_changes`][gd.api.changes.get_changes]).
+    """
+    if object.stamp > stamp:
+        return False
+
+    object_type = type(object)
+
+    tracked = TRACKED.get(object_type)
+
+    if tracked is None:
+        tracked = TRACKED[object_type] = create_tracked(object_type)
+
+    for get_tracked in tracked:
+        if get_tracked(object).stamp > stamp:
+            return False
+
+    return True
+
+
+RobTopEntry = Tuple[Object, int, str]
+BinaryEntry = Tuple[Object, int, ByteOrder, int, bytes]
+
+PRUNE_FACTOR = 2
+
+
+@define()
+class ObjectCache:
+    """Represents caches of serialized objects, keyed by object identity.
+
+    The data is reused until the objects (or their groups and HSVs) change,
+    which is checked via stamps (see [`Object.stamp`][gd.api.objects.Object.stamp]);
+    the objects themselves do not hold any cached data.
+    """
+
+    strings: Dict[int, RobTopEntry] = field(factory=dict, repr=False)
+    data: Dict[int, BinaryEntry] = field(factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.strings) + len(self.data)
+
+    def store_robtop(self, object: Object, string: str) -> None:
+        """Stores the `string` as the serialized `object`, as of now."""
+        self.strings[id(object)] = (object, get_changes(), string)
+
+    def object_to_robtop(self, object: Object) -> str:
+        """Same as [`object_to_robtop`][gd.api.objects.object_to_robtop],
+        except the cached result is reused if the `object` has not changed.
+        """
+        entry = self.strings.get(id(object))
+
+        if entry is not None:
+            cached, stamp, string = entry
+
+            if cached is object and is_unchanged_since(object, stamp):
+                return string
+
+        stamp = get_changes()
+
+        string = object.to_robtop()
+
+        self.strings[id(object)] = (object, stamp, string)
+
+        return string
+
+    def object_to_binary(
+        self,
+        object: Object,
+        binary: BinaryWriter,
+        order: ByteOrder = ByteOrder.DEFAULT,
+        version: int = VERSION,
+    ) -> None:
+        """Same as [`object_to_binary`][gd.api.objects.object_to_binary],
+        except the cached result is reused if the `object` has not changed.
+        """
+        entry = self.data.get(id(object))
+
+        if entry is not None:
+            cached, stamp, cached_order, cached_version, data = entry
+
+            if (
+                cached is object
+                and cached_order is order
+                and cached_version == version
+                and is_unchanged_since(object, stamp)
+            ):
+                binary.write(data)
+
+                return
+
+        stamp = get_changes()
+
+        data = object_to_bytes(object, order, version)
+
+        self.data[id(object)] = (object, stamp, order, version, data)
+
+        binary.write(data)
+
+    def prune(self, objects: Collection[Object]) -> None:
+        """Drops the entries of objects other than `objects`, once there are too many of them."""
+        limit = len(objects) * PRUNE_FACTOR
+
+        strings = self.strings
+        data = self.data
+
+        if len(strings) > limit or len(data) > limit:
+            ids = set(map(id, objects))
+
+            self.strings = {key: entry for key, entry in strings.items() if key in ids}
+            self.data = {key: entry for key, entry in data.items() if key in ids}
+
+    def clear(self) -> None:
+        self.strings.clear()
+        self.data.clear()
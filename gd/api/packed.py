@@ -0,0 +1,418 @@
+from io import BytesIO
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from attrs import define, field
+from iters.iters import wrap_iter
+
+from gd.api.hsv import DEFAULT_HSV, HSV
+from gd.api.objects import (
+    DISABLE_GLOW_BIT,
+    DO_NOT_ENTER_BIT,
+    DO_NOT_FADE_BIT,
+    EMPTY_GROUPS,
+    GROUP_PARENT_BIT,
+    H_FLIPPED_BIT,
+    HIGH_DETAIL_BIT,
+    OBJECT_TYPE_TO_TYPE,
+    SPECIAL_CHECKED_BIT,
+    TYPE_TO_OBJECT_TYPE,
+    UNKNOWN_BIT,
+    V_FLIPPED_BIT,
+    Groups,
+    Object,
+    ObjectCache,
+    ObjectType,
+    object_to_binary,
+    peek_base_color_hsv,
+    peek_detail_color_hsv,
+    peek_groups,
+)
+from gd.binary import BinaryReader, BinaryWriter, BufferReader
+from gd.binary_constants import F32, I8, I16, U8, U8_SIZE, U16, U16_SIZE, U32, U32_SIZE
+from gd.binary_utils import Reader, Writer, get_struct
+from gd.constants import DEFAULT_ROUNDING
+from gd.enums import ByteOrder
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None  # type: ignore
+
+__all__ = ("PACKED_VERSION", "PackedObjects", "write_packed_objects")
+
+PACKED_VERSION = 2
+"""The first binary version that uses the packed format for objects."""
+
+OBJECT_VERSION = 1
+"""The version used to encode extra fields of objects in the extras table."""
+
+UNKNOWN_FLAG_BIT = UNKNOWN_BIT << 8
+
+FLAG_BITS = {
+    "h_flipped": H_FLIPPED_BIT,
+    "v_flipped": V_FLIPPED_BIT,
+    "do_not_fade": DO_NOT_FADE_BIT,
+    "do_not_enter": DO_NOT_ENTER_BIT,
+    "group_parent": GROUP_PARENT_BIT,
+    "high_detail": HIGH_DETAIL_BIT,
+    "disable_glow": DISABLE_GLOW_BIT,
+    "special_checked": SPECIAL_CHECKED_BIT,
+    "unknown": UNKNOWN_FLAG_BIT,
+}
+
+RECORD_FIELDS = (
+    ("type", U8),
+    ("id", U16),
+    ("x", F32),
+    ("y", F32),
+    ("rotation", F32),
+    ("scale", F32),
+    ("flags", U16),
+    ("z_layer", I8),
+    ("z_order", I16),
+    ("base_editor_layer", U16),
+    ("additional_editor_layer", U16),
+    ("base_color_id", U16),
+    ("detail_color_id", U16),
+    ("base_color_hsv", U32),
+    ("detail_color_hsv", U32),
+    ("link_id", U16),
+    ("group_start", U32),
+    ("group_count", U16),
+    ("extra_offset", U32),
+)
+
+RECORD_NAMES = tuple(name for name, _ in RECORD_FIELDS)
+RECORD = "".join(format for _, format in RECORD_FIELDS)
+
+RECORD_SIZE = get_struct(RECORD).size
+
+NO_EXTRA = 0xFFFFFFFF
+
+OBJECT_TYPE = ObjectType.OBJECT.value
+
+DEFAULT_HSV_VALUE = DEFAULT_HSV.to_value()
+
+UNKNOWN_RECORD_FIELD = "unknown record field: `{}`"
+NUMPY_REQUIRED = "`numpy` is required to view records as arrays"
+
+Record = Tuple[Any, ...]
+
+
+def read_view(binary: BinaryReader, size: int) -> memoryview:
+    if isinstance(binary, BufferReader):
+        return binary.read_view(size)
+
+    return memoryview(binary.read(size))
+
+
+P = TypeVar("P", bound="PackedObjects")
+
+
+@define()
+class PackedObjects(Sequence[Object]):
+    """Represents objects encoded in the packed binary format.
+
+    Every object is described by the fixed-stride record, which makes random access
+    and decoding of arbitrary ranges possible. Groups are stored in the side table,
+    referred to by `group_start` and `group_count`; objects that are not plain
+    (triggers, for instance) have the fields that do not fit the record encoded
+    in the extras table at `extra_offset`, as the sized entry.
+
+    Binary:
+        ```rust
+        struct PackedObjects {
+            records_length: u32,
+            records: [Record; records_length],
+            group_ids_length: u32,
+            group_ids: [u16; group_ids_length],
+            extras_size: u32,
+            extras: [u8; extras_size],  // `Extra` entries
+        }
+
+        struct Extra {
+            size: u32,
+            data: [u8; size],  // object fields following the ones of plain objects
+        }
+        ```
+    """
+
+    records: memoryview = field(repr=False)
+    group_ids: memoryview = field(repr=False)
+    extras: memoryview = field(repr=False)
+    order: ByteOrder = field(default=ByteOrder.DEFAULT)
+
+    @classmethod
+    def from_binary(cls: Type[P], binary: BinaryReader, order: ByteOrder = ByteOrder.DEFAULT) -> P:
+        """Reads packed objects; the tables are not copied if `binary` is
+        the [`BufferReader`][gd.binary.BufferReader].
+        """
+        reader = Reader(binary, order)
+
+        records_length = reader.read_u32()
+
+        records = read_view(binary, records_length * RECORD_SIZE)
+
+        group_ids_length = reader.read_u32()
+
+        group_ids = read_view(binary, group_ids_length * U16_SIZE)
+
+        extras_size = reader.read_u32()
+
+        extras = read_view(binary, extras_size)
+
+        return cls(records, group_ids, extras, order)
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD_SIZE
+
+    def __getitem__(self, index: int) -> Object:  # type: ignore
+        return self.get_object(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Object]:
+        return self.iter_objects().unwrap()
+
+    def get_record(self, index: int) -> Record:
+        return get_struct(RECORD, self.order).unpack_from(self.records, index * RECORD_SIZE)
+
+    def iter_records(self, start: int = 0, stop: int = -1) -> Iterator[Record]:
+        if stop < 0:
+            stop = len(self)
+
+        return get_struct(RECORD, self.order).iter_unpack(
+            self.records[start * RECORD_SIZE : stop * RECORD_SIZE]
+        )
+
+    def get_object(self, index: int) -> Object:
+        return self.object_from_record(self.get_record(index))
+
+    @wrap_iter
+    def iter_objects(self, start: int = 0, stop: int = -1) -> Iterator[Object]:
+        """Decodes objects in the `[start, stop)` range (until the end if `stop` is negative)."""
+        return map(self.object_from_record, self.iter_records(start, stop))
+
+    def objects(self, start: int = 0, stop: int = -1) -> List[Object]:
+        return self.iter_objects(start, stop).list()
+
+    def column(self, name: str) -> List[Any]:
+        """Returns the values of the record field named `name` (for instance, `x`).
+
+        Raises:
+            LookupError: The field is not found.
+        """
+        try:
+            position = RECORD_NAMES.index(name)
+
+        except ValueError:
+            raise LookupError(UNKNOWN_RECORD_FIELD.format(name)) from None
+
+        return [record[position] for record in self.iter_records()]
+
+    def numpy_records(self) -> Any:
+        """Returns the zero-copy NumPy structured array view of the records.
+
+        Raises:
+            RuntimeError: `numpy` is not installed.
+        """
+        if numpy is None:
+            raise RuntimeError(NUMPY_REQUIRED)
+
+        prefix = self.order.value
+
+        dtype = numpy.dtype([(name, prefix + format) for name, format in RECORD_FIELDS])
+
+        return numpy.frombuffer(self.records, dtype=dtype)
+
+    def get_hsv(self, value: int) -> HSV:
+        if value == DEFAULT_HSV_VALUE:
+            return DEFAULT_HSV
+
+        return HSV.from_value(value)
+
+    def get_groups(self, start: int, count: int) -> Groups:
+        if not count:
+            return EMPTY_GROUPS
+
+        return Groups.from_raw(
+            self.group_ids[start * U16_SIZE : (start + count) * U16_SIZE], self.order
+        )
+
+    def object_from_record(self, record: Record) -> Object:
+        (
+            type_value,
+            id,
+            x,
+            y,
+            rotation,
+            scale,
+            flags,
+            z_layer,
+            z_order,
+            base_editor_layer,
+            additional_editor_layer,
+            base_color_id,
+            detail_color_id,
+            base_color_hsv,
+            detail_color_hsv,
+            link_id,
+            group_start,
+            group_count,
+            extra_offset,
+        ) = record
+
+        rounding = DEFAULT_ROUNDING
+
+        object = Object(
+            id=id,
+            x=round(x, rounding),
+            y=round(y, rounding),
+            rotation=round(rotation, rounding),
+            scale=round(scale, rounding),
+            z_layer=z_layer,
+            z_order=z_order,
+            base_editor_layer=base_editor_layer,
+            additional_editor_layer=additional_editor_layer,
+            base_color_id=base_color_id,
+            detail_color_id=detail_color_id,
+            base_color_hsv=self.get_hsv(base_color_hsv),
+            detail_color_hsv=self.get_hsv(detail_color_hsv),
+            groups=self.get_groups(group_start, group_count),
+            link_id=link_id,
+            **{name: flags & bit == bit for name, bit in FLAG_BITS.items()},
+        )
+
+        if extra_offset == NO_EXTRA:
+            return object
+
+        return self.object_from_extra(object, type_value, extra_offset)
+
+    def object_from_extra(self, object: Object, type_value: int, extra_offset: int) -> Object:
+        """Decodes the non-plain object, given its plain part and the extra fields."""
+        order = self.order
+        extras = self.extras
+
+        (size,) = get_struct(U32, order).unpack_from(extras, extra_offset)
+
+        start = extra_offset + U32_SIZE
+
+        # the plain part is encoded back so that the extra fields can be read after it
+        binary = BytesIO()
+
+        object.to_binary(binary, order, OBJECT_VERSION)
+
+        binary.write(extras[start : start + size])
+
+        object_type = OBJECT_TYPE_TO_TYPE[ObjectType(type_value)]
+
+        return object_type.from_binary(BufferReader(binary.getvalue()), order, OBJECT_VERSION)
+
+
+def hsv_value(hsv: HSV) -> int:
+    return DEFAULT_HSV_VALUE if hsv is DEFAULT_HSV else hsv.to_value()
+
+
+ObjectToBinary = Callable[[Object, BinaryWriter, ByteOrder, int], None]
+
+
+def extra_to_bytes(object: Object, order: ByteOrder, convert: ObjectToBinary) -> bytes:
+    """Encodes the fields of the non-plain `object` that follow the ones of plain objects,
+    which are already stored in the record.
+    """
+    plain = BytesIO()
+
+    Object.to_binary(object, plain, order, OBJECT_VERSION)
+
+    binary = BytesIO()
+
+    convert(object, binary, order, OBJECT_VERSION)
+
+    # skip the object type and the plain part
+    return binary.getvalue()[U8_SIZE + plain.tell() :]
+
+
+def write_packed_objects(
+    objects: Iterable[Object],
+    binary: BinaryWriter,
+    order: ByteOrder = ByteOrder.DEFAULT,
+    cache: Optional[ObjectCache] = None,
+) -> None:
+    """Writes the `objects` using the packed format, described in
+    [`PackedObjects`][gd.api.packed.PackedObjects].
+
+    If the `cache` is given, extra fields of objects are encoded using it.
+    """
+    records = []
+    group_ids: List[int] = []
+    extras = BytesIO()
+
+    extras_writer = Writer(extras, order)
+
+    record_struct = get_struct(RECORD, order)
+    flag_bits = FLAG_BITS.items()
+
+    convert = object_to_binary if cache is None else cache.object_to_binary
+
+    for object in objects:
+        object_type = type(object)
+
+        if object_type is Object:
+            type_value = OBJECT_TYPE
+            extra_offset = NO_EXTRA
+
+        else:
+            extra_offset = extras.tell()
+
+            data = extra_to_bytes(object, order, convert)
+
+            extras_writer.write_u32(len(data))
+            extras_writer.write(data)
+
+            type_value = TYPE_TO_OBJECT_TYPE[object_type].value
+
+        flags = 0
+
+        for name, bit in flag_bits:
+            if getattr(object, name):
+                flags |= bit
+
+        groups = peek_groups(object)
+
+        records.append(
+            record_struct.pack(
+                type_value,
+                object.id,
+                object.x,
+                object.y,
+                object.rotation,
+                object.scale,
+                flags,
+                object.z_layer,
+                object.z_order,
+                object.base_editor_layer,
+                object.additional_editor_layer,
+                object.base_color_id,
+                object.detail_color_id,
+                hsv_value(peek_base_color_hsv(object)),
+                hsv_value(peek_detail_color_hsv(object)),
+                object.link_id,
+                len(group_ids),
+                len(groups),
+                extra_offset,
+            )
+        )
+
+        group_ids.extend(groups)
+
+    writer = Writer(binary, order)
+
+    writer.write_u32(len(records))
+    writer.write(b"".join(records))
+
+    writer.write_u32(len(group_ids))
+    writer.write_many(U16, group_ids)
+
+    data = extras.getvalue()
+
+    writer.write_u32(len(data))
+    writer.write(data)
@@ -7,9 +7,16 @@ from typing import Generic, Optional, Tuple, Type, TypeVar
 from attrs import define
 from typing_aliases import IntoPath
 
-# from gd.asyncio import run_blocking
+from gd.asyncio import run_cpu_bound
 from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS
-from gd.encoding import decode_save, decode_system_save, encode_save, encode_system_save
+from gd.encoding import (
+    DEFAULT_LEVEL,
+    DEFAULT_WORKERS,
+    decode_save,
+    decode_system_save,
+    encode_save,
+    encode_system_save,
+)
 from gd.enums import Platform
 from gd.platform import SYSTEM_PLATFORM
 
@@ -105,18 +112,31 @@ class SaveManager(Generic[D]):
     database_type: Type[D]
     main_name: str = MAIN_NAME
     levels_name: str = LEVELS_NAME
+    level: int = DEFAULT_LEVEL
+    """The compression level to use when saving."""
+    workers: Optional[int] = DEFAULT_WORKERS
+    """The number of threads to compress large saves with; saves are compressed serially
+    by default (see [`compress`][gd.encoding.compress]).
+    """
 
     def create_database(self) -> D:
         return self.database_type()
 
-    def load(self, main: Optional[IntoPath] = None, levels: Optional[IntoPath] = None) -> D:
+    def load(
+        self,
+        main: Optional[IntoPath] = None,
+        levels: Optional[IntoPath] = None,
+        lazy: bool = False,
+    ) -> D:
         main_path = self.compute_path(main, self.main_name)
         levels_path = self.compute_path(levels, self.levels_name)
 
         main_data = main_path.read_bytes()
         levels_data = levels_path.read_bytes()
 
-        return self.load_parts(main_data, levels_data, apply_xor=True, follow_system=True)
+        return self.load_parts(
+            main_data, levels_data, apply_xor=True, follow_system=True, lazy=lazy
+        )
 
     def dump(
         self,
@@ -132,17 +152,40 @@ class SaveManager(Generic[D]):
         main_path.write_bytes(main_data)
         levels_path.write_bytes(levels_data)
 
+    async def load_async(
+        self,
+        main: Optional[IntoPath] = None,
+        levels: Optional[IntoPath] = None,
+        lazy: bool = False,
+    ) -> D:
+        """Same as [`load`][gd.api.save_manager.SaveManager.load], except reading and decoding
+        are offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        return await run_cpu_bound(self.load, main, levels, lazy)
+
+    async def dump_async(
+        self,
+        database: Database,
+        main: Optional[IntoPath] = None,
+        levels: Optional[IntoPath] = None,
+    ) -> None:
+        """Same as [`dump`][gd.api.save_manager.SaveManager.dump], except encoding and writing
+        are offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        await run_cpu_bound(self.dump, database, main, levels)
+
     def load_parts(
         self,
         main_data: bytes,
         levels_data: bytes,
         apply_xor: bool = False,
         follow_system: bool = False,
+        lazy: bool = False,
     ) -> D:
         main = self.decode_data(main_data, apply_xor=apply_xor, follow_system=follow_system)
         levels = self.decode_data(levels_data, apply_xor=apply_xor, follow_system=follow_system)
 
-        return self.database_type.load_parts(main, levels)
+        return self.database_type.load_parts(main, levels, lazy=lazy)
 
     def load_string_parts(
         self,
@@ -152,12 +195,14 @@ class SaveManager(Generic[D]):
         errors: str = DEFAULT_ERRORS,
         apply_xor: bool = False,
         follow_system: bool = False,
+        lazy: bool = False,
     ) -> D:
         return self.load_parts(
             main_string.encode(encoding, errors),
             levels_string.encode(encoding, errors),
             apply_xor=apply_xor,
             follow_system=follow_system,
+            lazy=lazy,
         )
 
     def dump_parts(
@@ -218,7 +263,7 @@ class SaveManager(Generic[D]):
     ) -> bytes:
         encode = encode_system_save if follow_system else encode_save
 
-        return encode(data, apply_xor=apply_xor)
+        return encode(data, apply_xor=apply_xor, level=self.level, workers=self.workers)
 
 
 from gd.api.database.database import Database
@@ -0,0 +1,308 @@
+from math import cos, radians, sin
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from attrs import define, field
+from typing_aliases import Unary, is_instance
+
+from gd.api.hsv import DEFAULT_HSV, HSV, intern_hsv
+from gd.api.objects import Object
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None  # type: ignore
+
+if TYPE_CHECKING:
+    from gd.api.editor import Editor
+
+__all__ = ("Selection",)
+
+Points = Tuple[Sequence[float], Sequence[float]]
+
+REBUILD_RATIO = 8
+"""Moving more than `1 / REBUILD_RATIO` of the indexed objects rebuilds the spatial index."""
+
+S = TypeVar("S", bound="Selection")
+
+
+def shared_or_copy(hsv: HSV) -> HSV:
+    # objects copy the default HSV before it is changed, so it can be assigned to many objects
+    return hsv if hsv is DEFAULT_HSV else hsv.copy()
+
+
+def to_floats(values: Iterable[float]) -> List[float]:
+    if numpy is not None and is_instance(values, numpy.ndarray):
+        return values.astype(float, copy=False).tolist()  # converts all values at once
+
+    return [float(value) for value in values]
+
+
+def move_points(xs: Sequence[float], ys: Sequence[float], x: float, y: float) -> Points:
+    if numpy is None:
+        return ([value + x for value in xs], [value + y for value in ys])
+
+    return (numpy.asarray(xs) + x, numpy.asarray(ys) + y)
+
+
+def rotate_points(
+    xs: Sequence[float], ys: Sequence[float], angle: float, pivot_x: float, pivot_y: float
+) -> Points:
+    # positive angles rotate clockwise, like the rotation of objects does
+    angle = radians(angle)
+
+    angle_cos = cos(angle)
+    angle_sin = sin(angle)
+
+    if numpy is None:
+        rotated_xs = []
+        rotated_ys = []
+
+        for x, y in zip(xs, ys):
+            delta_x = x - pivot_x
+            delta_y = y - pivot_y
+
+            rotated_xs.append(pivot_x + delta_x * angle_cos + delta_y * angle_sin)
+            rotated_ys.append(pivot_y - delta_x * angle_sin + delta_y * angle_cos)
+
+        return (rotated_xs, rotated_ys)
+
+    delta_xs = numpy.asarray(xs) - pivot_x
+    delta_ys = numpy.asarray(ys) - pivot_y
+
+    return (
+        pivot_x + delta_xs * angle_cos + delta_ys * angle_sin,
+        pivot_y - delta_xs * angle_sin + delta_ys * angle_cos,
+    )
+
+
+def scale_points(
+    xs: Sequence[float], ys: Sequence[float], scale: float, pivot_x: float, pivot_y: float
+) -> Points:
+    if numpy is None:
+        return (
+            [pivot_x + (x - pivot_x) * scale for x in xs],
+            [pivot_y + (y - pivot_y) * scale for y in ys],
+        )
+
+    return (
+        pivot_x + (numpy.asarray(xs) - pivot_x) * scale,
+        pivot_y + (numpy.asarray(ys) - pivot_y) * scale,
+    )
+
+
+def mirror_values(values: Sequence[float], pivot: float) -> Sequence[float]:
+    if numpy is None:
+        return [pivot + pivot - value for value in values]
+
+    return (pivot + pivot) - numpy.asarray(values)
+
+
+@define()
+class Selection:
+    """Represents selections of objects within editors, supporting bulk transforms.
+
+    Coordinates are transformed in batches (using `numpy` if it is installed),
+    and the affected indexes of the editor are updated in place, while the other ones are kept.
+    """
+
+    editor: "Editor" = field(repr=False)
+    objects: List[Object] = field(factory=list)
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def __iter__(self) -> Iterator[Object]:
+        return iter(self.objects)
+
+    def __bool__(self) -> bool:
+        return bool(self.objects)
+
+    @property
+    def xs(self) -> List[float]:
+        return [object.x for object in self.objects]
+
+    @property
+    def ys(self) -> List[float]:
+        return [object.y for object in self.objects]
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """The center of the bounding box of the selection."""
+        xs = self.xs
+        ys = self.ys
+
+        if not xs:
+            return (0.0, 0.0)
+
+        return ((min(xs) + max(xs)) / 2.0, (min(ys) + max(ys)) / 2.0)
+
+    def resolve_pivot(
+        self, pivot_x: Optional[float], pivot_y: Optional[float]
+    ) -> Tuple[float, float]:
+        center_x, center_y = self.center
+
+        return (
+            center_x if pivot_x is None else pivot_x,
+            center_y if pivot_y is None else pivot_y,
+        )
+
+    def place(self, xs: Iterable[float], ys: Iterable[float]) -> None:
+        editor = self.editor
+
+        editor.check_indexes()
+
+        objects = self.objects
+
+        spatial_index = editor.spatial_index_option
+
+        if spatial_index is not None:
+            if len(objects) * REBUILD_RATIO > len(spatial_index):
+                # rebuilding the index (sorting once) is faster than moving many objects one by one
+                spatial_index = editor.spatial_index_option = None
+
+            else:
+                # objects are removed before they are moved, as the index looks them up by position
+                spatial_index.remove_objects(objects)
+
+        for object, x, y in zip(objects, to_floats(xs), to_floats(ys)):
+            object.x = x
+            object.y = y
+
+        if spatial_index is not None:
+            spatial_index.add_objects(objects)
+
+        editor.sync_indexes()
+
+    def apply(self, function: Unary[Object, Any]) -> None:
+        """Applies the `function` to each object of the selection.
+
+        The `function` must not change anything the indexes depend on, since they are kept.
+        """
+        editor = self.editor
+
+        editor.check_indexes()
+
+        for object in self.objects:
+            function(object)
+
+        editor.sync_indexes()
+
+    def move(self: S, x: float = 0.0, y: float = 0.0) -> S:
+        self.place(*move_points(self.xs, self.ys, x, y))
+
+        return self
+
+    def rotate(
+        self: S, angle: float, pivot_x: Optional[float] = None, pivot_y: Optional[float] = None
+    ) -> S:
+        """Rotates the selection by `angle` degrees (clockwise) around the pivot,
+        which defaults to the [`center`][gd.api.selection.Selection.center].
+        """
+        pivot_x, pivot_y = self.resolve_pivot(pivot_x, pivot_y)
+
+        self.place(*rotate_points(self.xs, self.ys, angle, pivot_x, pivot_y))
+
+        self.apply(lambda object: object.rotate(angle))
+
+        return self
+
+    def scale_by(
+        self: S, scale: float, pivot_x: Optional[float] = None, pivot_y: Optional[float] = None
+    ) -> S:
+        """Scales the selection by `scale` relative to the pivot,
+        which defaults to the [`center`][gd.api.selection.Selection.center].
+        """
+        pivot_x, pivot_y = self.resolve_pivot(pivot_x, pivot_y)
+
+        self.place(*scale_points(self.xs, self.ys, scale, pivot_x, pivot_y))
+
+        self.apply(lambda object: object.scale_by(scale))
+
+        return self
+
+    def h_flip(self: S, pivot_x: Optional[float] = None) -> S:
+        """Flips the selection horizontally around the vertical line through `pivot_x`."""
+        pivot_x, _ = self.resolve_pivot(pivot_x, None)
+
+        self.place(mirror_values(self.xs, pivot_x), self.ys)
+
+        self.apply(lambda object: object.h_flip())
+
+        return self
+
+    def v_flip(self: S, pivot_y: Optional[float] = None) -> S:
+        """Flips the selection vertically around the horizontal line through `pivot_y`."""
+        _, pivot_y = self.resolve_pivot(None, pivot_y)
+
+        self.place(self.xs, mirror_values(self.ys, pivot_y))
+
+        self.apply(lambda object: object.v_flip())
+
+        return self
+
+    def recolor(self: S, *, base: Optional[int] = None, detail: Optional[int] = None) -> S:
+        editor = self.editor
+
+        editor.check_indexes()
+
+        color_index = editor.color_index_option
+
+        for object in self.objects:
+            if color_index is not None:
+                color_index.remove(object, (object.base_color_id, object.detail_color_id))
+
+            if base is not None:
+                object.base_color_id = base
+
+            if detail is not None:
+                object.detail_color_id = detail
+
+            if color_index is not None:
+                color_index.add(object, (object.base_color_id, object.detail_color_id))
+
+        editor.sync_indexes()
+
+        return self
+
+    def set_base_color_id(self: S, color_id: int) -> S:
+        return self.recolor(base=color_id)
+
+    def set_detail_color_id(self: S, color_id: int) -> S:
+        return self.recolor(detail=color_id)
+
+    def set_base_color_hsv(self: S, hsv: HSV) -> S:
+        hsv = intern_hsv(hsv)
+
+        def set_hsv(object: Object) -> None:
+            object.base_color_hsv = shared_or_copy(hsv)
+
+        self.apply(set_hsv)
+
+        return self
+
+    def set_detail_color_hsv(self: S, hsv: HSV) -> S:
+        hsv = intern_hsv(hsv)
+
+        def set_hsv(object: Object) -> None:
+            object.detail_color_hsv = shared_or_copy(hsv)
+
+        self.apply(set_hsv)
+
+        return self
+
+    def set_z_layer(self: S, z_layer: int) -> S:
+        def set_z_layer(object: Object) -> None:
+            object.z_layer = z_layer
+
+        self.apply(set_z_layer)
+
+        return self
+
+    def set_z_order(self: S, z_order: int) -> S:
+        def set_z_order(object: Object) -> None:
+            object.z_order = z_order
+
+        self.apply(set_z_order)
+
+        return self
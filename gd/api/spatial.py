@@ -0,0 +1,244 @@
+from bisect import bisect_left, bisect_right
+from heapq import nsmallest
+from math import floor, hypot
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from attrs import define, field
+from iters.iters import wrap_iter
+
+from gd.api.objects import Object
+
+__all__ = ("SpatialIndex",)
+
+DEFAULT_CELL_SIZE = 150.0  # 5 blocks
+
+CELL_SIZE_MUST_BE_POSITIVE = "cell size must be positive"
+OBJECT_NOT_INDEXED = "object is not indexed"
+
+Cell = Tuple[int, int]
+
+S = TypeVar("S", bound="SpatialIndex")
+
+
+@define()
+class SpatialIndex:
+    """Represents spatial indexes over objects.
+
+    Objects are kept sorted by their `x` coordinate (queried with binary search),
+    and are bucketed into the uniform grid of square cells of `cell_size` units.
+
+    Objects are tracked by identity; therefore, objects need to be removed before
+    their position is changed, and then added back.
+    """
+
+    cell_size: float = field(default=DEFAULT_CELL_SIZE)
+
+    xs: List[float] = field(factory=list, init=False, repr=False)
+    ordered: List[Object] = field(factory=list, init=False, repr=False)
+    cells: Dict[Cell, List[Object]] = field(factory=dict, init=False, repr=False)
+
+    @cell_size.validator
+    def check_cell_size(self, attribute: object, cell_size: float) -> None:
+        if cell_size <= 0.0:
+            raise ValueError(CELL_SIZE_MUST_BE_POSITIVE)
+
+    @classmethod
+    def from_objects(cls: Type[S], *objects: Object) -> S:
+        return cls.from_object_iterable(objects)
+
+    @classmethod
+    def from_object_iterable(
+        cls: Type[S], objects: Iterable[Object], cell_size: float = DEFAULT_CELL_SIZE
+    ) -> S:
+        index = cls(cell_size)
+
+        # sorting once is faster than inserting objects one by one
+        ordered = sorted(objects, key=get_x)
+
+        index.ordered = ordered
+        index.xs = [object.x for object in ordered]
+
+        cells = index.cells
+
+        for object in ordered:
+            cells.setdefault(index.cell_of(object.x, object.y), []).append(object)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self.ordered)
+
+    def __iter__(self) -> Iterator[Object]:
+        return iter(self.ordered)
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        cell_size = self.cell_size
+
+        return (floor(x / cell_size), floor(y / cell_size))
+
+    def add(self, object: Object) -> None:
+        x = object.x
+
+        position = bisect_right(self.xs, x)
+
+        self.xs.insert(position, x)
+        self.ordered.insert(position, object)
+
+        self.cells.setdefault(self.cell_of(x, object.y), []).append(object)
+
+    def add_objects(self, objects: Iterable[Object]) -> None:
+        for object in objects:
+            self.add(object)
+
+    def remove(self, object: Object) -> None:
+        """Removes the `object` from the index.
+
+        Raises:
+            ValueError: The object is not indexed.
+        """
+        x = object.x
+
+        xs = self.xs
+        ordered = self.ordered
+
+        for position in range(bisect_left(xs, x), bisect_right(xs, x)):
+            if ordered[position] is object:
+                del xs[position]
+                del ordered[position]
+
+                break
+
+        else:
+            raise ValueError(OBJECT_NOT_INDEXED)
+
+        cell = self.cell_of(x, object.y)
+
+        bucket = self.cells[cell]
+
+        for position, item in enumerate(bucket):
+            if item is object:
+                del bucket[position]
+
+                break
+
+        if not bucket:
+            del self.cells[cell]
+
+    def remove_objects(self, objects: Iterable[Object]) -> None:
+        for object in objects:
+            self.remove(object)
+
+    def clear(self) -> None:
+        self.xs.clear()
+        self.ordered.clear()
+        self.cells.clear()
+
+    @property
+    def x_start(self) -> Optional[float]:
+        xs = self.xs
+
+        return xs[0] if xs else None
+
+    @property
+    def x_end(self) -> Optional[float]:
+        xs = self.xs
+
+        return xs[-1] if xs else None
+
+    def between(self, x_start: float, x_end: float) -> List[Object]:
+        """Returns the objects with `x_start <= x <= x_end`, sorted by `x`."""
+        xs = self.xs
+
+        return self.ordered[bisect_left(xs, x_start) : bisect_right(xs, x_end)]
+
+    @wrap_iter
+    def iter_in_rectangle(
+        self, x_start: float, y_start: float, x_end: float, y_end: float
+    ) -> Iterator[Object]:
+        cells = self.cells
+
+        cell_x_start, cell_y_start = self.cell_of(x_start, y_start)
+        cell_x_end, cell_y_end = self.cell_of(x_end, y_end)
+
+        if (cell_x_end - cell_x_start + 1) * (cell_y_end - cell_y_start + 1) > len(cells):
+            # there are fewer occupied cells than the cells to look at
+            candidates: Iterable[Object] = self.between(x_start, x_end)
+
+        else:
+            candidates = (
+                object
+                for cell_x in range(cell_x_start, cell_x_end + 1)
+                for cell_y in range(cell_y_start, cell_y_end + 1)
+                for object in cells.get((cell_x, cell_y), ())
+            )
+
+        for object in candidates:
+            if x_start <= object.x <= x_end and y_start <= object.y <= y_end:
+                yield object
+
+    def in_rectangle(
+        self, x_start: float, y_start: float, x_end: float, y_end: float
+    ) -> List[Object]:
+        """Returns the objects inside the given rectangle (bounds included)."""
+        return self.iter_in_rectangle(x_start, y_start, x_end, y_end).list()
+
+    def nearest(self, x: float, y: float, count: int = 1) -> List[Object]:
+        """Returns up to `count` objects nearest to the `(x, y)` point, closest first."""
+        if count < 1:
+            return []
+
+        cells = self.cells
+        cell_size = self.cell_size
+
+        total = len(self)
+
+        cell_x, cell_y = self.cell_of(x, y)
+
+        candidates: List[Object] = []
+
+        radius = 0
+
+        def distance(object: Object) -> float:
+            return hypot(object.x - x, object.y - y)
+
+        while len(candidates) < total:
+            for ring_x, ring_y in iter_ring(cell_x, cell_y, radius):
+                candidates.extend(cells.get((ring_x, ring_y), ()))
+
+            if len(candidates) >= count:
+                best = nsmallest(count, candidates, key=distance)
+
+                # every object outside the searched square is at least this far away
+                if distance(best[-1]) <= radius * cell_size:
+                    return best
+
+            radius += 1
+
+            if radius * radius > len(cells) * 4 and radius > 1:
+                break  # sparse grid: visiting rings one by one gets slower than scanning
+
+        return nsmallest(count, self.ordered, key=distance)
+
+
+def iter_ring(center_x: int, center_y: int, radius: int) -> Iterator[Cell]:
+    if not radius:
+        yield (center_x, center_y)
+
+        return
+
+    x_start = center_x - radius
+    x_end = center_x + radius
+    y_start = center_y - radius
+    y_end = center_y + radius
+
+    for x in range(x_start, x_end + 1):
+        yield (x, y_start)
+        yield (x, y_end)
+
+    for y in range(y_start + 1, y_end):
+        yield (x_start, y)
+        yield (x_end, y)
+
+
+def get_x(object: Object) -> float:
+    return object.x
@@ -1,24 +1,87 @@
 from asyncio import AbstractEventLoop, all_tasks, get_running_loop
-from typing import Callable, TypeVar
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 
-from typing_aliases import NormalError, Nullary
+from funcs.application import partial
+from typing_aliases import NormalError
 from typing_extensions import ParamSpec
 
-__all__ = ("run_blocking", "cancel_all_tasks", "shutdown_loop")
+__all__ = (
+    "run_blocking",
+    "run_cpu_bound",
+    "get_executor",
+    "set_executor",
+    "shutdown_executor",
+    "cancel_all_tasks",
+    "shutdown_loop",
+)
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+THREAD_NAME_PREFIX = "gd"
+
+executor_option: Optional[Executor] = None
+
+
+def get_executor() -> Executor:
+    """Returns the executor used by [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+
+    Unless configured via [`set_executor`][gd.asyncio.set_executor],
+    the thread pool owned by the library is created on first use.
+    """
+    global executor_option
+
+    executor = executor_option
+
+    if executor is None:
+        executor = executor_option = ThreadPoolExecutor(thread_name_prefix=THREAD_NAME_PREFIX)
+
+    return executor
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """Sets the `executor` used by [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+
+    Process pools are supported, since only CPU-bound work that can be pickled is offloaded
+    this way; blocking I/O is always run via [`run_blocking`][gd.asyncio.run_blocking].
+    Passing [`None`][None] resets to the default thread pool.
+
+    The previous executor is not shut down.
+    """
+    global executor_option
+
+    executor_option = executor
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shuts down the current executor; the default one is created again on next use."""
+    global executor_option
+
+    executor = executor_option
+
+    executor_option = None
+
+    if executor is not None:
+        executor.shutdown(wait)
+
 
 async def run_blocking(function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
-    return await get_running_loop().run_in_executor(None, call_function(function, *args, **kwargs))
+    """Runs the blocking `function` with `args` and `kwargs` in the default executor
+    of the running loop.
+    """
+    return await get_running_loop().run_in_executor(None, partial(function, *args, **kwargs))
 
 
-def call_function(function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> Nullary[T]:
-    def call() -> T:
-        return function(*args, **kwargs)
+async def run_cpu_bound(function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Runs the CPU-bound `function` with `args` and `kwargs` in the configured executor
+    (see [`set_executor`][gd.asyncio.set_executor]).
 
-    return call
+    The `function` and its arguments need to be picklable if the executor is the process pool.
+    """
+    return await get_running_loop().run_in_executor(
+        get_executor(), partial(function, *args, **kwargs)
+    )
 
 
 def cancel_all_tasks(loop: AbstractEventLoop) -> None:
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from abc import abstractmethod as required
 from io import BytesIO
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from typing import Any, Optional, Type, TypeVar
+from struct import Struct
+from types import TracebackType
+from typing import Any, Optional, Tuple, Type, TypeVar, Union
 
-from attrs import Attribute, field, frozen
+from attrs import Attribute, define, field, frozen, setters
 from typing_aliases import IntoPath, is_instance
 from typing_extensions import Protocol, TypeGuard, runtime_checkable
 
@@ -17,6 +20,7 @@ __all__ = (
     "VERSION",
     "BinaryReader",
     "BinaryWriter",
+    "BufferReader",
     "Binary",
     "FromBinary",
     "ToBinary",
@@ -28,9 +32,10 @@ __all__ = (
     "load",
     "load_from",
     "load_bytes",
+    "load_buffer",
 )
 
-VERSION = 1
+VERSION = 2
 
 B = TypeVar("B", bound="FromBinary")
 
@@ -49,8 +54,119 @@ class BinaryWriter(Protocol):
         ...
 
 
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+BYTE_FORMAT = "B"
+
+EMPTY_BYTES = bytes()
+
+
+def byte_view(buffer: Buffer) -> memoryview:
+    return memoryview(buffer).cast(BYTE_FORMAT)
+
+
+R = TypeVar("R", bound="BufferReader")
+
+
+@define(on_setattr=setters.NO_OP)  # offsets are updated all the time; skip the hooks
+class BufferReader:
+    """Represents zero-copy readers over buffers, like `bytes`, `bytearray` and `mmap`.
+
+    Values are unpacked straight from the underlying memory, and data is only copied
+    when [`read`][gd.binary.BufferReader.read] materializes it into `bytes`.
+    """
+
+    view: memoryview = field(converter=byte_view)
+    offset: int = field(default=0)
+
+    source: Optional[mmap] = field(default=None, repr=False)
+
+    @classmethod
+    def open(cls: Type[R], path: IntoPath) -> R:
+        """Maps the file at `path` into memory, without reading it all at once.
+
+        The reader should be closed (or used as the context manager) afterwards.
+        """
+        with Path(path).open(READ_BINARY) as file:
+            try:
+                source = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+            except ValueError:  # empty files can not be mapped
+                return cls(EMPTY_BYTES)
+
+        return cls(source, source=source)
+
+    def __enter__(self: R) -> R:
+        return self
+
+    def __exit__(
+        self,
+        error_type: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the view and closes the underlying `mmap`, if any.
+
+        Views returned from [`read_view`][gd.binary.BufferReader.read_view]
+        need to be released beforehand.
+        """
+        self.view.release()
+
+        source = self.source
+
+        if source is not None:
+            source.close()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    @property
+    def remaining(self) -> int:
+        return len(self.view) - self.offset
+
+    def tell(self) -> int:
+        return self.offset
+
+    def seek(self, offset: int) -> int:
+        self.offset = min(max(offset, 0), len(self.view))
+
+        return self.offset
+
+    def skip(self, size: int) -> None:
+        self.seek(self.offset + size)
+
+    def read_view(self, size: int = DEFAULT_SIZE) -> memoryview:
+        """Reads up to `size` bytes (or everything left, if `size` is negative) without copying."""
+        offset = self.offset
+        length = len(self.view)
+
+        end = length if size < 0 else min(offset + size, length)
+
+        self.offset = end
+
+        return self.view[offset:end]
+
+    def read(self, size: int = DEFAULT_SIZE) -> bytes:
+        return self.read_view(size).tobytes()
+
+    def unpack(self, struct: Struct) -> Tuple[Any, ...]:
+        """Unpacks the `struct` in place, advancing the offset by its size."""
+        offset = self.offset
+
+        values = struct.unpack_from(self.view, offset)
+
+        self.offset = offset + struct.size
+
+        return values
+
+
 @runtime_checkable
 class FromBinary(Protocol):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_binary(
@@ -67,12 +183,12 @@ class FromBinary(Protocol):
 
     @classmethod
     def from_bytes(
-        cls: Type[B], data: bytes, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
+        cls: Type[B], data: Buffer, order: ByteOrder = ByteOrder.DEFAULT, version: int = VERSION
     ) -> B:
-        return cls.from_binary(BytesIO(data), order, version)
+        return cls.from_binary(BufferReader(data), order, version)
 
     @classmethod
-    def from_bytes_with_info(cls: Type[B], data: bytes, info: BinaryInfo) -> B:
+    def from_bytes_with_info(cls: Type[B], data: Buffer, info: BinaryInfo) -> B:
         return cls.from_bytes(data, info.order, info.version)
 
 
@@ -82,6 +198,8 @@ def is_from_binary(item: Any) -> TypeGuard[FromBinary]:
 
 @runtime_checkable
 class ToBinary(Protocol):
+    __slots__ = ()
+
     @required
     def to_binary(
         self,
@@ -113,7 +231,7 @@ def is_to_binary(item: Any) -> TypeGuard[ToBinary]:
 
 @runtime_checkable
 class Binary(FromBinary, ToBinary, Protocol):
-    pass
+    __slots__ = ()
 
 
 BI = TypeVar("BI", bound="BinaryInfo")
@@ -209,12 +327,18 @@ def load(binary: BinaryReader, type: Type[B], info_type: Type[BinaryInfo] = Bina
 
 
 def load_from(path: IntoPath, type: Type[B], info_type: Type[BinaryInfo] = BinaryInfo) -> B:
-    with Path(path).open(READ_BINARY) as file:
-        return load(file, type, info_type)
+    # decompress straight from the mapped file instead of reading it first
+    with BufferReader.open(path) as reader:
+        return load_bytes(reader.view, type, info_type)
+
+
+def load_bytes(data: Buffer, type: Type[B], info_type: Type[BinaryInfo] = BinaryInfo) -> B:
+    return load_buffer(decompress(data), type, info_type)
 
 
-def load_bytes(data: bytes, type: Type[B], info_type: Type[BinaryInfo] = BinaryInfo) -> B:
-    binary = BytesIO(decompress(data))
+def load_buffer(data: Buffer, type: Type[B], info_type: Type[BinaryInfo] = BinaryInfo) -> B:
+    """Loads the item from the uncompressed `data`, without copying it."""
+    binary = BufferReader(data)
 
     info = info_type.from_binary(binary)
 
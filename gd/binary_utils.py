@@ -1,42 +1,21 @@
 from __future__ import annotations
 
-from struct import pack, unpack
-from typing import Any, Generic, TypeVar
+from struct import Struct
+from typing import Any, Dict, Generic, Sequence, Tuple, TypeVar
 
 from attrs import Attribute, field, frozen
-from iters.utils import unpack_unary_tuple
-from typing_aliases import Binary
-
-from gd.binary import BinaryReader, BinaryWriter
-from gd.binary_constants import (
-    BOOL,
-    F32,
-    F32_SIZE,
-    F64,
-    F64_SIZE,
-    I8,
-    I8_SIZE,
-    I16,
-    I16_SIZE,
-    I32,
-    I32_SIZE,
-    I64,
-    I64_SIZE,
-    U8,
-    U8_SIZE,
-    U16,
-    U16_SIZE,
-    U32,
-    U32_SIZE,
-    U64,
-    U64_SIZE,
-)
+from typing_aliases import Binary, is_instance
+
+from gd.binary import BinaryReader, BinaryWriter, BufferReader
+from gd.binary_constants import BOOL, F32, F64, I8, I16, I32, I64, U8, U16, U32, U64
 from gd.enums import ByteOrder
 
 __all__ = (
     # reader, writer
     "Reader",
     "Writer",
+    # structs
+    "get_struct",
     # from ints
     "from_i8",
     "from_u8",
@@ -64,44 +43,82 @@ __all__ = (
 )
 
 
+MAX_STRUCTS = 1024
+
+LITTLE = ByteOrder.LITTLE
+BIG = ByteOrder.BIG
+
+Structs = Dict[str, Struct]
+
+LITTLE_STRUCTS: Structs = {}
+BIG_STRUCTS: Structs = {}
+NATIVE_STRUCTS: Structs = {}
+
+
+def get_struct(format: str, order: ByteOrder = ByteOrder.DEFAULT) -> Struct:
+    """Returns the compiled struct for the `format` in the given byte `order`.
+
+    Structs are cached, so that formats are only parsed once.
+    """
+    # identity checks are way cheaper than hashing enum members
+    if order is LITTLE:
+        structs = LITTLE_STRUCTS
+
+    elif order is BIG:
+        structs = BIG_STRUCTS
+
+    else:
+        structs = NATIVE_STRUCTS
+
+    struct = structs.get(format)
+
+    if struct is None:
+        struct = Struct(order.value + format)
+
+        if len(structs) < MAX_STRUCTS:
+            structs[format] = struct
+
+    return struct
+
+
 def create_from_int(format: str) -> Binary[bytes, ByteOrder, int]:
     def from_int(data: bytes, order: ByteOrder = ByteOrder.DEFAULT) -> int:
-        return unpack_unary_tuple(unpack(order.value + format, data))  # type: ignore
+        return get_struct(format, order).unpack(data)[0]
 
     return from_int
 
 
 def create_to_int(format: str) -> Binary[int, ByteOrder, bytes]:
     def to_int(value: int, order: ByteOrder = ByteOrder.DEFAULT) -> bytes:
-        return pack(order.value + format, value)
+        return get_struct(format, order).pack(value)
 
     return to_int
 
 
 def create_from_float(format: str) -> Binary[bytes, ByteOrder, float]:
     def from_float(data: bytes, order: ByteOrder = ByteOrder.DEFAULT) -> float:
-        return unpack_unary_tuple(unpack(order.value + format, data))  # type: ignore
+        return get_struct(format, order).unpack(data)[0]
 
     return from_float
 
 
 def create_to_float(format: str) -> Binary[float, ByteOrder, bytes]:
     def to_float(value: float, order: ByteOrder = ByteOrder.DEFAULT) -> bytes:
-        return pack(order.value + format, value)
+        return get_struct(format, order).pack(value)
 
     return to_float
 
 
 def create_from_bool(format: str) -> Binary[bytes, ByteOrder, bool]:
     def from_bool(data: bytes, order: ByteOrder = ByteOrder.DEFAULT) -> bool:
-        return unpack_unary_tuple(unpack(order.value + format, data))  # type: ignore
+        return get_struct(format, order).unpack(data)[0]
 
     return from_bool
 
 
 def create_to_bool(format: str) -> Binary[bool, ByteOrder, bytes]:
     def to_bool(value: bool, order: ByteOrder = ByteOrder.DEFAULT) -> bytes:
-        return pack(order.value + format, value)
+        return get_struct(format, order).pack(value)
 
     return to_bool
 
@@ -151,34 +168,53 @@ class Reader(Generic[R]):
             raise ValueError(NATIVE_NOT_ALLOWED)
 
     def read_i8(self) -> int:
-        return from_i8(self.read(I8_SIZE), self.order)
+        return self.unpack_record(I8)[0]
 
     def read_u8(self) -> int:
-        return from_u8(self.read(U8_SIZE), self.order)
+        return self.unpack_record(U8)[0]
 
     def read_i16(self) -> int:
-        return from_i16(self.read(I16_SIZE), self.order)
+        return self.unpack_record(I16)[0]
 
     def read_u16(self) -> int:
-        return from_u16(self.read(U16_SIZE), self.order)
+        return self.unpack_record(U16)[0]
 
     def read_i32(self) -> int:
-        return from_i32(self.read(I32_SIZE), self.order)
+        return self.unpack_record(I32)[0]
 
     def read_u32(self) -> int:
-        return from_u32(self.read(U32_SIZE), self.order)
+        return self.unpack_record(U32)[0]
 
     def read_i64(self) -> int:
-        return from_i64(self.read(I64_SIZE), self.order)
+        return self.unpack_record(I64)[0]
 
     def read_u64(self) -> int:
-        return from_u64(self.read(U64_SIZE), self.order)
+        return self.unpack_record(U64)[0]
 
     def read_f32(self) -> float:
-        return from_f32(self.read(F32_SIZE), self.order)
+        return self.unpack_record(F32)[0]
 
     def read_f64(self) -> float:
-        return from_f64(self.read(F64_SIZE), self.order)
+        return self.unpack_record(F64)[0]
+
+    def unpack_record(self, format: str) -> Tuple[Any, ...]:
+        """Reads and unpacks the whole fixed-layout record described by `format` at once."""
+        return self.unpack_struct(get_struct(format, self.order))
+
+    def unpack_struct(self, struct: Struct) -> Tuple[Any, ...]:
+        reader = self.reader
+
+        if is_instance(reader, BufferReader):
+            return reader.unpack(struct)  # unpack in place, without copying
+
+        return struct.unpack(reader.read(struct.size))
+
+    def read_many(self, format: str, count: int) -> Tuple[Any, ...]:
+        """Reads `count` values of the same `format` at once.
+
+        The struct is not cached, since counts vary from call to call.
+        """
+        return self.unpack_struct(Struct(self.order.value + str(count) + format))
 
     def read(self, size: int) -> bytes:
         return self.reader.read(size)
@@ -227,5 +263,16 @@ class Writer(Generic[W]):
     def write_f64(self, value: float) -> None:
         self.write(to_f64(value, self.order))
 
+    def pack_record(self, format: str, *values: Any) -> None:
+        """Packs and writes the whole fixed-layout record described by `format` at once."""
+        self.write(get_struct(format, self.order).pack(*values))
+
+    def write_many(self, format: str, values: Sequence[Any]) -> None:
+        """Writes `values` of the same `format` at once.
+
+        The struct is not cached, since counts vary from call to call.
+        """
+        self.write(Struct(self.order.value + str(len(values)) + format).pack(*values))
+
     def write(self, data: bytes) -> None:
         self.writer.write(data)
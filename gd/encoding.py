@@ -2,19 +2,27 @@ from base64 import b64decode as standard_decode_base64
 from base64 import b64encode as standard_encode_base64
 from base64 import urlsafe_b64decode as standard_decode_base64_url_safe
 from base64 import urlsafe_b64encode as standard_encode_base64_url_safe
+from codecs import getincrementaldecoder as get_incremental_decoder
+from concurrent.futures import ThreadPoolExecutor
 from gzip import decompress as standard_decompress
 from hashlib import sha1 as standard_sha1
+from itertools import repeat
+from os import cpu_count
 from random import choices
 from random import randrange as random_range
 from string import ascii_letters, digits
-from typing import AnyStr, Iterable, Sequence, TypeVar
-from zlib import MAX_WBITS
+from struct import Struct
+from typing import AnyStr, Iterable, Iterator, Optional, Sequence, TypeVar, Union
+from zlib import DEFLATED, MAX_WBITS, Z_DEFAULT_COMPRESSION, Z_FINISH, Z_SYNC_FLUSH
 from zlib import compressobj as create_compressor
+from zlib import crc32
 from zlib import decompressobj as create_decompressor
 from zlib import error as ZLibError
 
+from typing_aliases import is_string
 from xor_cipher import cyclic_xor, cyclic_xor_string, xor, xor_string
 
+from gd.asyncio import run_cpu_bound
 from gd.constants import (
     DEFAULT_APPLY_XOR,
     DEFAULT_CHECK,
@@ -23,6 +31,7 @@ from gd.constants import (
     DEFAULT_ERRORS,
     DEFAULT_RECORD,
     DEFAULT_SECONDS,
+    EMPTY_BYTES,
 )
 from gd.enums import Key, Salt, SimpleKey
 from gd.platform import DARWIN
@@ -70,9 +79,19 @@ __all__ = (
     "unzip_level",
     "zip_level_string",
     "unzip_level_string",
+    "zip_level_string_async",
+    "unzip_level_string_async",
+    "iter_unzip_level_string",
+    "iter_zip_level_string",
+    "iter_decode_base64_url_safe",
+    "iter_encode_base64_url_safe",
+    "iter_compress",
+    "iter_decompress",
+    "detect_wbits",
     "generate_level_seed",
     "generate_leaderboard_seed",
     "compress",
+    "compress_parallel",
     "decompress",
     "fix_song_encoding",
 )
@@ -94,12 +113,663 @@ AES_KEY = b"ipu9TUv54yv]isFMh5@;t.5w34E2Ry@{"
 
 CIPHER = None if AES is None else AES.new(AES_KEY, AES.MODE_ECB)
 
+# compression
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+DEFAULT_LEVEL = Z_DEFAULT_COMPRESSION
+
+DEFAULT_WORKERS = None
+
+BLOCK_SIZE = 131072
+DICTIONARY_SIZE = 32768
+
+PARALLEL_THRESHOLD = 1048576
+
+BYTE_BITS = 8
+
+# padding
+
+BASE64_PAD = 4
+BASE64_QUANTUM = 3
+BASE64_INVALID_TO_PAD = 1
+BASE64_PADDING = b"="
+
+BASE64_ALPHABET = (ascii_letters + digits + "+/-_").encode()
+BASE64_IGNORED = bytes(sorted(set(range(256)).difference(BASE64_ALPHABET)))  # padding included
+
+ECB_PAD = 16
+
+# save key
+
+SAVE_KEY = SimpleKey.SAVE.value
+
+# characters
+
+CHARACTERS = ascii_letters + digits
+
+
+LAST = ~0
+
+T = TypeVar("T")
+
+
+def last(sequence: Sequence[T]) -> T:
+    return sequence[LAST]
+
+
+def drop_last(count: int, data: bytes) -> bytes:
+    return data[:-count]
+
+
+def enforce_valid_base64(data: bytes) -> bytes:
+    base64_pad = BASE64_PAD
+    base64_padding = BASE64_PADDING
+    base64_invalid_to_pad = BASE64_INVALID_TO_PAD
+
+    required = len(data) % base64_pad
+
+    if required:
+        if required == base64_invalid_to_pad:
+            data = drop_last(base64_invalid_to_pad, data)
+
+        else:
+            data += base64_padding * (base64_pad - required)
+
+    return data
+
+
+def decode_base64(data: bytes) -> bytes:
+    return standard_decode_base64(enforce_valid_base64(data))
+
+
+def encode_base64(data: bytes) -> bytes:
+    return standard_encode_base64(data)
+
+
+def decode_base64_url_safe(data: bytes) -> bytes:
+    return standard_decode_base64_url_safe(enforce_valid_base64(data))
+
+
+def encode_base64_url_safe(data: bytes) -> bytes:
+    return standard_encode_base64_url_safe(data)
+
+
+def decode_base64_string(
+    string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return decode_base64(string.encode(encoding, errors)).decode(encoding, errors)
+
+
+def encode_base64_string(
+    string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return encode_base64(string.encode(encoding, errors)).decode(encoding, errors)
+
+
+def decode_base64_string_url_safe(
+    string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return decode_base64_url_safe(string.encode(encoding, errors)).decode(encoding, errors)
+
+
+def encode_base64_string_url_safe(
+    string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return encode_base64_url_safe(string.encode(encoding, errors)).decode(encoding, errors)
+
+
+def decode_save(data: bytes, apply_xor: bool = DEFAULT_APPLY_XOR) -> bytes:
+    if apply_xor:
+        data = xor(data, SAVE_KEY)
+
+    return decompress(decode_base64_url_safe(data))
+
+
+def encode_save(
+    data: bytes,
+    apply_xor: bool = DEFAULT_APPLY_XOR,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> bytes:
+    data = encode_base64_url_safe(compress(data, level, workers))
+
+    if apply_xor:
+        data = xor(data, SAVE_KEY)
+
+    return data
+
+
+def decode_save_string(
+    string: str,
+    apply_xor: bool = DEFAULT_APPLY_XOR,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> str:
+    return decode_save(string.encode(encoding, errors), apply_xor).decode(encoding, errors)
+
+
+def encode_save_string(
+    string: str,
+    apply_xor: bool = DEFAULT_APPLY_XOR,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> str:
+    return encode_save(string.encode(encoding, errors), apply_xor, level, workers).decode(
+        encoding, errors
+    )
+
+
+DEFAULT_LENGTH_WITH_VALUE = 5
+DEFAULT_START = 1000
+DEFAULT_STOP = 1000000
+
+
+def generate_random_string_and_encode_value(
+    key: Key,
+    length: int = DEFAULT_LENGTH_WITH_VALUE,
+    start: int = DEFAULT_START,
+    stop: int = DEFAULT_STOP,
+    characters: str = CHARACTERS,
+) -> str:
+    return generate_random_string(length, characters) + encode_robtop_string(
+        str(random_range(start, stop)), key
+    )
+
+
+DEFAULT_LENGTH = 10
+
+
+def generate_random_string(length: int = 10, characters: str = CHARACTERS) -> str:
+    return concat_empty(choices(characters, k=length))
+
+
+def decode_robtop(data: bytes, key: Key) -> bytes:
+    return cyclic_xor(decode_base64(data), key.bytes)
+
+
+def encode_robtop(data: bytes, key: Key) -> bytes:
+    return encode_base64(cyclic_xor(data, key.bytes))
+
+
+def decode_robtop_string(
+    string: str, key: Key, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return decode_robtop(string.encode(encoding, errors), key).decode(encoding, errors)
+
+
+def encode_robtop_string(
+    string: str, key: Key, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return encode_robtop(string.encode(encoding, errors), key).decode(encoding, errors)
+
+
+def decode_darwin_save(
+    data: bytes, apply_xor: bool = DEFAULT_APPLY_XOR  # `apply_xor` is here for compatibility
+) -> bytes:
+    cipher = CIPHER
+
+    if cipher is None:
+        raise OSError  # TODO: message?
+
+    data = cipher.decrypt(data)
+
+    data = drop_last(last(data), data)
+
+    return data
+
+
+def encode_darwin_save(
+    data: bytes,
+    apply_xor: bool = DEFAULT_APPLY_XOR,  # `apply_xor` is here, again, for compatibility
+    level: int = DEFAULT_LEVEL,  # so are `level` and `workers`
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> bytes:
+    cipher = CIPHER
+
+    if cipher is None:
+        raise OSError  # TODO: message?
+
+    pad = ECB_PAD
+
+    required = len(data) % pad
+
+    byte = pad - required
+    data += bytes([byte] * byte)
+
+    return cipher.encrypt(data)
+
+
+if DARWIN:
+    decode_system_save, encode_system_save = decode_darwin_save, encode_darwin_save
+
+else:
+    decode_system_save, encode_system_save = decode_save, encode_save
+
+
+def sha1(data: bytes) -> str:
+    return standard_sha1(data).hexdigest()
+
+
+def sha1_with_salt(stream: bytes, salt: Salt) -> str:
+    return standard_sha1(stream + salt.bytes).hexdigest()
+
+
+def sha1_string(string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS) -> str:
+    return sha1(string.encode(encoding, errors))
+
+
+def sha1_string_with_salt(
+    string: str, salt: Salt, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return sha1_with_salt(string.encode(encoding, errors), salt)
+
+
+def generate_check(
+    values: Iterable[str],
+    key: Key,
+    salt: Salt,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+) -> str:
+    return encode_robtop_string(
+        sha1_string_with_salt(concat_empty(values), salt, encoding, errors),
+        key,
+        encoding,
+        errors,
+    )
+
+
+def zip_level(
+    data: bytes, level: int = DEFAULT_LEVEL, workers: Optional[int] = DEFAULT_WORKERS
+) -> bytes:
+    return encode_save(data, apply_xor=False, level=level, workers=workers)
+
+
+def unzip_level(data: bytes) -> bytes:
+    return decode_save(data, apply_xor=False)
+
+
+def zip_level_string(
+    data: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> str:
+    if resolve_workers(len(data), workers) > 1:
+        return encode_save_string(data, False, encoding, errors, level, workers)
+
+    return concat_empty(iter_zip_level_string(iter_chunks(data), encoding, errors, level))
+
+
+def unzip_level_string(
+    data: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return decode_save_string(data, apply_xor=False, encoding=encoding, errors=errors)
+
+
+async def zip_level_string_async(
+    data: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> str:
+    return await run_cpu_bound(zip_level_string, data, encoding, errors, level, workers)
+
+
+async def unzip_level_string_async(
+    data: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return await run_cpu_bound(unzip_level_string, data, encoding, errors)
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def iter_chunks(data: AnyStr, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[AnyStr]:
+    for index in range(0, len(data), chunk_size):
+        yield data[index : index + chunk_size]
+
+
+def iter_encode_chunks(
+    chunks: Iterable[str], encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode(encoding, errors)
+
+
+def iter_decode_chunks(
+    chunks: Iterable[bytes], encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Iterator[str]:
+    decoder = get_incremental_decoder(encoding)(errors)
+
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(EMPTY_BYTES, final=True)
+
+
+def iter_decode_base64_url_safe(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally decodes URL-safe base64, accepting arbitrarily split `chunks`.
+
+    Like [`decode_base64_url_safe`][gd.encoding.decode_base64_url_safe] does, bytes outside
+    of the alphabet (whitespace and padding, for instance) are discarded.
+    """
+    pad = BASE64_PAD
+    ignored = BASE64_IGNORED
+
+    remainder = EMPTY_BYTES
+
+    for chunk in chunks:
+        chunk = chunk.translate(None, ignored)  # keep the chunks aligned to base64 quanta
+
+        if remainder:
+            chunk = remainder + chunk
+
+        end = len(chunk) - len(chunk) % pad
+
+        remainder = chunk[end:]
+
+        if end:
+            yield standard_decode_base64_url_safe(chunk[:end])
+
+    if remainder:
+        yield decode_base64_url_safe(remainder)
+
+
+def iter_encode_base64_url_safe(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally encodes URL-safe base64, accepting arbitrarily split `chunks`."""
+    quantum = BASE64_QUANTUM
+
+    remainder = EMPTY_BYTES
+
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+
+        end = len(chunk) - len(chunk) % quantum
+
+        remainder = chunk[end:]
+
+        if end:
+            yield standard_encode_base64_url_safe(chunk[:end])
+
+    if remainder:
+        yield standard_encode_base64_url_safe(remainder)
+
+
+FAILED_TO_DECOMPRESS = "Failed to decompress data."
+
+DEFLATE = DEFLATED
+COMPRESSION_METHOD = 0x0F
+ZLIB_CHECK = 31
+
+WBITS_SNIFF_SIZE = 2
+
+RAW_WBITS = -MAX_WBITS
+GZIP_WBITS = MAX_WBITS | Z_GZIP_HEADER
+
+
+def detect_wbits(data: bytes) -> int:
+    """Detects the format of compressed `data` by its header, returning `wbits` to use.
+
+    Gzip and zlib streams are recognized by their headers; anything else is assumed
+    to be raw deflate.
+    """
+    if data[:WBITS_SNIFF_SIZE] == GZIP_MAGIC:
+        return GZIP_WBITS
+
+    if len(data) >= WBITS_SNIFF_SIZE:
+        method, flags = data[0], data[1]
+
+        if (
+            method & COMPRESSION_METHOD == DEFLATE
+            and not ((method << BYTE_BITS) | flags) % ZLIB_CHECK
+        ):
+            return MAX_WBITS
+
+    return RAW_WBITS
+
+
+def iter_decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally decompresses gzip, zlib or raw deflate data,
+    detecting the format from the first bytes.
+
+    Concatenated gzip members are decompressed one after another, and any other
+    trailing data is ignored.
+
+    Raises:
+        RuntimeError: The data could not be decompressed.
+    """
+    try:
+        yield from iter_decompress_unchecked(chunks)
+
+    except ZLibError as error:
+        raise RuntimeError(FAILED_TO_DECOMPRESS) from error
+
+
+def iter_decompress_unchecked(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decompressor = None
+
+    wbits = None
+
+    head = EMPTY_BYTES
+
+    for chunk in chunks:
+        while chunk:
+            if decompressor is None:
+                head += chunk
+
+                if len(head) < WBITS_SNIFF_SIZE:
+                    break
+
+                chunk = head
+
+                head = EMPTY_BYTES
+
+                member_wbits = detect_wbits(chunk)
+
+                if wbits is None:
+                    wbits = member_wbits
+
+                elif wbits != GZIP_WBITS or member_wbits != GZIP_WBITS:
+                    return  # trailing data that is not the gzip member
+
+                decompressor = create_decompressor(wbits=wbits)
+
+            yield decompressor.decompress(chunk)
+
+            if not decompressor.eof:
+                break
+
+            # the member is complete; anything after it is the start of the next one
+            chunk = decompressor.unused_data
+
+            decompressor = None
+
+    if decompressor is None:
+        if wbits is not None or not head:
+            return
+
+        wbits = detect_wbits(head)
+
+        decompressor = create_decompressor(wbits=wbits)
+
+        yield decompressor.decompress(head)
+
+    yield decompressor.flush()
+
+    # truncated streams are accepted, unless the data is not known to be compressed
+    if wbits == RAW_WBITS and not decompressor.eof:
+        raise RuntimeError(FAILED_TO_DECOMPRESS)
+
+
+def iter_compress(chunks: Iterable[bytes], level: int = DEFAULT_LEVEL) -> Iterator[bytes]:
+    """Incrementally compresses `chunks` into the gzip stream."""
+    compressor = create_compressor(level, wbits=GZIP_WBITS)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+
+def iter_unzip_level_string(
+    data: Union[str, Iterable[str]],
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Incrementally unzips the level `data` (either the string or the iterable of its chunks),
+    yielding decompressed chunks of the level string.
+
+    Base64 decoding, decompression and text decoding are pipelined chunk by chunk, so
+    neither the decoded nor the decompressed data is ever kept in memory at once.
+
+    Unlike [`unzip_level_string`][gd.encoding.unzip_level_string], which falls back to
+    other formats, the format is detected once from the first bytes.
+
+    Raises:
+        RuntimeError: The data could not be decompressed.
+    """
+    if is_string(data):
+        data = iter_chunks(data, chunk_size)
+
+    return iter_decode_chunks(
+        iter_decompress(iter_decode_base64_url_safe(iter_encode_chunks(data, encoding, errors))),
+        encoding,
+        errors,
+    )
+
+
+def iter_zip_level_string(
+    chunks: Iterable[str],
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+) -> Iterator[str]:
+    """Incrementally zips the level string given by its `chunks`,
+    yielding chunks of the zipped level data.
+
+    This can be used with [`Editor.iter_to_robtop`][gd.api.editor.Editor.iter_to_robtop]
+    to zip levels without keeping their entire string in memory.
+    """
+    for chunk in iter_encode_base64_url_safe(
+        iter_compress(iter_encode_chunks(chunks, encoding, errors), level)
+    ):
+        yield chunk.decode(encoding, errors)
+
+
+DEFAULT_COUNT = 50
+
+
+def generate_level_seed(data: AnyStr, count: int = DEFAULT_COUNT) -> AnyStr:
+    length = len(data)
+
+    if length < count:
+        return data
+
+    return data[:: length // count][:count]
+
+
+CHECK_MULTIPLY = 1482
+ATTEMPTS_ADD = 8354
+CLICKS_ADD = 3991
+RECORD_ADD = 8354
+SECONDS_ADD = 4085
+COINS_ADD = 5819
+
+TOTAL_SUBTRACT = CLICKS_ADD * RECORD_ADD + SECONDS_ADD * SECONDS_ADD
+
+
+def generate_leaderboard_seed(
+    clicks: int = DEFAULT_CLICKS,
+    record: int = DEFAULT_RECORD,
+    seconds: int = DEFAULT_SECONDS,
+    check: bool = DEFAULT_CHECK,
+) -> int:
+    return (
+        CHECK_MULTIPLY * check
+        + (clicks + CLICKS_ADD) * (record + RECORD_ADD)
+        + pow(seconds + SECONDS_ADD, 2)
+        - TOTAL_SUBTRACT
+    )
+
+
+def resolve_workers(size: int, workers: Optional[int] = DEFAULT_WORKERS) -> int:
+    if workers is None or size < PARALLEL_THRESHOLD:
+        return 1
+
+    return max(1, min(workers, -(-size // BLOCK_SIZE)))
+
+
+def compress(
+    data: bytes, level: int = DEFAULT_LEVEL, workers: Optional[int] = DEFAULT_WORKERS
+) -> bytes:
+    """Compresses `data` into the gzip stream.
+
+    Parallel compression is opt-in: if `workers` is given (and is more than `1`), data
+    of at least `PARALLEL_THRESHOLD` bytes is compressed in parallel by `workers` threads,
+    see [`compress_parallel`][gd.encoding.compress_parallel]. The output differs
+    from the serial one, though it is decompressed the same way.
+    """
+    workers = resolve_workers(len(data), workers)
+
+    if workers > 1:
+        return compress_parallel(data, level, workers)
+
+    compressor = create_compressor(level, wbits=GZIP_WBITS)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+GZIP_HEADER = 0x10
+Z_AUTO_HEADER = 0x20
+
+# AES
+
+try:
+    from Crypto.Cipher import AES
+
+except ImportError:
+    AES = None  # type: ignore
+
+AES_KEY = b"ipu9TUv54yv]isFMh5@;t.5w34E2Ry@{"
+
+CIPHER = None if AES is None else AES.new(AES_KEY, AES.MODE_ECB)
+
+# compression
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+DEFAULT_LEVEL = Z_DEFAULT_COMPRESSION
+
+DEFAULT_WORKERS = None
+
+BLOCK_SIZE = 131072
+DICTIONARY_SIZE = 32768
+
+PARALLEL_THRESHOLD = 1048576
+
+BYTE_BITS = 8
+
 # padding
 
 BASE64_PAD = 4
+BASE64_QUANTUM = 3
 BASE64_INVALID_TO_PAD = 1
 BASE64_PADDING = b"="
 
+BASE64_ALPHABET = (ascii_letters + digits + "+/-_").encode()
+BASE64_IGNORED = bytes(sorted(set(range(256)).difference(BASE64_ALPHABET)))  # padding included
+
 ECB_PAD = 16
 
 # save key
@@ -188,8 +858,13 @@ def decode_save(data: bytes, apply_xor: bool = DEFAULT_APPLY_XOR) -> bytes:
     return decompress(decode_base64_url_safe(data))
 
 
-def encode_save(data: bytes, apply_xor: bool = DEFAULT_APPLY_XOR) -> bytes:
-    data = encode_base64_url_safe(compress(data))
+def encode_save(
+    data: bytes,
+    apply_xor: bool = DEFAULT_APPLY_XOR,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> bytes:
+    data = encode_base64_url_safe(compress(data, level, workers))
 
     if apply_xor:
         data = xor(data, SAVE_KEY)
@@ -211,8 +886,12 @@ def encode_save_string(
     apply_xor: bool = DEFAULT_APPLY_XOR,
     encoding: str = DEFAULT_ENCODING,
     errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
 ) -> str:
-    return encode_save(string.encode(encoding, errors), apply_xor).decode(encoding, errors)
+    return encode_save(string.encode(encoding, errors), apply_xor, level, workers).decode(
+        encoding, errors
+    )
 
 
 DEFAULT_LENGTH_WITH_VALUE = 5
@@ -277,6 +956,8 @@ def decode_darwin_save(
 def encode_darwin_save(
     data: bytes,
     apply_xor: bool = DEFAULT_APPLY_XOR,  # `apply_xor` is here, again, for compatibility
+    level: int = DEFAULT_LEVEL,  # so are `level` and `workers`
+    workers: Optional[int] = DEFAULT_WORKERS,
 ) -> bytes:
     cipher = CIPHER
 
@@ -333,8 +1014,10 @@ def generate_check(
     )
 
 
-def zip_level(data: bytes) -> bytes:
-    return encode_save(data, apply_xor=False)
+def zip_level(
+    data: bytes, level: int = DEFAULT_LEVEL, workers: Optional[int] = DEFAULT_WORKERS
+) -> bytes:
+    return encode_save(data, apply_xor=False, level=level, workers=workers)
 
 
 def unzip_level(data: bytes) -> bytes:
@@ -342,9 +1025,16 @@ def unzip_level(data: bytes) -> bytes:
 
 
 def zip_level_string(
-    data: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+    data: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
 ) -> str:
-    return encode_save_string(data, apply_xor=False, encoding=encoding, errors=errors)
+    if resolve_workers(len(data), workers) > 1:
+        return encode_save_string(data, False, encoding, errors, level, workers)
+
+    return concat_empty(iter_zip_level_string(iter_chunks(data), encoding, errors, level))
 
 
 def unzip_level_string(
@@ -353,6 +1043,262 @@ def unzip_level_string(
     return decode_save_string(data, apply_xor=False, encoding=encoding, errors=errors)
 
 
+async def zip_level_string_async(
+    data: str,
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+    workers: Optional[int] = DEFAULT_WORKERS,
+) -> str:
+    return await run_cpu_bound(zip_level_string, data, encoding, errors, level, workers)
+
+
+async def unzip_level_string_async(
+    data: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> str:
+    return await run_cpu_bound(unzip_level_string, data, encoding, errors)
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def iter_chunks(data: AnyStr, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[AnyStr]:
+    for index in range(0, len(data), chunk_size):
+        yield data[index : index + chunk_size]
+
+
+def iter_encode_chunks(
+    chunks: Iterable[str], encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode(encoding, errors)
+
+
+def iter_decode_chunks(
+    chunks: Iterable[bytes], encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Iterator[str]:
+    decoder = get_incremental_decoder(encoding)(errors)
+
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(EMPTY_BYTES, final=True)
+
+
+def iter_decode_base64_url_safe(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally decodes URL-safe base64, accepting arbitrarily split `chunks`.
+
+    Like [`decode_base64_url_safe`][gd.encoding.decode_base64_url_safe] does, bytes outside
+    of the alphabet (whitespace and padding, for instance) are discarded.
+    """
+    pad = BASE64_PAD
+    ignored = BASE64_IGNORED
+
+    remainder = EMPTY_BYTES
+
+    for chunk in chunks:
+        chunk = chunk.translate(None, ignored)  # keep the chunks aligned to base64 quanta
+
+        if remainder:
+            chunk = remainder + chunk
+
+        end = len(chunk) - len(chunk) % pad
+
+        remainder = chunk[end:]
+
+        if end:
+            yield standard_decode_base64_url_safe(chunk[:end])
+
+    if remainder:
+        yield decode_base64_url_safe(remainder)
+
+
+def iter_encode_base64_url_safe(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally encodes URL-safe base64, accepting arbitrarily split `chunks`."""
+    quantum = BASE64_QUANTUM
+
+    remainder = EMPTY_BYTES
+
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+
+        end = len(chunk) - len(chunk) % quantum
+
+        remainder = chunk[end:]
+
+        if end:
+            yield standard_encode_base64_url_safe(chunk[:end])
+
+    if remainder:
+        yield standard_encode_base64_url_safe(remainder)
+
+
+FAILED_TO_DECOMPRESS = "Failed to decompress data."
+
+DEFLATE = DEFLATED
+COMPRESSION_METHOD = 0x0F
+ZLIB_CHECK = 31
+
+WBITS_SNIFF_SIZE = 2
+
+RAW_WBITS = -MAX_WBITS
+GZIP_WBITS = MAX_WBITS | Z_GZIP_HEADER
+
+
+def detect_wbits(data: bytes) -> int:
+    """Detects the format of compressed `data` by its header, returning `wbits` to use.
+
+    Gzip and zlib streams are recognized by their headers; anything else is assumed
+    to be raw deflate.
+    """
+    if data[:WBITS_SNIFF_SIZE] == GZIP_MAGIC:
+        return GZIP_WBITS
+
+    if len(data) >= WBITS_SNIFF_SIZE:
+        method, flags = data[0], data[1]
+
+        if (
+            method & COMPRESSION_METHOD == DEFLATE
+            and not ((method << BYTE_BITS) | flags) % ZLIB_CHECK
+        ):
+            return MAX_WBITS
+
+    return RAW_WBITS
+
+
+def iter_decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Incrementally decompresses gzip, zlib or raw deflate data,
+    detecting the format from the first bytes.
+
+    Concatenated gzip members are decompressed one after another, and any other
+    trailing data is ignored.
+
+    Raises:
+        RuntimeError: The data could not be decompressed.
+    """
+    try:
+        yield from iter_decompress_unchecked(chunks)
+
+    except ZLibError as error:
+        raise RuntimeError(FAILED_TO_DECOMPRESS) from error
+
+
+def iter_decompress_unchecked(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decompressor = None
+
+    wbits = None
+
+    head = EMPTY_BYTES
+
+    for chunk in chunks:
+        while chunk:
+            if decompressor is None:
+                head += chunk
+
+                if len(head) < WBITS_SNIFF_SIZE:
+                    break
+
+                chunk = head
+
+                head = EMPTY_BYTES
+
+                member_wbits = detect_wbits(chunk)
+
+                if wbits is None:
+                    wbits = member_wbits
+
+                elif wbits != GZIP_WBITS or member_wbits != GZIP_WBITS:
+                    return  # trailing data that is not the gzip member
+
+                decompressor = create_decompressor(wbits=wbits)
+
+            yield decompressor.decompress(chunk)
+
+            if not decompressor.eof:
+                break
+
+            # the member is complete; anything after it is the start of the next one
+            chunk = decompressor.unused_data
+
+            decompressor = None
+
+    if decompressor is None:
+        if wbits is not None or not head:
+            return
+
+        wbits = detect_wbits(head)
+
+        decompressor = create_decompressor(wbits=wbits)
+
+        yield decompressor.decompress(head)
+
+    yield decompressor.flush()
+
+    # truncated streams are accepted, unless the data is not known to be compressed
+    if wbits == RAW_WBITS and not decompressor.eof:
+        raise RuntimeError(FAILED_TO_DECOMPRESS)
+
+
+def iter_compress(chunks: Iterable[bytes], level: int = DEFAULT_LEVEL) -> Iterator[bytes]:
+    """Incrementally compresses `chunks` into the gzip stream."""
+    compressor = create_compressor(level, wbits=GZIP_WBITS)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+
+def iter_unzip_level_string(
+    data: Union[str, Iterable[str]],
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Incrementally unzips the level `data` (either the string or the iterable of its chunks),
+    yielding decompressed chunks of the level string.
+
+    Base64 decoding, decompression and text decoding are pipelined chunk by chunk, so
+    neither the decoded nor the decompressed data is ever kept in memory at once.
+
+    Unlike [`unzip_level_string`][gd.encoding.unzip_level_string], which falls back to
+    other formats, the format is detected once from the first bytes.
+
+    Raises:
+        RuntimeError: The data could not be decompressed.
+    """
+    if is_string(data):
+        data = iter_chunks(data, chunk_size)
+
+    return iter_decode_chunks(
+        iter_decompress(iter_decode_base64_url_safe(iter_encode_chunks(data, encoding, errors))),
+        encoding,
+        errors,
+    )
+
+
+def iter_zip_level_string(
+    chunks: Iterable[str],
+    encoding: str = DEFAULT_ENCODING,
+    errors: str = DEFAULT_ERRORS,
+    level: int = DEFAULT_LEVEL,
+) -> Iterator[str]:
+    """Incrementally zips the level string given by its `chunks`,
+    yielding chunks of the zipped level data.
+
+    This can be used with [`Editor.iter_to_robtop`][gd.api.editor.Editor.iter_to_robtop]
+    to zip levels without keeping their entire string in memory.
+    """
+    for chunk in iter_encode_base64_url_safe(
+        iter_compress(iter_encode_chunks(chunks, encoding, errors), level)
+    ):
+        yield chunk.decode(encoding, errors)
+
+
 DEFAULT_COUNT = 50
 
 
@@ -389,17 +1335,108 @@ def generate_leaderboard_seed(
     )
 
 
-def compress(data: bytes) -> bytes:
-    compressor = create_compressor(wbits=MAX_WBITS | Z_GZIP_HEADER)
+def resolve_workers(size: int, workers: Optional[int] = DEFAULT_WORKERS) -> int:
+    if workers is None:
+        workers = cpu_count() or 1
+
+    if size < PARALLEL_THRESHOLD:
+        return 1
+
+    return max(1, min(workers, -(-size // BLOCK_SIZE)))
+
+
+def compress(
+    data: bytes, level: int = DEFAULT_LEVEL, workers: Optional[int] = DEFAULT_WORKERS
+) -> bytes:
+    """Compresses `data` into the gzip stream.
+
+    Data of at least `PARALLEL_THRESHOLD` bytes is compressed in parallel
+    by `workers` threads (defaulting to the number of processors),
+    see [`compress_parallel`][gd.encoding.compress_parallel].
+    """
+    workers = resolve_workers(len(data), workers)
+
+    if workers > 1:
+        return compress_parallel(data, level, workers)
+
+    compressor = create_compressor(level, wbits=GZIP_WBITS)
 
     return compressor.compress(data) + compressor.flush()
 
 
+GZIP_HEADER = GZIP_MAGIC + bytes((DEFLATED, 0, 0, 0, 0, 0, 0, 0xFF))  # no flags, mtime or OS
+GZIP_TRAILER = Struct("<II")
+
+GZIP_SIZE_MASK = 0xFFFFFFFF
+
+
+def compress_block(data: memoryview, start: int, level: int) -> bytes:
+    end = start + BLOCK_SIZE
+
+    if start:
+        # prime the compressor with the preceding data so matches can span the blocks
+        compressor = create_compressor(
+            level, DEFLATED, RAW_WBITS, zdict=data[max(0, start - DICTIONARY_SIZE) : start]
+        )
+
+    else:
+        compressor = create_compressor(level, DEFLATED, RAW_WBITS)
+
+    # sync flushes align the blocks to bytes without ending the stream
+    return compressor.compress(data[start:end]) + compressor.flush(
+        Z_FINISH if end >= len(data) else Z_SYNC_FLUSH
+    )
+
+
+def compress_parallel(
+    data: bytes, level: int = DEFAULT_LEVEL, workers: Optional[int] = DEFAULT_WORKERS
+) -> bytes:
+    """Compresses `data` into the single gzip stream, compressing blocks of `BLOCK_SIZE` bytes
+    in the thread pool of `workers` threads (defaulting to the number of processors).
+
+    Like `pigz` does, every block is primed with the last `DICTIONARY_SIZE` bytes preceding it,
+    and the blocks are joined into one deflate stream, so the result is decompressed as usual.
+    """
+    if workers is None:
+        workers = cpu_count() or 1
+
+    view = memoryview(data).cast("B")
+
+    with ThreadPoolExecutor(workers) as executor:
+        blocks = executor.map(
+            compress_block,
+            repeat(view),
+            range(0, len(view), BLOCK_SIZE) if view else (0,),
+            repeat(level),
+        )
+
+        checksum = crc32(view)  # `zlib` releases the GIL, so this overlaps with compression
+
+        return EMPTY_BYTES.join(
+            (GZIP_HEADER, *blocks, GZIP_TRAILER.pack(checksum, len(view) & GZIP_SIZE_MASK))
+        )
+
+
 def decompress(data: bytes) -> bytes:
+    wbits = detect_wbits(data)
+
     try:
+        decompressor = create_decompressor(wbits=wbits)
+
+        result = decompressor.decompress(data) + decompressor.flush()
+
+        # truncated streams are accepted, unless the data is not known to be compressed;
+        # trailing data (for instance, concatenated gzip members) is handled below
+        if (decompressor.eof or wbits != RAW_WBITS) and not decompressor.unused_data:
+            return result
+
+    except ZLibError:
+        pass
+
+    try:  # concatenated gzip members, for instance
         return standard_decompress(data)
 
-    except (OSError, ZLibError):
+    except (EOFError, OSError, ZLibError):
         pass
 
     # fallback and do some other attempts
@@ -416,7 +1453,7 @@ def decompress(data: bytes) -> bytes:
         except ZLibError:
             pass
 
-    raise RuntimeError("Failed to decompress data.")
+    raise RuntimeError(FAILED_TO_DECOMPRESS)
 
 
 LEGACY = "cp1252"
@@ -1366,6 +1366,36 @@ class HTTPClient:
         account_id: Optional[int] = None,
         encoded_password: Optional[str] = None,
     ) -> str:
+        response = await self.request_level(
+            level_id, ResponseType.TEXT, account_id=account_id, encoded_password=encoded_password
+        )
+
+        return response  # type: ignore
+
+    async def get_level_bytes(
+        self,
+        level_id: int,
+        *,
+        account_id: Optional[int] = None,
+        encoded_password: Optional[str] = None,
+    ) -> bytes:
+        """Same as [`get_level`][gd.http.HTTPClient.get_level], except the response
+        is returned as bytes, which allows to parse it without decoding level data.
+        """
+        response = await self.request_level(
+            level_id, ResponseType.BYTES, account_id=account_id, encoded_password=encoded_password
+        )
+
+        return response  # type: ignore
+
+    async def request_level(
+        self,
+        level_id: int,
+        type: ResponseType,
+        *,
+        account_id: Optional[int] = None,
+        encoded_password: Optional[str] = None,
+    ) -> ResponseData:
         error_codes = {-1: MissingAccess(CAN_NOT_GET_LEVEL.format(level_id))}
 
         route = Route(POST, GET_LEVEL)
@@ -1408,7 +1438,9 @@ class HTTPClient:
                 to_camel=True,
             )
 
-        response = await self.request_route(route, data=payload, error_codes=error_codes)
+        response = await self.request_route(
+            route, type=type, data=payload, error_codes=error_codes  # type: ignore
+        )
 
         return response
 
@@ -6,8 +6,9 @@ from attrs import define, field
 from iters.async_iters import wrap_async_iter
 from pendulum import DateTime, Duration, duration
 
-from gd.api.editor import Editor
+from gd.api.editor import Editor, open_level_editor
 from gd.api.recording import Recording
+from gd.asyncio import run_cpu_bound
 from gd.binary import VERSION, BinaryReader, BinaryWriter
 from gd.binary_utils import Reader, Writer
 from gd.capacity import Capacity
@@ -37,7 +38,7 @@ from gd.constants import (
 )
 from gd.converter import CONVERTER, register_unstructure_hook_omit_client
 from gd.date_time import utc_from_timestamp, utc_now
-from gd.encoding import compress, decompress, unzip_level_string, zip_level_string
+from gd.encoding import compress, decompress, zip_level_string
 from gd.entity import Entity, EntityData
 from gd.enums import (
     ByteOrder,
@@ -51,6 +52,7 @@ from gd.enums import (
     TimelyType,
 )
 from gd.errors import MissingAccess
+from gd.memo import LEVEL_DATA_MEMO, unzip_level_data
 from gd.models import LevelModel, TimelyInfoModel
 from gd.official_levels import ID_TO_OFFICIAL_LEVEL, NAME_TO_OFFICIAL_LEVEL
 from gd.password import Password, PasswordData
@@ -150,11 +152,15 @@ class Level(Entity):
 
     @property
     def processed_data(self) -> str:
-        return unzip_level_string(self.unprocessed_data)
+        return LEVEL_DATA_MEMO.unzip(self.unprocessed_data)
 
     @processed_data.setter
     def processed_data(self, processed_data: str) -> None:
-        self.unprocessed_data = zip_level_string(processed_data)
+        unprocessed_data = zip_level_string(processed_data)
+
+        LEVEL_DATA_MEMO.remember(unprocessed_data, processed_data)
+
+        self.unprocessed_data = unprocessed_data
 
     @property
     def data(self) -> bytes:
@@ -204,7 +210,8 @@ class Level(Entity):
 
         writer.write(data)
 
-        data = compress(self.data)
+        # level data is encoded using the same binary version
+        data = compress(self.open_editor().to_bytes(version=version))
 
         writer.write_u32(len(data))
 
@@ -301,7 +308,7 @@ class Level(Entity):
 
         data = decompress(reader.read(data_length))
 
-        version = reader.read_u8()
+        level_version = reader.read_u8()
 
         downloads = reader.read_u32()
 
@@ -363,7 +370,7 @@ class Level(Entity):
             created_at=created_at,
             updated_at=updated_at,
             description=description,
-            version=version,
+            version=level_version,
             downloads=downloads,
             game_version=game_version,
             rating=rating,
@@ -387,7 +394,8 @@ class Level(Entity):
             timely_id=timely_id,
         )
 
-        level.data = data
+        # level data is encoded using the same binary version
+        level.processed_data = Editor.from_bytes(data, version=version).to_robtop()
 
         return level
 
@@ -568,7 +576,20 @@ class Level(Entity):
         return self.verified_coins
 
     def open_editor(self) -> Editor:
-        return Editor.from_robtop(self.processed_data)
+        return open_level_editor(self.unprocessed_data)
+
+    async def processed_data_async(self) -> str:
+        """Same as [`processed_data`][gd.level.Level.processed_data],
+        except unzipping is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        # strings are passed instead of levels, which do not need to be pickled then
+        return await run_cpu_bound(unzip_level_data, self.unprocessed_data)
+
+    async def open_editor_async(self) -> Editor:
+        """Same as [`open_editor`][gd.level.Level.open_editor],
+        except decoding is offloaded via [`run_cpu_bound`][gd.asyncio.run_cpu_bound].
+        """
+        return await run_cpu_bound(open_level_editor, self.unprocessed_data)
 
     async def report(self) -> None:
         await self.client.report_level(self)
@@ -0,0 +1,324 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Hashable, Optional, Tuple, Type, TypeVar
+
+from attrs import define, field
+from funcs.application import partial
+from typing_aliases import DynamicTuple, Nullary, is_string
+from typing_extensions import final
+
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS
+from gd.encoding import unzip_level_string
+from gd.robtop import FromRobTop, FromRobTopBytes
+from gd.typing import AnyString
+
+__all__ = (
+    "ParseMemo",
+    "LevelDataMemo",
+    "LEVEL_DATA_MEMO",
+    "unzip_level_data",
+)
+
+T = TypeVar("T")
+R = TypeVar("R", bound=FromRobTop)
+B = TypeVar("B", bound=FromRobTopBytes)
+
+DEFAULT_MEMO_SIZE = 128
+
+MEMO_SIZE_MUST_BE_POSITIVE = "memo size must be positive"
+
+DIGEST_SIZE = 16
+
+Digest = bytes
+
+MemoKey = Tuple[Type[Any], Digest, DynamicTuple[Hashable]]
+
+
+def digest_response(
+    response: AnyString, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> Digest:
+    if is_string(response):
+        response = response.encode(encoding, errors)
+
+    return blake2b(response, digest_size=DIGEST_SIZE).digest()
+
+
+@final
+@define()
+class ParseMemo:
+    """Represents size-bounded memos of parsed RobTop responses.
+
+    Parsing the identical response (either string or bytes) into the same type
+    (with the same arguments) returns the previously parsed model, evicting
+    the least recently used ones when the memo grows past its `size`.
+
+    Responses are keyed by their digests, so the memo does not keep them alive.
+
+    Memoized models are shared, therefore they are to be treated as frozen and must not
+    be mutated; the client only reads them when creating entities. Copying models
+    (via `pickle` or recursively via [`evolve`][attrs.evolve]) takes about as long as
+    parsing them in the first place, which would defeat the memo.
+    """
+
+    size: int = field(default=DEFAULT_MEMO_SIZE)
+    cache: "OrderedDict[MemoKey, Any]" = field(factory=OrderedDict, init=False, repr=False)
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    lock: Lock = field(factory=Lock, init=False, repr=False, eq=False)
+
+    @size.validator
+    def check_size(self, attribute: Any, size: int) -> None:
+        if size < 1:
+            raise ValueError(MEMO_SIZE_MUST_BE_POSITIVE)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def parse(self, type: Type[R], string: str, *args: Hashable) -> R:
+        return self.memoize(
+            (type, digest_response(string), args), partial(type.from_robtop, string, *args)
+        )
+
+    def parse_bytes(self, type: Type[B], data: bytes, *args: Hashable) -> B:
+        return self.memoize(
+            (type, digest_response(data), args), partial(type.from_robtop_bytes, data, *args)
+        )
+
+    def memoize(self, key: MemoKey, parse: Nullary[T]) -> T:
+        cache = self.cache
+
+        with self.lock:
+            result = cache.get(key)
+
+            if result is not None:
+                self.hits += 1
+
+                cache.move_to_end(key)
+
+                return result  # type: ignore
+
+            self.misses += 1
+
+        # parse outside of the lock, so that other responses are not blocked
+        result = parse()
+
+        with self.lock:
+            cache[key] = result
+
+            if len(cache) > self.size:
+                cache.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+            self.hits = 0
+            self.misses = 0
+
+
+DEFAULT_LEVEL_DATA_MEMO_SIZE = 1 << 26  # 64 MiB worth of characters
+
+LevelDataKey = Digest
+
+
+def level_data_key(
+    data: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> LevelDataKey:
+    return digest_response(data, encoding, errors)
+
+
+@define()
+class LevelDataEntry:
+    processed_data: str
+    editor_data: Optional[bytes] = None
+
+    @property
+    def size(self) -> int:
+        editor_data = self.editor_data
+
+        if editor_data is None:
+            return len(self.processed_data)
+
+        return len(self.processed_data) + len(editor_data)
+
+
+@final
+@define()
+class LevelDataMemo:
+    """Represents size-bounded memos of decompressed level data, shared between levels.
+
+    Entries are keyed by the digest of the compressed data, so levels with the same data
+    (for instance, fetched twice, or present in multiple lists) are unzipped only once.
+    The least recently used entries are evicted when the total size of the decompressed
+    data (along with the editor data) exceeds `size`.
+
+    If `memoize_editors` is true, editors parsed from the data are memoized in the binary form
+    as well (see [`open_level_editor`][gd.api.editor.open_level_editor]); new editors are
+    decoded on every access, so they can be mutated freely.
+    """
+
+    size: int = field(default=DEFAULT_LEVEL_DATA_MEMO_SIZE)
+    memoize_editors: bool = field(default=False)
+
+    cache: "OrderedDict[LevelDataKey, LevelDataEntry]" = field(
+        factory=OrderedDict, init=False, repr=False
+    )
+    total: int = field(default=0, init=False)
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    editor_hits: int = field(default=0, init=False)
+    editor_misses: int = field(default=0, init=False)
+
+    lock: Lock = field(factory=Lock, init=False, repr=False, eq=False)
+
+    @size.validator
+    def check_size(self, attribute: Any, size: int) -> None:
+        if size < 1:
+            raise ValueError(MEMO_SIZE_MUST_BE_POSITIVE)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def get(self, key: LevelDataKey) -> Optional[LevelDataEntry]:
+        with self.lock:
+            entry = self.cache.get(key)
+
+            if entry is None:
+                self.misses += 1
+
+            else:
+                self.hits += 1
+
+                self.cache.move_to_end(key)
+
+            return entry
+
+    def put(self, key: LevelDataKey, processed_data: str) -> LevelDataEntry:
+        entry = LevelDataEntry(processed_data)
+
+        with self.lock:
+            previous = self.cache.pop(key, None)
+
+            if previous is not None:
+                self.total -= previous.size
+
+            self.cache[key] = entry
+
+            self.total += entry.size
+
+            self.evict()
+
+        return entry
+
+    def evict(self) -> None:
+        # the lock is expected to be held
+        cache = self.cache
+
+        while self.total > self.size and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+
+            self.total -= evicted.size
+
+    def remember(self, data: str, processed_data: str) -> None:
+        """Remembers that `data` decompresses to `processed_data`,
+        for instance, after `processed_data` was compressed.
+        """
+        if data:
+            self.put(level_data_key(data), processed_data)
+
+    def entry(self, data: str) -> LevelDataEntry:
+        key = level_data_key(data)
+
+        entry = self.get(key)
+
+        if entry is None:
+            # decompress outside of the lock, so that other levels are not blocked
+            entry = self.put(key, unzip_level_string(data))
+
+        return entry
+
+    def unzip(self, data: str) -> str:
+        """Same as [`unzip_level_string`][gd.encoding.unzip_level_string], except the result
+        is memoized by the content of `data`.
+        """
+        if not data:
+            return unzip_level_string(data)
+
+        return self.entry(data).processed_data
+
+    def get_editor_data(self, data: str) -> Optional[bytes]:
+        """Returns the memoized binary data of the editor parsed from the compressed level `data`,
+        if any.
+        """
+        key = level_data_key(data)
+
+        with self.lock:
+            entry = self.cache.get(key)
+
+            editor_data = None if entry is None else entry.editor_data
+
+            if editor_data is None:
+                self.editor_misses += 1
+
+            else:
+                self.editor_hits += 1
+
+                self.cache.move_to_end(key)
+
+            return editor_data
+
+    def remember_editor_data(self, data: str, editor_data: bytes) -> None:
+        """Remembers that the editor parsed from the compressed level `data`
+        is encoded as `editor_data`, unless the level data itself is not memoized.
+        """
+        key = level_data_key(data)
+
+        with self.lock:
+            entry = self.cache.get(key)
+
+            if entry is None:
+                return
+
+            self.total -= entry.size
+
+            entry.editor_data = editor_data
+
+            self.total += entry.size
+
+            self.cache.move_to_end(key)
+
+            self.evict()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+            self.total = 0
+
+            self.hits = 0
+            self.misses = 0
+            self.editor_hits = 0
+            self.editor_misses = 0
+
+
+LEVEL_DATA_MEMO = LevelDataMemo()
+"""The process-wide memo of decompressed level data."""
+
+
+# module-level functions taking strings can be pickled, which process executors require
+
+
+def unzip_level_data(unprocessed_data: str) -> str:
+    return LEVEL_DATA_MEMO.unzip(unprocessed_data)
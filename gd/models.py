@@ -1,11 +1,12 @@
-from typing import List, Optional, Sequence, Type, TypeVar
+from re import compile, escape
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 from urllib.parse import quote, unquote
 
 from attrs import define, field
 from iters.iters import iter
 from pendulum import DateTime, Duration, duration
-from typing_aliases import DynamicTuple
-from typing_extensions import Protocol
+from typing_aliases import DynamicTuple, Unary
+from typing_extensions import Protocol, final
 from yarl import URL
 
 from gd.api.editor import Editor
@@ -72,6 +73,7 @@ from gd.encoding import (
     generate_random_string,
     sha1_string_with_salt,
     unzip_level_string,
+    zip_level,
     zip_level_string,
 )
 from gd.enums import (
@@ -133,6 +135,8 @@ from gd.models_constants import (
     USER_COMMENTS_RESPONSE_SEPARATOR,
 )
 from gd.models_utils import (
+    LEVEL_RESPONSE_SEPARATOR_BYTES,
+    ParseTable,
     bool_str,
     concat_artist,
     concat_artists_response,
@@ -188,6 +192,8 @@ from gd.models_utils import (
     concat_user_comments_response_comments,
     float_str,
     int_bool,
+    parse_field,
+    parse_field_else,
     parse_get_or,
     parse_get_or_else,
     partial_parse_enum,
@@ -217,6 +223,7 @@ from gd.models_utils import (
     split_level_leaderboard_response_users,
     split_level_leaderboard_user,
     split_level_response,
+    split_level_response_bytes,
     split_login,
     split_map_pack,
     split_map_packs_response,
@@ -292,6 +299,57 @@ def last(sequence: Sequence[T]) -> T:
 class Model(RobTop, Protocol):
     """Represents various models."""
 
+    __slots__ = ()
+
+
+LM = TypeVar("LM", bound="LazyModel")
+
+
+class LazyModel:
+    """Represents models that parse their fields lazily.
+
+    Lazy models keep the raw values split by their `TABLE`, and parse each field on first access,
+    storing the result in the attribute itself, so that subsequent accesses are free.
+
+    Fields that are not parsed directly from the table are computed using `DERIVED` functions.
+
+    Concrete lazy models subclass both this class and the eager model, and declare
+    the `options` slot.
+    """
+
+    __slots__ = ()
+
+    TABLE: ClassVar[ParseTable]
+    DERIVED: ClassVar[Dict[str, Unary[Any, Any]]] = {}
+
+    options: List[Optional[str]]
+
+    def __init__(self, options: List[Optional[str]]) -> None:
+        self.options = options
+
+    @classmethod
+    def from_robtop(cls: Type[LM], string: str) -> LM:
+        return cls(cls.TABLE.split(string))
+
+    def parse_named(self, name: str) -> Any:
+        return self.TABLE.parse_named(self.options, name)
+
+    def __getattr__(self, name: str) -> Any:
+        derive = self.DERIVED.get(name)
+
+        if derive is None:
+            if not self.TABLE.has_name(name):
+                raise AttributeError(name)
+
+            value = self.parse_named(name)
+
+        else:
+            value = derive(self)
+
+        setattr(self, name, value)
+
+        return value
+
 
 SONG_ID = 1
 SONG_NAME = 2
@@ -304,6 +362,26 @@ SONG_ARTIST_VERIFIED = 8
 SONG_DOWNLOAD_URL = 10
 
 
+def parse_download_url(string: str) -> Optional[URL]:
+    return URL(unquote(string)) if string else None
+
+
+SONG_TABLE = ParseTable(
+    SONG_SEPARATOR,
+    (
+        parse_field(SONG_ID, "id", int, DEFAULT_ID),
+        parse_field(SONG_NAME, "name", str, EMPTY),
+        parse_field(SONG_ARTIST_ID, "artist_id", int, DEFAULT_ID),
+        parse_field(SONG_ARTIST_NAME, "artist_name", str, EMPTY),
+        parse_field(SONG_SIZE, "size", float, DEFAULT_SIZE),
+        parse_field(SONG_YOUTUBE_VIDEO_ID, "youtube_video_id", str, EMPTY),
+        parse_field(SONG_YOUTUBE_CHANNEL_ID, "youtube_channel_id", str, EMPTY),
+        parse_field(SONG_ARTIST_VERIFIED, "artist_verified", int_bool, DEFAULT_ARTIST_VERIFIED),
+        parse_field(SONG_DOWNLOAD_URL, "download_url", parse_download_url, None),
+    ),
+)
+
+
 S = TypeVar("S", bound="SongModel")
 
 
@@ -322,6 +400,12 @@ class SongModel(Model):
     @classmethod
     def from_robtop(
         cls: Type[S], string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+    ) -> S:
+        return cls(**SONG_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(
+        cls: Type[S], string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
     ) -> S:
         mapping = split_song(string)
 
@@ -491,6 +575,33 @@ SEARCH_USER_ACCOUNT_ID = 16
 SEARCH_USER_USER_COINS = 17
 
 
+def parse_rank(string: str) -> int:
+    return int(string) if string else DEFAULT_RANK
+
+
+parse_icon_type = partial_parse_enum(int, IconType)
+
+SEARCH_USER_TABLE = ParseTable(
+    SEARCH_USER_SEPARATOR,
+    (
+        parse_field(SEARCH_USER_NAME, "name", str, EMPTY),
+        parse_field(SEARCH_USER_ID, "id", int, DEFAULT_ID),
+        parse_field(SEARCH_USER_STARS, "stars", int, DEFAULT_STARS),
+        parse_field(SEARCH_USER_DEMONS, "demons", int, DEFAULT_DEMONS),
+        parse_field(SEARCH_USER_RANK, "rank", parse_rank, DEFAULT_RANK),
+        parse_field(SEARCH_USER_CREATOR_POINTS, "creator_points", int, DEFAULT_CREATOR_POINTS),
+        parse_field(SEARCH_USER_ICON_ID, "icon_id", int, DEFAULT_ID),
+        parse_field(SEARCH_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(SEARCH_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(SEARCH_USER_SECRET_COINS, "secret_coins", int, DEFAULT_SECRET_COINS),
+        parse_field(SEARCH_USER_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT),
+        parse_field(SEARCH_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(SEARCH_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(SEARCH_USER_USER_COINS, "user_coins", int, DEFAULT_USER_COINS),
+    ),
+)
+
+
 SU = TypeVar("SU", bound="SearchUserModel")
 
 
@@ -513,6 +624,10 @@ class SearchUserModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[SU], string: str) -> SU:
+        return cls(**SEARCH_USER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[SU], string: str) -> SU:
         mapping = split_search_user(string)
 
         name = mapping.get(SEARCH_USER_NAME, EMPTY)
@@ -642,6 +757,70 @@ PROFILE_ROLE_ID = 49
 PROFILE_COMMENT_STATE = 50
 
 
+def parse_optional_string(string: str) -> Optional[str]:
+    return string or None
+
+
+PROFILE_TABLE = ParseTable(
+    PROFILE_SEPARATOR,
+    (
+        parse_field(PROFILE_NAME, "name", str, EMPTY),
+        parse_field(PROFILE_ID, "id", int, DEFAULT_ID),
+        parse_field(PROFILE_STARS, "stars", int, DEFAULT_STARS),
+        parse_field(PROFILE_DEMONS, "demons", int, DEFAULT_DEMONS),
+        parse_field(PROFILE_CREATOR_POINTS, "creator_points", int, DEFAULT_CREATOR_POINTS),
+        parse_field(PROFILE_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(PROFILE_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(PROFILE_SECRET_COINS, "secret_coins", int, DEFAULT_SECRET_COINS),
+        parse_field(PROFILE_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(PROFILE_USER_COINS, "user_coins", int, DEFAULT_USER_COINS),
+        parse_field(
+            PROFILE_MESSAGE_STATE,
+            "message_state",
+            partial_parse_enum(int, MessageState),
+            MessageState.DEFAULT,
+        ),
+        parse_field(
+            PROFILE_FRIEND_REQUEST_STATE,
+            "friend_request_state",
+            partial_parse_enum(int, FriendRequestState),
+            FriendRequestState.DEFAULT,
+        ),
+        parse_field(PROFILE_YOUTUBE, "youtube", parse_optional_string, None),
+        parse_field(PROFILE_CUBE_ID, "cube_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_SHIP_ID, "ship_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_BALL_ID, "ball_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_UFO_ID, "ufo_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_WAVE_ID, "wave_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_ROBOT_ID, "robot_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(PROFILE_ACTIVE, "active", int_bool, DEFAULT_ACTIVE),
+        parse_field(PROFILE_RANK, "rank", int, DEFAULT_RANK),
+        parse_field(
+            PROFILE_FRIEND_STATE,
+            "friend_state",
+            partial_parse_enum(int, FriendState),
+            FriendState.DEFAULT,
+        ),
+        parse_field(PROFILE_NEW_MESSAGES, "new_messages", int, DEFAULT_NEW),
+        parse_field(PROFILE_NEW_FRIEND_REQUESTS, "new_friend_requests", int, DEFAULT_NEW),
+        parse_field(PROFILE_NEW_FRIENDS, "new_friends", int, DEFAULT_NEW),
+        parse_field(PROFILE_SPIDER_ID, "spider_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_TWITTER, "twitter", parse_optional_string, None),
+        parse_field(PROFILE_TWITCH, "twitch", parse_optional_string, None),
+        parse_field(PROFILE_DIAMONDS, "diamonds", int, DEFAULT_DIAMONDS),
+        parse_field(PROFILE_EXPLOSION_ID, "explosion_id", int, DEFAULT_ICON_ID),
+        parse_field(PROFILE_ROLE_ID, "role_id", int, DEFAULT_ID),
+        parse_field(
+            PROFILE_COMMENT_STATE,
+            "comment_state",
+            partial_parse_enum(int, CommentState),
+            CommentState.DEFAULT,
+        ),
+    ),
+)
+
+
 P = TypeVar("P", bound="ProfileModel")
 
 
@@ -683,6 +862,10 @@ class ProfileModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[P], string: str) -> P:
+        return cls(**PROFILE_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[P], string: str) -> P:
         mapping = split_profile(string)
 
         name = mapping.get(PROFILE_NAME, EMPTY)
@@ -871,6 +1054,27 @@ RELATIONSHIP_USER_ACCOUNT_ID = 16
 RELATIONSHIP_USER_MESSAGE_STATE = 18
 
 
+RELATIONSHIP_USER_TABLE = ParseTable(
+    RELATIONSHIP_USER_SEPARATOR,
+    (
+        parse_field(RELATIONSHIP_USER_NAME, "name", str, EMPTY),
+        parse_field(RELATIONSHIP_USER_ID, "id", int, DEFAULT_ID),
+        parse_field(RELATIONSHIP_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        parse_field(RELATIONSHIP_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(RELATIONSHIP_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(RELATIONSHIP_USER_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT),
+        parse_field(RELATIONSHIP_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(RELATIONSHIP_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(
+            RELATIONSHIP_USER_MESSAGE_STATE,
+            "message_state",
+            partial_parse_enum(int, MessageState),
+            MessageState.DEFAULT,
+        ),
+    ),
+)
+
+
 RU = TypeVar("RU", bound="RelationshipUserModel")
 
 
@@ -888,6 +1092,10 @@ class RelationshipUserModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[RU], string: str) -> RU:
+        return cls(**RELATIONSHIP_USER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[RU], string: str) -> RU:
         mapping = split_relationship_user(string)
 
         name = mapping.get(RELATIONSHIP_USER_NAME, EMPTY)
@@ -975,6 +1183,28 @@ LEADERBOARD_USER_USER_COINS = 17
 LEADERBOARD_USER_DIAMONDS = 46
 
 
+LEADERBOARD_USER_TABLE = ParseTable(
+    LEADERBOARD_USER_SEPARATOR,
+    (
+        parse_field(LEADERBOARD_USER_NAME, "name", str, EMPTY),
+        parse_field(LEADERBOARD_USER_ID, "id", int, DEFAULT_ID),
+        parse_field(LEADERBOARD_USER_STARS, "stars", int, DEFAULT_STARS),
+        parse_field(LEADERBOARD_USER_DEMONS, "demons", int, DEFAULT_DEMONS),
+        parse_field(LEADERBOARD_USER_PLACE, "place", int, DEFAULT_PLACE),
+        parse_field(LEADERBOARD_USER_CREATOR_POINTS, "creator_points", int, DEFAULT_CREATOR_POINTS),
+        parse_field(LEADERBOARD_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        parse_field(LEADERBOARD_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(LEADERBOARD_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(LEADERBOARD_USER_SECRET_COINS, "secret_coins", int, DEFAULT_SECRET_COINS),
+        parse_field(LEADERBOARD_USER_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT),
+        parse_field(LEADERBOARD_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(LEADERBOARD_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(LEADERBOARD_USER_USER_COINS, "user_coins", int, DEFAULT_USER_COINS),
+        parse_field(LEADERBOARD_USER_DIAMONDS, "diamonds", int, DEFAULT_DIAMONDS),
+    ),
+)
+
+
 LU = TypeVar("LU", bound="LeaderboardUserModel")
 
 
@@ -998,6 +1228,10 @@ class LeaderboardUserModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[LU], string: str) -> LU:
+        return cls(**LEADERBOARD_USER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[LU], string: str) -> LU:
         mapping = split_leaderboard_user(string)
 
         name = mapping.get(LEADERBOARD_USER_NAME, EMPTY)
@@ -1133,6 +1367,28 @@ MESSAGE_READ = 8
 MESSAGE_SENT = 9
 
 
+def decode_message_content(string: str) -> str:
+    return decode_robtop_string(string, Key.MESSAGE)
+
+
+MESSAGE_TABLE = ParseTable(
+    MESSAGE_SEPARATOR,
+    (
+        parse_field(MESSAGE_ID, "id", int, DEFAULT_ID),
+        parse_field(MESSAGE_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(MESSAGE_USER_ID, "user_id", int, DEFAULT_ID),
+        parse_field(MESSAGE_SUBJECT, "subject", decode_base64_string_url_safe, EMPTY),
+        parse_field(MESSAGE_CONTENT, "content", decode_message_content, EMPTY),
+        parse_field(MESSAGE_NAME, "name", str, EMPTY),
+        parse_field_else(
+            MESSAGE_CREATED_AT, "created_at", date_time_from_human, utc_now, ignore_errors=True
+        ),
+        parse_field(MESSAGE_READ, "read", int_bool, DEFAULT_READ),
+        parse_field(MESSAGE_SENT, "sent", int_bool, DEFAULT_SENT),
+    ),
+)
+
+
 M = TypeVar("M", bound="MessageModel")
 
 
@@ -1153,6 +1409,12 @@ class MessageModel(Model):
     @classmethod
     def from_robtop(
         cls: Type[M], string: str, content_present: bool = DEFAULT_CONTENT_PRESENT
+    ) -> M:
+        return cls(**MESSAGE_TABLE.parse(string), content_present=content_present)
+
+    @classmethod
+    def from_robtop_reference(
+        cls: Type[M], string: str, content_present: bool = DEFAULT_CONTENT_PRESENT
     ) -> M:
         mapping = split_message(string)
 
@@ -1235,6 +1497,31 @@ FRIEND_REQUEST_CREATED_AT = 37
 FRIEND_REQUEST_UNREAD = 41
 
 
+FRIEND_REQUEST_TABLE = ParseTable(
+    FRIEND_REQUEST_SEPARATOR,
+    (
+        parse_field(FRIEND_REQUEST_NAME, "name", str, EMPTY),
+        parse_field(FRIEND_REQUEST_USER_ID, "user_id", int, DEFAULT_ID),
+        parse_field(FRIEND_REQUEST_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        parse_field(FRIEND_REQUEST_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(FRIEND_REQUEST_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(FRIEND_REQUEST_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT),
+        parse_field(FRIEND_REQUEST_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(FRIEND_REQUEST_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field(FRIEND_REQUEST_ID, "id", int, DEFAULT_ID),
+        parse_field(FRIEND_REQUEST_CONTENT, "content", decode_base64_string_url_safe, EMPTY),
+        parse_field_else(
+            FRIEND_REQUEST_CREATED_AT,
+            "created_at",
+            date_time_from_human,
+            utc_now,
+            ignore_errors=True,
+        ),
+        parse_field(FRIEND_REQUEST_UNREAD, "unread", int_bool, DEFAULT_UNREAD),
+    ),
+)
+
+
 FR = TypeVar("FR", bound="FriendRequestModel")
 
 
@@ -1255,6 +1542,10 @@ class FriendRequestModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[FR], string: str) -> FR:
+        return cls(**FRIEND_REQUEST_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[FR], string: str) -> FR:
         mapping = split_friend_request(string)
 
         name = mapping.get(FRIEND_REQUEST_NAME, EMPTY)
@@ -1390,6 +1681,115 @@ LEVEL_COPIES_TIME = 47
 UNPROCESSED_DATA = "unprocessed_data"
 
 
+def parse_unprocessed_data(string: str) -> str:
+    if OBJECTS_SEPARATOR in string:
+        return zip_level_string(string)
+
+    return string
+
+
+OBJECTS_SEPARATOR_PATTERN = compile(escape(OBJECTS_SEPARATOR.encode(DEFAULT_ENCODING)))
+
+
+def parse_unprocessed_data_bytes(data: memoryview) -> str:
+    # the data is decoded straight from the response, unless it needs to be zipped
+    if OBJECTS_SEPARATOR_PATTERN.search(data) is not None:
+        return zip_level(data).decode(DEFAULT_ENCODING)
+
+    return str(data, DEFAULT_ENCODING)
+
+
+def parse_seconds(string: str) -> Duration:
+    if string:
+        return duration(seconds=int(string))
+
+    return duration()
+
+
+DIFFICULTY_NUMERATOR = "difficulty_numerator"
+DIFFICULTY_DENOMINATOR = "difficulty_denominator"
+DEMON_DIFFICULTY_VALUE = "demon_difficulty_value"
+AUTO = "auto"
+DEMON = "demon"
+SCORE = "score"
+TIMELY_ID = "timely_id"
+DIFFICULTY = "difficulty"
+TIMELY_TYPE = "timely_type"
+
+LEVEL_TABLE = ParseTable(
+    LEVEL_SEPARATOR,
+    (
+        parse_field(LEVEL_ID, "id", int, DEFAULT_ID),
+        parse_field(LEVEL_NAME, "name", str, EMPTY),
+        parse_field(LEVEL_DESCRIPTION, "description", decode_base64_string_url_safe, EMPTY),
+        parse_field(
+            LEVEL_UNPROCESSED_DATA,
+            UNPROCESSED_DATA,
+            parse_unprocessed_data,
+            EMPTY,
+            parse_bytes=parse_unprocessed_data_bytes,
+        ),
+        parse_field(LEVEL_VERSION, "version", int, DEFAULT_VERSION),
+        parse_field(LEVEL_CREATOR_ID, "creator_id", int, DEFAULT_ID),
+        parse_field(LEVEL_DIFFICULTY_NUMERATOR, DIFFICULTY_NUMERATOR, int, DEFAULT_NUMERATOR),
+        parse_field(LEVEL_DIFFICULTY_DENOMINATOR, DIFFICULTY_DENOMINATOR, int, DEFAULT_DENOMINATOR),
+        parse_field(
+            LEVEL_DEMON_DIFFICULTY, DEMON_DIFFICULTY_VALUE, int, DEFAULT_DEMON_DIFFICULTY_VALUE
+        ),
+        parse_field(LEVEL_AUTO, AUTO, int_bool, DEFAULT_AUTO),
+        parse_field(LEVEL_DEMON, DEMON, int_bool, DEFAULT_DEMON),
+        parse_field(LEVEL_DOWNLOADS, "downloads", int, DEFAULT_DOWNLOADS),
+        parse_field(LEVEL_OFFICIAL_SONG_ID, "official_song_id", int, DEFAULT_ID),
+        parse_field(
+            LEVEL_GAME_VERSION, "game_version", GameVersion.from_robtop, CURRENT_GAME_VERSION
+        ),
+        parse_field(LEVEL_RATING, "rating", int, DEFAULT_RATING),
+        parse_field(
+            LEVEL_LENGTH, "length", partial_parse_enum(int, LevelLength), LevelLength.DEFAULT
+        ),
+        parse_field(LEVEL_STARS, "stars", int, DEFAULT_STARS),
+        parse_field(LEVEL_SCORE, SCORE, int, DEFAULT_SCORE),
+        parse_field_else(LEVEL_PASSWORD_DATA, "password_data", Password.from_robtop, Password),
+        parse_field_else(
+            LEVEL_CREATED_AT, "created_at", date_time_from_human, utc_now, ignore_errors=True
+        ),
+        parse_field_else(
+            LEVEL_UPDATED_AT, "updated_at", date_time_from_human, utc_now, ignore_errors=True
+        ),
+        parse_field(LEVEL_ORIGINAL_ID, "original_id", int, DEFAULT_ID),
+        parse_field(LEVEL_TWO_PLAYER, "two_player", int_bool, DEFAULT_TWO_PLAYER),
+        parse_field(LEVEL_CUSTOM_SONG_ID, "custom_song_id", int, DEFAULT_ID),
+        parse_field_else(LEVEL_CAPACITY, "capacity", Capacity.from_robtop, Capacity),
+        parse_field(LEVEL_COINS, "coins", int, DEFAULT_COINS),
+        parse_field(LEVEL_VERIFIED_COINS, "verified_coins", int_bool, DEFAULT_VERIFIED_COINS),
+        parse_field(LEVEL_REQUESTED_STARS, "requested_stars", int, DEFAULT_STARS),
+        parse_field(LEVEL_LOW_DETAIL, "low_detail", int_bool, DEFAULT_LOW_DETAIL),
+        parse_field(LEVEL_TIMELY_ID, TIMELY_ID, int, DEFAULT_ID),
+        parse_field(
+            LEVEL_SPECIAL_RATE_TYPE,
+            "special_rate_type",
+            partial_parse_enum(int, SpecialRateType),
+            SpecialRateType.DEFAULT,
+        ),
+        parse_field(LEVEL_OBJECT_COUNT, "object_count", int, DEFAULT_OBJECT_COUNT),
+        parse_field_else(LEVEL_EDITOR_TIME, "editor_time", parse_seconds, duration),
+        parse_field_else(LEVEL_COPIES_TIME, "copies_time", parse_seconds, duration),
+    ),
+)
+
+
+def timely_from_robtop(timely_id: int) -> Tuple[int, TimelyType]:
+    if timely_id:
+        result, timely_id = divmod(timely_id, WEEKLY_ID_ADD)
+
+        if result:
+            return (timely_id, TimelyType.WEEKLY)
+
+        return (timely_id, TimelyType.DAILY)
+
+    return (timely_id, TimelyType.NOT_TIMELY)
+
+
 L = TypeVar("L", bound="LevelModel")
 
 
@@ -1429,6 +1829,37 @@ class LevelModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[L], string: str) -> L:
+        return cls.from_values(LEVEL_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_bytes(
+        cls: Type[L], data: bytes, start: int = 0, stop: Optional[int] = None
+    ) -> L:
+        return cls.from_values(LEVEL_TABLE.parse_bytes(data, start, stop))
+
+    @classmethod
+    def from_values(cls: Type[L], values: Dict[str, Any]) -> L:
+        values[DIFFICULTY] = DifficultyParameters(
+            difficulty_numerator=values.pop(DIFFICULTY_NUMERATOR),
+            difficulty_denominator=values.pop(DIFFICULTY_DENOMINATOR),
+            demon_difficulty_value=values.pop(DEMON_DIFFICULTY_VALUE),
+            auto=values.pop(AUTO),
+            demon=values.pop(DEMON),
+        ).into_difficulty()
+
+        if values[SCORE] < 0:
+            values[SCORE] = 0
+
+        values[TIMELY_ID], values[TIMELY_TYPE] = timely_from_robtop(values[TIMELY_ID])
+
+        return cls(**values)
+
+    @classmethod
+    def from_robtop_lazy(cls, string: str) -> "LazyLevelModel":
+        return LazyLevelModel.from_robtop(string)
+
+    @classmethod
+    def from_robtop_reference(cls: Type[L], string: str) -> L:
         mapping = split_level(string)
 
         id = parse_get_or(int, DEFAULT_ID, mapping.get(LEVEL_ID))
@@ -1699,6 +2130,56 @@ class LevelModel(Model):
         self.processed_data = Editor.from_bytes(data).to_robtop()
 
 
+def lazy_level_difficulty(level: LazyModel) -> Difficulty:
+    return DifficultyParameters(
+        difficulty_numerator=level.parse_named(DIFFICULTY_NUMERATOR),
+        difficulty_denominator=level.parse_named(DIFFICULTY_DENOMINATOR),
+        demon_difficulty_value=level.parse_named(DEMON_DIFFICULTY_VALUE),
+        auto=level.parse_named(AUTO),
+        demon=level.parse_named(DEMON),
+    ).into_difficulty()
+
+
+def lazy_level_score(level: LazyModel) -> int:
+    score = level.parse_named(SCORE)
+
+    if score < 0:
+        score = 0
+
+    return score
+
+
+def lazy_level_timely_id(level: LazyModel) -> int:
+    timely_id, _ = timely_from_robtop(level.parse_named(TIMELY_ID))
+
+    return timely_id
+
+
+def lazy_level_timely_type(level: LazyModel) -> TimelyType:
+    _, timely_type = timely_from_robtop(level.parse_named(TIMELY_ID))
+
+    return timely_type
+
+
+@final
+class LazyLevelModel(LazyModel, LevelModel):
+    """Represents levels that parse their fields on first access.
+
+    Lazy levels are [`LevelModel`][gd.models.LevelModel] instances, behaving identically
+    to the ones returned by [`from_robtop`][gd.models.LevelModel.from_robtop].
+    """
+
+    __slots__ = ("options",)
+
+    TABLE = LEVEL_TABLE
+    DERIVED = {
+        DIFFICULTY: lazy_level_difficulty,
+        SCORE: lazy_level_score,
+        TIMELY_ID: lazy_level_timely_id,
+        TIMELY_TYPE: lazy_level_timely_type,
+    }
+
+
 LEVEL_COMMENT_INNER_LEVEL_ID = 1
 LEVEL_COMMENT_INNER_CONTENT = 2
 LEVEL_COMMENT_INNER_USER_ID = 3
@@ -1711,6 +2192,29 @@ LEVEL_COMMENT_INNER_ROLE_ID = 11
 LEVEL_COMMENT_INNER_COLOR = 12
 
 
+LEVEL_COMMENT_INNER_TABLE = ParseTable(
+    LEVEL_COMMENT_INNER_SEPARATOR,
+    (
+        parse_field(LEVEL_COMMENT_INNER_LEVEL_ID, "level_id", int, DEFAULT_ID),
+        parse_field(LEVEL_COMMENT_INNER_CONTENT, "content", decode_base64_string_url_safe, EMPTY),
+        parse_field(LEVEL_COMMENT_INNER_USER_ID, "user_id", int, DEFAULT_ID),
+        parse_field(LEVEL_COMMENT_INNER_RATING, "rating", int, DEFAULT_RATING),
+        parse_field(LEVEL_COMMENT_INNER_ID, "id", int, DEFAULT_ID),
+        parse_field(LEVEL_COMMENT_INNER_SPAM, "spam", int_bool, DEFAULT_SPAM),
+        parse_field_else(
+            LEVEL_COMMENT_INNER_CREATED_AT,
+            "created_at",
+            date_time_from_human,
+            utc_now,
+            ignore_errors=True,
+        ),
+        parse_field(LEVEL_COMMENT_INNER_RECORD, "record", int, DEFAULT_RECORD),
+        parse_field(LEVEL_COMMENT_INNER_ROLE_ID, "role_id", int, DEFAULT_ID),
+        parse_field_else(LEVEL_COMMENT_INNER_COLOR, "color", Color.from_robtop, Color.default),
+    ),
+)
+
+
 LCI = TypeVar("LCI", bound="LevelCommentInnerModel")
 
 
@@ -1729,6 +2233,14 @@ class LevelCommentInnerModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[LCI], string: str) -> LCI:
+        return cls(**LEVEL_COMMENT_INNER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_lazy(cls, string: str) -> "LazyLevelCommentInnerModel":
+        return LazyLevelCommentInnerModel.from_robtop(string)
+
+    @classmethod
+    def from_robtop_reference(cls: Type[LCI], string: str) -> LCI:
         mapping = split_level_comment_inner(string)
 
         level_id = parse_get_or(int, DEFAULT_ID, mapping.get(LEVEL_COMMENT_INNER_LEVEL_ID))
@@ -1795,6 +2307,15 @@ class LevelCommentInnerModel(Model):
         return self.spam
 
 
+@final
+class LazyLevelCommentInnerModel(LazyModel, LevelCommentInnerModel):
+    """Represents level comments that parse their fields on first access."""
+
+    __slots__ = ("options",)
+
+    TABLE = LEVEL_COMMENT_INNER_TABLE
+
+
 LEVEL_COMMENT_USER_NAME = 1
 LEVEL_COMMENT_USER_ICON_ID = 9
 LEVEL_COMMENT_USER_COLOR_1_ID = 10
@@ -1804,6 +2325,20 @@ LEVEL_COMMENT_USER_GLOW = 15
 LEVEL_COMMENT_USER_ACCOUNT_ID = 16
 
 
+LEVEL_COMMENT_USER_TABLE = ParseTable(
+    LEVEL_COMMENT_USER_SEPARATOR,
+    (
+        parse_field(LEVEL_COMMENT_USER_NAME, "name", str, EMPTY),
+        parse_field(LEVEL_COMMENT_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        parse_field(LEVEL_COMMENT_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(LEVEL_COMMENT_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(LEVEL_COMMENT_USER_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT),
+        parse_field(LEVEL_COMMENT_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(LEVEL_COMMENT_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+    ),
+)
+
+
 LCU = TypeVar("LCU", bound="LevelCommentUserModel")
 
 
@@ -1819,6 +2354,10 @@ class LevelCommentUserModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[LCU], string: str) -> LCU:
+        return cls(**LEVEL_COMMENT_USER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[LCU], string: str) -> LCU:
         mapping = split_level_comment_user(string)
 
         name = mapping.get(LEVEL_COMMENT_USER_NAME, EMPTY)
@@ -1894,6 +2433,15 @@ class LevelCommentModel(Model):
 
         return cls(inner=inner, user=user)
 
+    @classmethod
+    def from_robtop_lazy(cls: Type[LC], string: str) -> LC:
+        inner_string, user_string = split_level_comment(string)
+
+        inner = LevelCommentInnerModel.from_robtop_lazy(inner_string)
+        user = LevelCommentUserModel.from_robtop(user_string)
+
+        return cls(inner=inner, user=user)
+
     def to_robtop(self) -> str:
         return iter.of(self.inner.to_robtop(), self.user.to_robtop()).collect(concat_level_comment)
 
@@ -1908,6 +2456,19 @@ USER_COMMENT_ID = 6
 USER_COMMENT_CREATED_AT = 9
 
 
+USER_COMMENT_TABLE = ParseTable(
+    USER_COMMENT_SEPARATOR,
+    (
+        parse_field(USER_COMMENT_CONTENT, "content", decode_base64_string_url_safe, EMPTY),
+        parse_field(USER_COMMENT_RATING, "rating", int, DEFAULT_RATING),
+        parse_field(USER_COMMENT_ID, "id", int, DEFAULT_ID),
+        parse_field_else(
+            USER_COMMENT_CREATED_AT, "created_at", date_time_from_human, utc_now, ignore_errors=True
+        ),
+    ),
+)
+
+
 UC = TypeVar("UC", bound="UserCommentModel")
 
 
@@ -1920,6 +2481,14 @@ class UserCommentModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[UC], string: str) -> UC:
+        return cls(**USER_COMMENT_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_lazy(cls, string: str) -> "LazyUserCommentModel":
+        return LazyUserCommentModel.from_robtop(string)
+
+    @classmethod
+    def from_robtop_reference(cls: Type[UC], string: str) -> UC:
         mapping = split_user_comment(string)
 
         content = decode_base64_string_url_safe(mapping.get(USER_COMMENT_CONTENT, EMPTY))
@@ -1952,6 +2521,15 @@ class UserCommentModel(Model):
         return USER_COMMENT_SEPARATOR in string
 
 
+@final
+class LazyUserCommentModel(LazyModel, UserCommentModel):
+    """Represents user comments that parse their fields on first access."""
+
+    __slots__ = ("options",)
+
+    TABLE = USER_COMMENT_TABLE
+
+
 LEVEL_LEADERBOARD_USER_NAME = 1
 LEVEL_LEADERBOARD_USER_ID = 2
 LEVEL_LEADERBOARD_USER_RECORD = 3
@@ -1966,6 +2544,33 @@ LEVEL_LEADERBOARD_USER_ACCOUNT_ID = 16
 LEVEL_LEADERBOARD_USER_RECORDED_AT = 42
 
 
+LEVEL_LEADERBOARD_USER_TABLE = ParseTable(
+    LEVEL_LEADERBOARD_USER_SEPARATOR,
+    (
+        parse_field(LEVEL_LEADERBOARD_USER_NAME, "name", str, EMPTY),
+        parse_field(LEVEL_LEADERBOARD_USER_ID, "id", int, DEFAULT_ID),
+        parse_field(LEVEL_LEADERBOARD_USER_RECORD, "record", int, DEFAULT_RECORD),
+        parse_field(LEVEL_LEADERBOARD_USER_PLACE, "place", int, DEFAULT_PLACE),
+        parse_field(LEVEL_LEADERBOARD_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        parse_field(LEVEL_LEADERBOARD_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        parse_field(LEVEL_LEADERBOARD_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        parse_field(LEVEL_LEADERBOARD_USER_COINS, "coins", int, DEFAULT_COINS),
+        parse_field(
+            LEVEL_LEADERBOARD_USER_ICON_TYPE, "icon_type", parse_icon_type, IconType.DEFAULT
+        ),
+        parse_field(LEVEL_LEADERBOARD_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        parse_field(LEVEL_LEADERBOARD_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        parse_field_else(
+            LEVEL_LEADERBOARD_USER_RECORDED_AT,
+            "recorded_at",
+            date_time_from_human,
+            utc_now,
+            ignore_errors=True,
+        ),
+    ),
+)
+
+
 LLU = TypeVar("LLU", bound="LevelLeaderboardUserModel")
 
 
@@ -1986,6 +2591,10 @@ class LevelLeaderboardUserModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[LLU], string: str) -> LLU:
+        return cls(**LEVEL_LEADERBOARD_USER_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[LLU], string: str) -> LLU:
         mapping = split_level_leaderboard_user(string)
 
         name = mapping.get(LEVEL_LEADERBOARD_USER_NAME, EMPTY)
@@ -2015,6 +2624,8 @@ class LevelLeaderboardUserModel(Model):
 
         glow = parse_get_or(int_bool, DEFAULT_GLOW, mapping.get(LEVEL_LEADERBOARD_USER_GLOW))
 
+        account_id = parse_get_or(int, DEFAULT_ID, mapping.get(LEVEL_LEADERBOARD_USER_ACCOUNT_ID))
+
         recorded_at = parse_get_or_else(
             date_time_from_human,
             utc_now,
@@ -2033,6 +2644,7 @@ class LevelLeaderboardUserModel(Model):
             coins=coins,
             icon_type=icon_type,
             glow=glow,
+            account_id=account_id,
             recorded_at=recorded_at,
         )
 
@@ -2069,6 +2681,9 @@ class LevelLeaderboardUserModel(Model):
 ARTIST_NAME = 4
 
 
+ARTIST_TABLE = ParseTable(ARTIST_SEPARATOR, (parse_field(ARTIST_NAME, "name", str, EMPTY),))
+
+
 A = TypeVar("A", bound="ArtistModel")
 
 
@@ -2078,6 +2693,10 @@ class ArtistModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[A], string: str) -> A:
+        return cls(**ARTIST_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[A], string: str) -> A:
         mapping = split_artist(string)
 
         name = mapping.get(ARTIST_NAME, EMPTY)
@@ -2163,6 +2782,19 @@ GAUNTLET_ID = 1
 GAUNTLET_LEVEL_IDS = 3
 
 
+def parse_level_ids(string: str) -> DynamicTuple[int]:
+    return iter(split_level_ids(string)).map(int).tuple()
+
+
+GAUNTLET_TABLE = ParseTable(
+    GAUNTLET_SEPARATOR,
+    (
+        parse_field(GAUNTLET_ID, "id", int, DEFAULT_ID),
+        parse_field(GAUNTLET_LEVEL_IDS, "level_ids", parse_level_ids, ()),
+    ),
+)
+
+
 G = TypeVar("G", bound="GauntletModel")
 
 
@@ -2173,6 +2805,10 @@ class GauntletModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[G], string: str) -> G:
+        return cls(**GAUNTLET_TABLE.parse(string))
+
+    @classmethod
+    def from_robtop_reference(cls: Type[G], string: str) -> G:
         mapping = split_gauntlet(string)
 
         id = parse_get_or(int, DEFAULT_ID, mapping.get(GAUNTLET_ID))
@@ -2215,6 +2851,21 @@ MP = TypeVar("MP", bound="MapPackModel")
 
 DEFAULT_DIFFICULTY_VALUE = Difficulty.DEFAULT.value
 
+DIFFICULTY_VALUE = "difficulty_value"
+
+MAP_PACK_TABLE = ParseTable(
+    MAP_PACK_SEPARATOR,
+    (
+        parse_field(MAP_PACK_ID, "id", int, DEFAULT_ID),
+        parse_field(MAP_PACK_NAME, "name", str, EMPTY),
+        parse_field(MAP_PACK_LEVEL_IDS, "level_ids", parse_level_ids, ()),
+        parse_field(MAP_PACK_STARS, "stars", int, DEFAULT_STARS),
+        parse_field(MAP_PACK_COINS, "coins", int, DEFAULT_COINS),
+        parse_field(MAP_PACK_DIFFICULTY, DIFFICULTY_VALUE, int, DEFAULT_DIFFICULTY_VALUE),
+        parse_field_else(MAP_PACK_COLOR, "color", Color.from_robtop, Color.default),
+    ),
+)
+
 
 @define()
 class MapPackModel(Model):
@@ -2228,6 +2879,14 @@ class MapPackModel(Model):
 
     @classmethod
     def from_robtop(cls: Type[MP], string: str) -> MP:
+        values = MAP_PACK_TABLE.parse(string)
+
+        values[DIFFICULTY] = Difficulty(values.pop(DIFFICULTY_VALUE) + 1)
+
+        return cls(**values)
+
+    @classmethod
+    def from_robtop_reference(cls: Type[MP], string: str) -> MP:
         mapping = split_map_pack(string)
 
         id = parse_get_or(int, DEFAULT_ID, mapping.get(MAP_PACK_ID))
@@ -2704,6 +3363,20 @@ class LevelCommentsResponseModel(Model):
 
         return cls(comments=comments, page=page)
 
+    @classmethod
+    def from_robtop_lazy(cls: Type[LCR], string: str) -> LCR:
+        comments_string, page_string = split_level_comments_response(string)
+
+        comments = (
+            iter(split_level_comments_response_comments(comments_string))
+            .map(LevelCommentModel.from_robtop_lazy)
+            .list()
+        )
+
+        page = PageModel.from_robtop(page_string)
+
+        return cls(comments=comments, page=page)
+
     def to_robtop(self) -> str:
         return iter.of(
             iter(self.comments)
@@ -2759,6 +3432,8 @@ class UserCommentsResponseModel(Model):
 SMART_HASH_COUNT = 40
 
 
+EXPECTED_LEVEL_RESPONSE_SEPARATOR = "expected level response separator"
+
 LR = TypeVar("LR", bound="LevelResponseModel")
 
 
@@ -2801,6 +3476,33 @@ class LevelResponseModel:
 
         return cls(level=level, smart_hash=smart_hash, hash=hash, creator=creator)
 
+    @classmethod
+    def from_robtop_bytes(cls: Type[LR], data: bytes) -> LR:
+        # avoid splitting the whole response, since the level part is by far the largest one
+        level_stop = data.find(LEVEL_RESPONSE_SEPARATOR_BYTES)
+
+        if level_stop < 0:
+            raise ValueError(EXPECTED_LEVEL_RESPONSE_SEPARATOR)
+
+        rest = split_level_response_bytes(data[level_stop + len(LEVEL_RESPONSE_SEPARATOR_BYTES) :])
+
+        try:
+            smart_hash_data, hash_data = rest
+
+            creator = None
+
+        except ValueError:
+            smart_hash_data, hash_data, creator_data = rest
+
+            creator = CreatorModel.from_robtop(creator_data.decode(DEFAULT_ENCODING))
+
+        level = LevelModel.from_robtop_bytes(data, stop=level_stop)
+
+        smart_hash = smart_hash_data.decode(DEFAULT_ENCODING)
+        hash = hash_data.decode(DEFAULT_ENCODING)
+
+        return cls(level=level, smart_hash=smart_hash, hash=hash, creator=creator)
+
     def to_robtop(self) -> str:
         creator = self.creator
 
@@ -2877,6 +3579,36 @@ class SearchLevelsResponseModel(Model):
 
         return cls(levels=levels, creators=creators, songs=songs, page=page, hash=hash)
 
+    @classmethod
+    def from_robtop_lazy(cls: Type[SLR], string: str) -> SLR:
+        (
+            levels_string,
+            creators_string,
+            songs_string,
+            page_string,
+            hash,
+        ) = split_search_levels_response(string)
+
+        levels = (
+            iter(split_search_levels_response_levels(levels_string))
+            .map(LevelModel.from_robtop_lazy)
+            .list()
+        )
+
+        creators = (
+            iter(split_search_levels_response_creators(creators_string))
+            .map(CreatorModel.from_robtop)
+            .list()
+        )
+
+        songs = (
+            iter(split_search_levels_response_songs(songs_string)).map(SongModel.from_robtop).list()
+        )
+
+        page = PageModel.from_robtop(page_string)
+
+        return cls(levels=levels, creators=creators, songs=songs, page=page, hash=hash)
+
     def to_robtop(self) -> str:
         return iter.of(
             concat_search_levels_response_levels(level.to_robtop() for level in self.levels),
@@ -1,10 +1,26 @@
+from builtins import iter as standard_iter
 from enum import Enum
-from typing import Iterable, Mapping, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from attrs import field, frozen
 from funcs.application import partial
 from iters.iters import iter
-from typing_aliases import NormalError, Nullary, Pair, Parse
+from typing_aliases import DynamicTuple, NormalError, Nullary, Pair, Parse, Unary
+from typing_extensions import final
 
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, EMPTY
 from gd.models_constants import (
     ARTIST_SEPARATOR,
     ARTISTS_RESPONSE_ARTISTS_SEPARATOR,
@@ -152,6 +168,241 @@ def parse_get_or_else(
         raise
 
 
+@final
+@frozen()
+class ParseField(Generic[T]):
+    """Represents fields of parse tables.
+
+    Each field maps the `key` found in RobTop strings onto the `name` of the result,
+    converting the value using `parse`.
+
+    If the key is not present, `default` is used, unless `factory` is given,
+    in which case it is called to create the default value instead.
+
+    When parsing bytes, values are given as views, and `parse_bytes` is used if given,
+    which allows to skip decoding; otherwise the value is decoded and passed to `parse`.
+    """
+
+    key: int = field()
+    name: str = field()
+    parse: Parse[T] = field()
+    default: Optional[T] = field(default=None)
+    factory: Optional[Nullary[T]] = field(default=None)
+    ignore_errors: bool = field(default=DEFAULT_IGNORE_ERRORS)
+    parse_bytes: Optional[Unary[memoryview, T]] = field(default=None)
+
+    def create_default(self) -> T:
+        factory = self.factory
+
+        if factory is None:
+            return self.default  # type: ignore
+
+        return factory()
+
+    def parse_option(self, option: Optional[str]) -> T:
+        if option is None:
+            return self.create_default()
+
+        try:
+            return self.parse(option)
+
+        except NormalError:
+            if self.ignore_errors:
+                return self.create_default()
+
+            raise
+
+    def parse_option_bytes(
+        self,
+        option: Optional[memoryview],
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> T:
+        parse_bytes = self.parse_bytes
+
+        if parse_bytes is None:
+            return self.parse_option(None if option is None else str(option, encoding, errors))
+
+        if option is None:
+            return self.create_default()
+
+        try:
+            return parse_bytes(option)
+
+        except NormalError:
+            if self.ignore_errors:
+                return self.create_default()
+
+            raise
+
+
+def parse_field(
+    key: int,
+    name: str,
+    parse: Parse[T],
+    default: T,
+    ignore_errors: bool = DEFAULT_IGNORE_ERRORS,
+    parse_bytes: Optional[Unary[memoryview, T]] = None,
+) -> ParseField[T]:
+    """Creates the parse table field, analogous to
+    [`parse_get_or`][gd.models_utils.parse_get_or].
+    """
+    return ParseField(
+        key, name, parse, default=default, ignore_errors=ignore_errors, parse_bytes=parse_bytes
+    )
+
+
+def parse_field_else(
+    key: int,
+    name: str,
+    parse: Parse[T],
+    default: Nullary[T],
+    ignore_errors: bool = DEFAULT_IGNORE_ERRORS,
+    parse_bytes: Optional[Unary[memoryview, T]] = None,
+) -> ParseField[T]:
+    """Creates the parse table field, analogous to
+    [`parse_get_or_else`][gd.models_utils.parse_get_or_else].
+    """
+    return ParseField(
+        key, name, parse, factory=default, ignore_errors=ignore_errors, parse_bytes=parse_bytes
+    )
+
+
+@final
+@frozen()
+class ParseTable:
+    """Represents precomputed parse tables for RobTop strings.
+
+    Parse tables walk the split string once, using the key -> index table to
+    place each value into its slot, and then convert the values with the field parsers.
+
+    Unlike [`split_mapping`][gd.models_utils.split_mapping], keys are never converted to integers,
+    and keys not present in the table are skipped.
+    """
+
+    separator: str = field()
+    fields: DynamicTuple[ParseField[Any]] = field()
+    indexes: Dict[str, int] = field(init=False, repr=False, eq=False)
+    positions: Dict[str, int] = field(init=False, repr=False, eq=False)
+    separator_bytes: bytes = field(init=False, repr=False, eq=False)
+    indexes_bytes: Dict[bytes, int] = field(init=False, repr=False, eq=False)
+
+    @indexes.default
+    def default_indexes(self) -> Dict[str, int]:
+        return {str(entry.key): index for index, entry in enumerate(self.fields)}
+
+    @separator_bytes.default
+    def default_separator_bytes(self) -> bytes:
+        return self.separator.encode(DEFAULT_ENCODING)
+
+    @indexes_bytes.default
+    def default_indexes_bytes(self) -> Dict[bytes, int]:
+        return {key.encode(DEFAULT_ENCODING): index for key, index in self.indexes.items()}
+
+    @positions.default
+    def default_positions(self) -> Dict[str, int]:
+        return {entry.name: index for index, entry in enumerate(self.fields)}
+
+    def has_name(self, name: str) -> bool:
+        return name in self.positions
+
+    def split(self, string: str) -> List[Optional[str]]:
+        """Splits the `string`, returning the list of raw values ordered by fields.
+
+        Missing values are represented by [`None`][None].
+        """
+        options: List[Optional[str]] = [None] * len(self.fields)
+
+        if not string:
+            return options
+
+        indexes = self.indexes
+
+        iterator = standard_iter(string.split(self.separator))
+
+        for key, value in zip(iterator, iterator):
+            index = indexes.get(key)
+
+            if index is not None:
+                options[index] = value
+
+        return options
+
+    def parse_named(self, options: List[Optional[str]], name: str) -> Any:
+        """Parses the single value named `name` from the `options` returned by
+        [`split`][gd.models_utils.ParseTable.split].
+        """
+        index = self.positions[name]
+
+        return self.fields[index].parse_option(options[index])
+
+    def parse(self, string: str) -> Dict[str, Any]:
+        """Parses the `string`, returning the mapping of field names to parsed values."""
+        return {
+            entry.name: entry.parse_option(option)
+            for entry, option in zip(self.fields, self.split(string))
+        }
+
+    def split_bytes(
+        self, data: bytes, start: int = 0, stop: Optional[int] = None
+    ) -> List[Optional[memoryview]]:
+        """Same as [`split`][gd.models_utils.ParseTable.split], except operates on bytes.
+
+        Unlike [`split`][gd.models_utils.ParseTable.split], values are views into
+        the `data` (limited to `start:stop`), so that they are not copied before decoding.
+        """
+        options: List[Optional[memoryview]] = [None] * len(self.fields)
+
+        view = memoryview(data)
+
+        if stop is None:
+            stop = len(data)
+
+        indexes = self.indexes_bytes
+
+        separator = self.separator_bytes
+        length = len(separator)
+
+        find = data.find
+
+        while start < stop:
+            key_stop = find(separator, start, stop)
+
+            if key_stop < 0:
+                break
+
+            value_start = key_stop + length
+            value_stop = find(separator, value_start, stop)
+
+            if value_stop < 0:
+                value_stop = stop
+
+            index = indexes.get(data[start:key_stop])
+
+            if index is not None:
+                options[index] = view[value_start:value_stop]
+
+            start = value_stop + length
+
+        return options
+
+    def parse_bytes(
+        self,
+        data: bytes,
+        start: int = 0,
+        stop: Optional[int] = None,
+        encoding: str = DEFAULT_ENCODING,
+        errors: str = DEFAULT_ERRORS,
+    ) -> Dict[str, Any]:
+        """Parses the `data` (limited to `start:stop`), decoding only the values
+        that need to be decoded.
+        """
+        return {
+            entry.name: entry.parse_option_bytes(option, encoding, errors)
+            for entry, option in zip(self.fields, self.split_bytes(data, start, stop))
+        }
+
+
 def split_iterable(separator: str, string: str) -> Iterable[str]:
     if not string:
         return []
@@ -159,6 +410,45 @@ def split_iterable(separator: str, string: str) -> Iterable[str]:
     return string.split(separator)
 
 
+def iter_split_iterable(separator: str, chunks: Iterable[str]) -> Iterator[str]:
+    """Lazily splits the string, given as `chunks`, by the `separator`.
+
+    Empty parts are not yielded.
+    """
+    length = len(separator)
+
+    rest = EMPTY
+
+    for chunk in chunks:
+        if rest:
+            chunk = rest + chunk
+
+        start = 0
+
+        while True:
+            end = chunk.find(separator, start)
+
+            if end < 0:
+                break
+
+            if end > start:
+                yield chunk[start:end]
+
+            start = end + length
+
+        rest = chunk[start:]
+
+    if rest:
+        yield rest
+
+
+def split_iterable_bytes(separator: bytes, data: bytes) -> Iterable[bytes]:
+    if not data:
+        return []
+
+    return data.split(separator)
+
+
 def split_string_mapping(separator: str, string: str) -> Mapping[str, str]:
     if not string:
         return {}
@@ -173,6 +463,18 @@ def split_mapping(separator: str, string: str) -> Mapping[int, str]:
     return {int(index): value for index, value in iter(string.split(separator)).pairs().unwrap()}
 
 
+def split_object_mapping(separator: str, string: str) -> Mapping[Union[int, str], str]:
+    """Splits the object `string`, converting numeric keys to integers and keeping other keys
+    (used by start positions, for instance) as strings.
+    """
+    if not string:
+        return {}
+
+    iterator = standard_iter(string.split(separator))
+
+    return {int(key) if key.isdigit() else key: value for key, value in zip(iterator, iterator)}
+
+
 def split_float_mapping(separator: str, string: str) -> Mapping[float, float]:
     if not string:
         return {}
@@ -318,8 +620,9 @@ concat_color_channels = partial(concat_iterable, COLOR_CHANNELS_SEPARATOR)
 
 split_objects = partial(split_iterable, OBJECTS_SEPARATOR)
 concat_objects = partial(concat_iterable, OBJECTS_SEPARATOR)
+iter_split_objects = partial(iter_split_iterable, OBJECTS_SEPARATOR)
 
-split_object = partial(split_mapping, OBJECT_SEPARATOR)
+split_object = partial(split_object_mapping, OBJECT_SEPARATOR)
 concat_object = partial(concat_mapping, OBJECT_SEPARATOR)
 
 split_any_object = partial(split_string_mapping, OBJECT_SEPARATOR)
@@ -374,6 +677,10 @@ concat_friend_requests_response_friend_requests = partial(
 )
 
 split_level_response = partial(split_iterable, LEVEL_RESPONSE_SEPARATOR)
+
+LEVEL_RESPONSE_SEPARATOR_BYTES = LEVEL_RESPONSE_SEPARATOR.encode(DEFAULT_ENCODING)
+
+split_level_response_bytes = partial(split_iterable_bytes, LEVEL_RESPONSE_SEPARATOR_BYTES)
 concat_level_response = partial(concat_iterable, LEVEL_RESPONSE_SEPARATOR)
 
 split_search_levels_response = partial(split_iterable, SEARCH_LEVELS_RESPONSE_SEPARATOR)
@@ -4,13 +4,24 @@ from typing import Any, Type, TypeVar
 from typing_aliases import is_instance
 from typing_extensions import Protocol, TypeGuard, runtime_checkable
 
-__all__ = ("RobTop", "FromRobTop", "ToRobTop", "is_from_robtop", "is_to_robtop")
+__all__ = (
+    "RobTop",
+    "FromRobTop",
+    "FromRobTopBytes",
+    "ToRobTop",
+    "is_from_robtop",
+    "is_from_robtop_bytes",
+    "is_to_robtop",
+)
 
 T = TypeVar("T", bound="FromRobTop")
+B = TypeVar("B", bound="FromRobTopBytes")
 
 
 @runtime_checkable
 class FromRobTop(Protocol):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_robtop(cls: Type[T], string: str) -> T:
@@ -25,8 +36,24 @@ def is_from_robtop(item: Any) -> TypeGuard[FromRobTop]:
     return is_instance(item, FromRobTop)
 
 
+@runtime_checkable
+class FromRobTopBytes(Protocol):
+    __slots__ = ()
+
+    @classmethod
+    @required
+    def from_robtop_bytes(cls: Type[B], data: bytes) -> B:
+        ...
+
+
+def is_from_robtop_bytes(item: Any) -> TypeGuard[FromRobTopBytes]:
+    return is_instance(item, FromRobTopBytes)
+
+
 @runtime_checkable
 class ToRobTop(Protocol):
+    __slots__ = ()
+
     @required
     def to_robtop(self) -> str:
         ...
@@ -38,4 +65,4 @@ def is_to_robtop(item: Any) -> TypeGuard[ToRobTop]:
 
 @runtime_checkable
 class RobTop(FromRobTop, ToRobTop, Protocol):
-    pass
+    __slots__ = ()
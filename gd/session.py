@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, Sequence, TypeVar
+from typing import Hashable, List, Optional, Sequence, Type, TypeVar
 
 from attrs import field, frozen
 from pendulum import Duration
@@ -44,6 +44,7 @@ from gd.enums import (
 )
 from gd.filters import Filters
 from gd.http import HTTPClient
+from gd.memo import ParseMemo
 from gd.models import (
     ArtistModel,
     ArtistsResponseModel,
@@ -76,6 +77,7 @@ from gd.newgrounds import (
     search_song_models,
 )
 from gd.password import Password
+from gd.robtop import FromRobTop, FromRobTopBytes
 from gd.typing import IntString, MaybeIterable, URLString
 
 __all__ = ("Session",)
@@ -84,6 +86,9 @@ FIRST = 0
 
 T = TypeVar("T")
 
+R = TypeVar("R", bound=FromRobTop)
+RB = TypeVar("RB", bound=FromRobTopBytes)
+
 
 def first(sequence: Sequence[T]) -> T:
     return sequence[FIRST]
@@ -92,6 +97,23 @@ def first(sequence: Sequence[T]) -> T:
 @frozen()
 class Session:
     http: HTTPClient = field(factory=HTTPClient)
+    memo: Optional[ParseMemo] = field(default=None)
+
+    def parse(self, type: Type[R], response: str, *args: Hashable) -> R:
+        memo = self.memo
+
+        if memo is None:
+            return type.from_robtop(response, *args)  # type: ignore
+
+        return memo.parse(type, response, *args)
+
+    def parse_bytes(self, type: Type[RB], response: bytes, *args: Hashable) -> RB:
+        memo = self.memo
+
+        if memo is None:
+            return type.from_robtop_bytes(response, *args)  # type: ignore
+
+        return memo.parse_bytes(type, response, *args)
 
     async def ping(self, url: URLString) -> Duration:
         return await self.http.ping(url)
@@ -99,7 +121,7 @@ class Session:
     async def login(self, name: str, password: str) -> LoginModel:
         response = await self.http.login(name, password)
 
-        return LoginModel.from_robtop(response)
+        return self.parse(LoginModel, response)
 
     async def load(self, account_id: int, name: str, password: str) -> Database:
         response = await self.http.load(account_id=account_id, name=name, password=password)
@@ -209,7 +231,7 @@ class Session:
     ) -> SearchUsersResponseModel:
         response = await self.http.search_users_on_page(query=query, page=page)
 
-        return SearchUsersResponseModel.from_robtop(response)
+        return self.parse(SearchUsersResponseModel, response)
 
     async def get_user_profile(
         self,
@@ -224,7 +246,7 @@ class Session:
             encoded_password=encoded_password,
         )
 
-        return ProfileModel.from_robtop(response)
+        return self.parse(ProfileModel, response)
 
     async def get_relationships(
         self, type: RelationshipType, *, account_id: int, encoded_password: str
@@ -233,7 +255,7 @@ class Session:
             type=type, account_id=account_id, encoded_password=encoded_password
         )
 
-        return RelationshipsResponseModel.from_robtop(response)
+        return self.parse(RelationshipsResponseModel, response)
 
     async def get_leaderboard(
         self,
@@ -247,7 +269,7 @@ class Session:
             strategy=strategy, count=count, account_id=account_id, encoded_password=encoded_password
         )
 
-        return LeaderboardResponseModel.from_robtop(response)
+        return self.parse(LeaderboardResponseModel, response)
 
     async def search_levels_on_page(
         self,
@@ -272,12 +294,12 @@ class Session:
             encoded_password=encoded_password,
         )
 
-        return SearchLevelsResponseModel.from_robtop(response)
+        return self.parse(SearchLevelsResponseModel, response)
 
     async def get_timely_info(self, type: TimelyType) -> TimelyInfoModel:
         response = await self.http.get_timely_info(type=type)
 
-        return TimelyInfoModel.from_robtop(response, type=type)
+        return self.parse(TimelyInfoModel, response, type)
 
     async def get_level(
         self,
@@ -286,11 +308,11 @@ class Session:
         account_id: Optional[int] = None,
         encoded_password: Optional[str] = None,
     ) -> LevelResponseModel:
-        response = await self.http.get_level(
+        response = await self.http.get_level_bytes(
             level_id=level_id, account_id=account_id, encoded_password=encoded_password
         )
 
-        return LevelResponseModel.from_robtop(response)
+        return self.parse_bytes(LevelResponseModel, response)
 
     async def report_level(self, level_id: int) -> None:
         await self.http.report_level(level_id=level_id)
@@ -429,7 +451,7 @@ class Session:
             encoded_password=encoded_password,
         )
 
-        return LevelLeaderboardResponseModel.from_robtop(response)
+        return self.parse(LevelLeaderboardResponseModel, response)
 
     async def block_user(
         self,
@@ -498,7 +520,7 @@ class Session:
             encoded_password=encoded_password,
         )
 
-        return MessageModel.from_robtop(response, content_present=True)
+        return self.parse(MessageModel, response, True)  # content is present
 
     async def delete_message(
         self,
@@ -522,7 +544,7 @@ class Session:
             type=type, page=page, account_id=account_id, encoded_password=encoded_password
         )
 
-        return MessagesResponseModel.from_robtop(response)
+        return self.parse(MessagesResponseModel, response)
 
     async def send_friend_request(
         self,
@@ -592,7 +614,7 @@ class Session:
             type=type, page=page, account_id=account_id, encoded_password=encoded_password
         )
 
-        return FriendRequestsResponseModel.from_robtop(response)
+        return self.parse(FriendRequestsResponseModel, response)
 
     async def like_level(
         self,
@@ -713,7 +735,7 @@ class Session:
             page=page,
         )
 
-        return UserCommentsResponseModel.from_robtop(response)
+        return self.parse(UserCommentsResponseModel, response)
 
     async def get_user_level_comments_on_page(
         self,
@@ -729,7 +751,7 @@ class Session:
             strategy=strategy,
         )
 
-        return LevelCommentsResponseModel.from_robtop(response)
+        return self.parse(LevelCommentsResponseModel, response)
 
     async def get_level_comments_on_page(
         self,
@@ -742,23 +764,23 @@ class Session:
             level_id=level_id, count=count, page=page, strategy=strategy
         )
 
-        return LevelCommentsResponseModel.from_robtop(response)
+        return self.parse(LevelCommentsResponseModel, response)
 
     async def get_gauntlets(self) -> GauntletsResponseModel:
         response = await self.http.get_gauntlets()
 
-        return GauntletsResponseModel.from_robtop(response)
+        return self.parse(GauntletsResponseModel, response)
 
     async def get_map_packs_on_page(self, page: int = DEFAULT_PAGE) -> MapPacksResponseModel:
         response = await self.http.get_map_packs_on_page(page=page)
 
-        return MapPacksResponseModel.from_robtop(response)
+        return self.parse(MapPacksResponseModel, response)
 
     async def get_quests(self, *, account_id: int, encoded_password: str) -> QuestsResponseModel:
         response = await self.http.get_quests(
             account_id=account_id, encoded_password=encoded_password
         )
-        return QuestsResponseModel.from_robtop(response)
+        return self.parse(QuestsResponseModel, response)
 
     async def get_chests(
         self,
@@ -776,17 +798,17 @@ class Session:
             account_id=account_id,
             encoded_password=encoded_password,
         )
-        return ChestsResponseModel.from_robtop(response)
+        return self.parse(ChestsResponseModel, response)
 
     async def get_artists_on_page(self, page: int = DEFAULT_PAGE) -> ArtistsResponseModel:
         response = await self.http.get_artists_on_page(page=page)
 
-        return ArtistsResponseModel.from_robtop(response)
+        return self.parse(ArtistsResponseModel, response)
 
     async def get_song(self, song_id: int) -> SongModel:
         response = await self.http.get_song(song_id)
 
-        return SongModel.from_robtop(response)
+        return self.parse(SongModel, response)
 
     async def get_newgrounds_song(self, song_id: int) -> SongModel:
         response = await self.http.get_newgrounds_song(song_id)
@@ -0,0 +1,641 @@
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from math import hypot
+from operator import attrgetter as get_attribute_factory
+from pathlib import Path
+from pickle import dumps, loads
+from threading import current_thread
+from typing import Set
+from zlib import MAX_WBITS
+from zlib import compress as zlib_compress
+
+from pytest import approx, mark, raises
+
+from gd.api.columnar import ColumnarEditor
+from gd.api.editor import Editor, time_length
+from gd.api.header import Header
+from gd.api.hsv import DEFAULT_HSV, HSV, intern_hsv
+from gd.api.objects import (
+    EMPTY_GROUPS,
+    Groups,
+    NormalColorTrigger,
+    NormalMoveTrigger,
+    Object,
+    StartPosition,
+    object_from_robtop,
+    peek_base_color_hsv,
+    peek_detail_color_hsv,
+    peek_groups,
+)
+from gd.api.packed import PackedObjects
+from gd.api.selection import Selection
+from gd.asyncio import get_executor, run_blocking, run_cpu_bound, set_executor
+from gd.binary import BufferReader, dump_to, load_from
+from gd.encoding import (
+    compress,
+    decompress,
+    detect_wbits,
+    encode_base64_url_safe,
+    iter_unzip_level_string,
+    iter_zip_level_string,
+    unzip_level_string,
+    zip_level_string,
+)
+from gd.enums import ByteOrder, SpeedChangeType, SpeedMagic
+from gd.models_utils import split_objects
+from gd.string_utils import concat_empty
+
+OBJECT_COUNT = 10_000
+
+
+def find_next(values: Set[int], start: int = 1) -> int:
+    while start in values:
+        start += 1
+
+    return start
+
+
+get_x = get_attribute_factory("x")
+
+
+def create_editor(count: int = OBJECT_COUNT) -> Editor:
+    objects = []
+
+    for index in range(count):
+        kind = index % 50
+        x = index * 3.0
+
+        if kind == 0:
+            objects.append(
+                NormalMoveTrigger(id=901, x=x, y=15.0, target_group_id=1 + index % 10, duration=0.5)
+            )
+
+        elif kind == 1:
+            objects.append(NormalColorTrigger(id=899, x=x, y=15.0, target_color_id=3))
+
+        elif kind == 2 and index % 1000 == 2:
+            objects.append(StartPosition(id=31, x=x, y=15.0))
+
+        else:
+            objects.append(
+                Object(
+                    id=1 + kind % 8,
+                    x=x,
+                    y=(index % 20) * 30.0,
+                    rotation=90.0 * (index % 4),
+                    groups=Groups({1 + index % 7}),
+                )
+            )
+
+    return Editor(Header(), objects)
+
+
+EDITOR = create_editor()
+STRING = EDITOR.to_robtop()
+OBJECT_STRINGS = split_objects(STRING)[1:]
+
+
+def test_object_from_robtop() -> None:
+    for object, string in zip(EDITOR.objects, OBJECT_STRINGS):
+        assert object_from_robtop(string) == object
+
+
+def test_start_position_from_robtop() -> None:
+    start_position = StartPosition(id=31, x=15.0, y=30.0)
+
+    assert object_from_robtop(start_position.to_robtop()) == start_position
+
+
+def test_benchmark_object_from_robtop(benchmark) -> None:
+    benchmark(lambda: [object_from_robtop(string) for string in OBJECT_STRINGS])
+
+
+def test_editor_binary() -> None:
+    for order in (ByteOrder.LITTLE, ByteOrder.BIG):
+        assert Editor.from_bytes(EDITOR.to_bytes(order), order) == EDITOR
+
+    legacy = EDITOR.to_bytes(version=1)
+
+    assert Editor.from_bytes(legacy, version=1) == EDITOR
+    assert ColumnarEditor.from_bytes(legacy, version=1).into_editor() == EDITOR
+
+
+def test_packed_objects() -> None:
+    reader = BufferReader(EDITOR.to_bytes())
+
+    Header.from_binary(reader)
+
+    packed = PackedObjects.from_binary(reader)
+
+    assert len(packed) == len(EDITOR)
+    assert packed.objects(100, 200) == EDITOR.objects[100:200]
+    assert packed[-1] == EDITOR.objects[-1]
+    assert packed.column("x") == [object.x for object in EDITOR.objects]
+
+    columnar = ColumnarEditor.from_editor(EDITOR)
+
+    assert ColumnarEditor.from_bytes(columnar.to_bytes()) == columnar
+
+
+def test_benchmark_editor_binary(benchmark) -> None:
+    benchmark(lambda: Editor.from_bytes(EDITOR.to_bytes()))
+
+
+def test_buffer_reader(tmp_path: Path) -> None:
+    data = EDITOR.to_bytes()
+
+    assert Editor.from_bytes(bytearray(data)) == EDITOR
+
+    reader = BufferReader(data)
+
+    assert reader.read(2) == data[:2]
+    assert reader.read_view(3).tobytes() == data[2:5]
+    assert reader.tell() == 5
+
+    path = tmp_path / "editor.gd"
+
+    dump_to(path, EDITOR)
+
+    assert load_from(path, Editor) == EDITOR
+
+    path.write_bytes(data)
+
+    with BufferReader.open(path) as reader:
+        assert Editor.from_binary(reader) == EDITOR
+        assert not reader.remaining
+
+
+def test_columnar_editor_from_editor() -> None:
+    columnar_editor = ColumnarEditor.from_editor(EDITOR)
+
+    assert len(columnar_editor) == len(EDITOR.objects)
+    assert columnar_editor.into_editor() == EDITOR
+    assert columnar_editor.to_robtop() == STRING
+
+
+def test_columnar_editor_from_robtop() -> None:
+    assert ColumnarEditor.from_robtop(STRING).into_editor() == Editor.from_robtop(STRING)
+
+
+def test_columnar_editor_binary() -> None:
+    columnar_editor = ColumnarEditor.from_editor(EDITOR)
+
+    data = columnar_editor.to_bytes()
+
+    assert data == EDITOR.to_bytes()
+    assert ColumnarEditor.from_bytes(data).into_editor() == Editor.from_bytes(data)
+
+
+def test_editor_iter_robtop() -> None:
+    objects = Editor.from_robtop(STRING).objects
+
+    assert Editor.iter_robtop(STRING).list() == objects
+    assert Editor.iter_robtop(zip_level_string(STRING)).list() == objects
+
+
+def test_editor_iter_to_robtop() -> None:
+    assert concat_empty(EDITOR.iter_to_robtop().unwrap()) == STRING
+
+
+def test_zip_level_string_streaming() -> None:
+    zipped = concat_empty(iter_zip_level_string(EDITOR.iter_to_robtop().unwrap()))
+
+    assert zipped == zip_level_string(STRING)
+    assert unzip_level_string(zipped) == STRING
+
+    chunks = [zipped[index : index + 7] for index in range(0, len(zipped), 7)]
+
+    assert concat_empty(iter_unzip_level_string(chunks)) == STRING
+
+    # concatenated gzip members are decoded one after another
+    half = len(STRING) // 2
+
+    members = compress(STRING[:half].encode()) + compress(STRING[half:].encode())
+    zipped = encode_base64_url_safe(members).decode()
+
+    assert unzip_level_string(zipped) == STRING
+
+    chunks = [zipped[index : index + 7] for index in range(0, len(zipped), 7)]
+
+    assert concat_empty(iter_unzip_level_string(chunks)) == STRING
+
+
+@mark.parametrize("zipped", ("abc", "H4sIAAAAAAAAC_not_valid"))
+def test_unzip_level_string_invalid(zipped: str) -> None:
+    with raises(RuntimeError):
+        unzip_level_string(zipped)
+
+    with raises(RuntimeError):
+        concat_empty(iter_unzip_level_string(zipped))
+
+
+def test_iter_unzip_level_string_ignores_whitespace() -> None:
+    zipped = zip_level_string(STRING)
+
+    # wrapped lines shift the chunks off the base64 quanta
+    wrapped = "\n".join(zipped[index : index + 76] for index in range(0, len(zipped), 76))
+
+    chunks = [wrapped[index : index + 7] for index in range(0, len(wrapped), 7)]
+
+    assert concat_empty(iter_unzip_level_string(chunks)) == unzip_level_string(wrapped) == STRING
+
+
+def test_decompress_detects_format() -> None:
+    data = STRING.encode()
+
+    gzip_data = compress(data)
+    zlib_data = zlib_compress(data)
+
+    assert detect_wbits(gzip_data) == MAX_WBITS | 0x10
+    assert detect_wbits(zlib_data) == MAX_WBITS
+
+    assert decompress(gzip_data) == data
+    assert decompress(zlib_data) == data
+    assert decompress(gzip_data + gzip_data) == data + data
+
+
+EXECUTOR_NAME = "executor"
+
+
+def get_thread_name() -> str:
+    return current_thread().name
+
+
+def test_editor_async() -> None:
+    with ThreadPoolExecutor(1, thread_name_prefix=EXECUTOR_NAME) as executor:
+        set_executor(executor)
+
+        try:
+            assert get_executor() is executor
+
+            assert run(EDITOR.to_robtop_async()) == STRING
+            assert run(Editor.from_robtop_async(STRING)) == Editor.from_robtop(STRING)
+
+            # only CPU-bound work goes to the configured executor, and blocking I/O does not
+            assert run(run_cpu_bound(get_thread_name)).startswith(EXECUTOR_NAME)
+            assert not run(run_blocking(get_thread_name)).startswith(EXECUTOR_NAME)
+
+        finally:
+            set_executor(None)
+
+    assert get_executor() is not executor
+
+
+def test_spatial_index() -> None:
+    editor = create_editor(1000)
+
+    index = editor.spatial_index
+
+    assert index.between(300.0, 600.0) == [
+        object for object in sorted(editor.objects, key=get_x) if 300.0 <= object.x <= 600.0
+    ]
+
+    assert sorted(map(id, index.in_rectangle(0.0, 0.0, 900.0, 90.0))) == sorted(
+        id(object)
+        for object in editor.objects
+        if 0.0 <= object.x <= 900.0 and 0.0 <= object.y <= 90.0
+    )
+
+    def distance(object: Object) -> float:
+        return hypot(object.x - 1000.0, object.y - 100.0)
+
+    assert (
+        list(map(distance, index.nearest(1000.0, 100.0, 5)))
+        == sorted(map(distance, editor.objects))[:5]
+    )
+
+
+def test_spatial_index_updates() -> None:
+    editor = create_editor(1000)
+
+    index = editor.spatial_index
+
+    object = Object(id=1, x=10_000.0, y=10_000.0)
+
+    editor.add_objects(object)
+
+    assert editor.x_length == 10_000.0
+    assert editor.nearest_objects(10_000.0, 10_000.0) == [object]
+
+    editor.remove_objects(object)
+
+    assert editor.spatial_index is index
+    assert object not in index.between(9_000.0, 11_000.0)
+    assert editor.x_length == max(object.x for object in editor.objects)
+
+    # moving objects in place invalidates the index
+    first = editor.objects[0]
+    first.x = 99_999.0
+
+    assert editor.x_length == 99_999.0
+    assert editor.objects_between(99_000.0, 100_000.0) == [first]
+
+    index = editor.spatial_index
+
+    # so does changing the objects directly, even if the length is the same
+    editor.objects[1] = object
+
+    assert editor.spatial_index is not index
+    assert editor.nearest_objects(10_000.0, 10_000.0) == [object]
+
+    index = editor.spatial_index
+
+    editor.objects = editor.objects[1:] + [Object(id=1, x=20_000.0)]
+
+    assert editor.spatial_index is not index
+    assert editor.x_length == editor.objects_between(19_000.0, 21_000.0)[0].x == 20_000.0
+
+    index = editor.spatial_index
+
+    # moving few objects via selections updates the index in place
+    moved = editor.objects[:2]
+
+    Selection(editor, moved).move(y=100_000.0)
+
+    assert editor.spatial_index is index
+    assert editor.objects_in_rectangle(0.0, 100_000.0, 30_000.0, 120_000.0) == sorted(
+        moved, key=get_x
+    )
+
+
+def test_group_index() -> None:
+    editor = create_editor(1000)
+
+    free_group = editor.free_group
+
+    assert free_group == find_next(editor.iter_groups().set())
+
+    group_id = editor.allocate_group()
+
+    assert group_id == free_group
+    assert editor.allocate_group() == group_id + 1
+
+    object = Object(id=1, groups=Groups({group_id + 2}))
+
+    editor.add_objects(object)
+
+    assert editor.objects_in_group(group_id + 2) == [object]
+    assert editor.allocate_group() == group_id + 3
+
+    editor.remove_objects(object)
+
+    assert not editor.objects_in_group(group_id + 2)
+    assert editor.allocate_group() == group_id + 2
+
+    # changing objects in place rebuilds the index, keeping the reservations
+    editor.objects[0].groups.add(group_id + 2)
+
+    assert editor.free_group == group_id + 4
+    assert editor.free_group == find_next(editor.iter_groups().set() | editor.reserved_groups)
+
+    assert editor.allocate_group() == group_id + 4
+
+
+def test_color_index() -> None:
+    editor = create_editor(1000)
+
+    assert editor.free_color_id == find_next(editor.iter_color_ids().set())
+
+    free_color_id = editor.free_color_id
+
+    editor.objects[0].base_color_id = free_color_id
+
+    assert editor.free_color_id != free_color_id
+    assert editor.free_color_id == find_next(editor.iter_color_ids().set())
+
+    color_id = editor.allocate_color_id()
+
+    editor.objects[1].detail_color_id = color_id + 1
+
+    assert editor.allocate_color_id() == color_id + 2
+
+    assert all(
+        object.base_color_id == 3 or object.detail_color_id == 3
+        for object in editor.objects_with_color_id(3)
+    )
+
+
+def test_time_table() -> None:
+    editor = create_editor(1000)
+
+    editor.add_objects(
+        Object(id=SpeedChangeType.FAST.value, x=600.0),
+        Object(id=SpeedChangeType.SLOW.value, x=1500.0),
+    )
+
+    speed_changes = editor.speed_changes
+
+    table = editor.create_time_table()
+
+    for x in (0.0, 300.0, 600.0, 1000.0, 1500.0, 2999.0):
+        time = time_length(x, editor.start_speed, speed_changes)
+
+        assert table.time_at(x) == approx(time)
+        assert table.x_at(time) == approx(x)
+
+    assert table.times_at([0.0, 600.0]) == [0.0, approx(600.0 / SpeedMagic.NORMAL.value)]
+
+
+def test_editor_cached() -> None:
+    editor = create_editor(1000)
+
+    editor.cached = True
+
+    string = editor.to_robtop()
+    data = editor.to_bytes()
+
+    assert editor.to_robtop() == string
+    assert editor.to_bytes() == data
+
+    object = editor.objects[10]
+
+    object.x += 1.0
+
+    editor.cached = False
+
+    expected_string = editor.to_robtop()
+    expected_data = editor.to_bytes()
+
+    editor.cached = True
+
+    assert editor.to_robtop() == expected_string != string
+    assert editor.to_bytes() == expected_data != data
+
+    object.add_groups(100)
+
+    assert editor.to_robtop() != expected_string
+
+    string = editor.to_robtop()
+
+    object.base_color_hsv.h = 10  # copy-on-write copies are tracked as well
+
+    assert editor.to_robtop() != string
+
+    string = editor.to_robtop()
+
+    object.base_color_hsv.h = 20  # so are the owned values
+
+    assert editor.to_robtop() != string
+
+    editor.objects = editor.objects[:10]
+
+    editor.to_robtop()
+
+    assert len(editor.cache.strings) == 10
+
+
+def test_editor_cached_from_robtop() -> None:
+    string = create_editor(100).to_robtop()
+
+    editor = Editor.from_robtop(string, cached=True)
+
+    assert editor.cached
+    assert editor == Editor.from_robtop(string)
+
+    assert editor.to_robtop() == Editor.from_robtop(string).to_robtop()
+
+    editor.objects[0].y += 1.0
+
+    editor.cached = False
+
+    expected = editor.to_robtop()
+
+    editor.cached = True
+
+    assert editor.to_robtop() == expected
+
+
+def test_shared_defaults() -> None:
+    object = Object(id=1)
+    other = Object(id=1)
+
+    assert peek_groups(object) is peek_groups(other) is EMPTY_GROUPS
+    assert peek_base_color_hsv(object) is peek_detail_color_hsv(other) is DEFAULT_HSV
+
+    with raises(ValueError):
+        EMPTY_GROUPS.add(1)
+
+    with raises(ValueError):
+        DEFAULT_HSV.h = 10
+
+    assert EMPTY_GROUPS.apply_union([1]) == Groups({1})
+
+    # reading, comparing, representing and copying keep the defaults shared
+    assert 1 not in object.groups and object.base_color_hsv.h == 0
+    assert object == other and repr(object) == repr(other)
+
+    for copied in (loads(dumps(object)), deepcopy(object), object):
+        assert peek_groups(copied) is EMPTY_GROUPS
+        assert peek_base_color_hsv(copied) is DEFAULT_HSV
+
+    object.groups.add(1)
+    object.base_color_hsv.h = 10
+
+    assert object.groups == Groups({1})
+    assert object.base_color_hsv == HSV(h=10)
+    assert not other.groups
+    assert other.base_color_hsv == DEFAULT_HSV
+
+    groups = other.groups
+    hsv = other.detail_color_hsv
+
+    groups.update((2, 3))
+    hsv.s = 0.5
+
+    assert other.groups is groups and other.groups == Groups({2, 3})
+    assert other.detail_color_hsv is hsv and other.detail_color_hsv == HSV(s=0.5)
+
+    assert intern_hsv(HSV()) is DEFAULT_HSV
+    assert intern_hsv(hsv) is hsv
+
+    assert object_from_robtop(object.to_robtop()) == object
+
+    decoded = object_from_robtop(object.to_robtop())
+    other = object_from_robtop(object.to_robtop())
+
+    assert peek_base_color_hsv(decoded) is not peek_base_color_hsv(other)
+    assert peek_detail_color_hsv(decoded) is peek_detail_color_hsv(other) is DEFAULT_HSV
+
+    decoded.base_color_hsv.h = 20
+
+    assert other.base_color_hsv.h == 10
+
+
+def test_selection_transforms() -> None:
+    first = Object(id=1, x=0.0, y=0.0, groups=Groups({1}))
+    second = Object(id=1, x=30.0, y=0.0, groups=Groups({1}))
+    third = Object(id=2, x=300.0, y=300.0)
+
+    editor = Editor.from_objects(first, second, third, header=Header())
+
+    selection = editor.select_group(1)
+
+    assert selection.objects == [first, second]
+    assert editor.select_ids({2}).objects == [third]
+    assert editor.select_region(-10.0, -10.0, 50.0, 10.0).objects == [first, second]
+
+    selection.move(x=15.0, y=15.0)
+
+    assert (first.x, first.y, second.x, second.y) == (15.0, 15.0, 45.0, 15.0)
+
+    # moving objects does not affect the group index, so it is kept
+    assert editor.valid_group_index is not None
+
+    assert editor.objects_in_rectangle(0.0, 0.0, 60.0, 30.0) == [first, second]
+
+    selection.rotate(90.0, pivot_x=15.0, pivot_y=15.0)
+
+    assert (second.x, second.y) == approx((15.0, -15.0))
+    assert second.rotation == 90.0
+
+    selection.h_flip(pivot_x=0.0)
+
+    assert first.x == -15.0
+    assert first.is_h_flipped()
+
+    selection.scale_by(2.0, pivot_x=0.0, pivot_y=0.0)
+
+    assert (second.x, second.y) == approx((-30.0, -30.0))
+    assert second.scale == 2.0
+
+    editor.color_index
+
+    selection.set_base_color_id(10)
+
+    assert editor.valid_color_index is not None
+    assert editor.objects_with_color_id(10) == [first, second]
+
+    selection.set_base_color_hsv(HSV(h=10))
+
+    first.base_color_hsv.h = 20
+
+    assert second.base_color_hsv == HSV(h=10)
+
+
+def test_groups() -> None:
+    groups = Groups((3, 1, 3, 2))
+
+    assert groups == Groups((3, 1, 2)) == [3, 1, 2]
+    assert 1 in groups and 4 not in groups
+
+    groups.add(1)
+    groups.discard(3)
+
+    assert groups.to_robtop() == "1.2"
+    assert Groups.from_robtop("1.2.1") == groups
+
+    assert groups.get_index(2).unwrap() == 1
+    assert groups.get_index(3).is_null()
+
+    other = Groups((1, 2, 3))
+
+    assert other.get_pop().unwrap() == 3
+    assert other == groups
+    assert Groups().get_pop().is_null()
+
+    for order in (ByteOrder.LITTLE, ByteOrder.BIG):
+        assert Groups.from_bytes(groups.to_bytes(order), order) == groups
+
+    assert loads(dumps(EMPTY_GROUPS)) is EMPTY_GROUPS
+    assert loads(dumps(groups)) == groups
@@ -0,0 +1,193 @@
+from pathlib import Path
+from typing import List, Tuple
+
+from gd.api.editor import open_level_editor
+from gd.encoding import zip_level_string
+from gd.memo import LevelDataMemo, ParseMemo
+from gd.models import (
+    LevelCommentInnerModel,
+    LevelCommentUserModel,
+    LevelModel,
+    SearchLevelsResponseModel,
+    SongModel,
+)
+from gd.models_utils import (
+    split_level_comment,
+    split_level_comments_response,
+    split_level_comments_response_comments,
+    split_search_levels_response,
+    split_search_levels_response_levels,
+    split_search_levels_response_songs,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+SEARCH_LEVELS = (FIXTURES / "search_levels.txt").read_text().strip()
+LEVEL_COMMENTS = (FIXTURES / "level_comments.txt").read_text().strip()
+
+
+def search_levels_levels() -> List[str]:
+    levels_string, _, _, _, _ = split_search_levels_response(SEARCH_LEVELS)
+
+    return split_search_levels_response_levels(levels_string)
+
+
+def search_levels_songs() -> List[str]:
+    _, _, songs_string, _, _ = split_search_levels_response(SEARCH_LEVELS)
+
+    return split_search_levels_response_songs(songs_string)
+
+
+def level_comments() -> List[List[str]]:
+    comments_string, _ = split_level_comments_response(LEVEL_COMMENTS)
+
+    return [
+        split_level_comment(comment)
+        for comment in split_level_comments_response_comments(comments_string)
+    ]
+
+
+LEVELS = search_levels_levels()
+SONGS = search_levels_songs()
+COMMENTS = level_comments()
+COMMENTS_INNER = [inner for inner, _ in COMMENTS]
+COMMENTS_USER = [user for _, user in COMMENTS]
+
+
+def test_level_fast_matches_reference() -> None:
+    for string in LEVELS:
+        assert (
+            LevelModel.from_robtop(string).to_robtop()
+            == LevelModel.from_robtop_reference(string).to_robtop()
+        )
+
+
+def test_song_fast_matches_reference() -> None:
+    for string in SONGS:
+        assert SongModel.from_robtop(string) == SongModel.from_robtop_reference(string)
+
+
+def test_level_comment_fast_matches_reference() -> None:
+    for string in COMMENTS_INNER:
+        assert (
+            LevelCommentInnerModel.from_robtop(string).to_robtop()
+            == LevelCommentInnerModel.from_robtop_reference(string).to_robtop()
+        )
+
+    for string in COMMENTS_USER:
+        assert LevelCommentUserModel.from_robtop(string) == (
+            LevelCommentUserModel.from_robtop_reference(string)
+        )
+
+
+def test_level_lazy_matches_eager() -> None:
+    for string in LEVELS:
+        level = LevelModel.from_robtop_lazy(string)
+
+        assert isinstance(level, LevelModel)
+        assert level.to_robtop() == LevelModel.from_robtop(string).to_robtop()
+
+
+def test_level_comment_lazy_matches_eager() -> None:
+    for string in COMMENTS_INNER:
+        assert (
+            LevelCommentInnerModel.from_robtop_lazy(string).to_robtop()
+            == LevelCommentInnerModel.from_robtop(string).to_robtop()
+        )
+
+
+def test_models_are_slotted() -> None:
+    assert not hasattr(LevelModel.from_robtop(LEVELS[0]), "__dict__")
+    assert not hasattr(LevelModel.from_robtop_lazy(LEVELS[0]), "__dict__")
+    assert not hasattr(SongModel.from_robtop(SONGS[0]), "__dict__")
+
+
+def test_level_bytes_matches_string() -> None:
+    for string in LEVELS:
+        assert (
+            LevelModel.from_robtop_bytes(string.encode()).to_robtop()
+            == LevelModel.from_robtop(string).to_robtop()
+        )
+
+
+def test_parse_memo() -> None:
+    memo = ParseMemo(size=1)
+
+    response = memo.parse(SearchLevelsResponseModel, SEARCH_LEVELS)
+
+    assert response.to_robtop() == SearchLevelsResponseModel.from_robtop(SEARCH_LEVELS).to_robtop()
+
+    # memoized models are shared; responses are keyed by their digests
+    assert memo.parse(SearchLevelsResponseModel, SEARCH_LEVELS) is response
+    assert memo.hits == 1
+
+    assert SEARCH_LEVELS not in next(iter(memo.cache))
+
+    memo.parse(SongModel, SONGS[0])
+
+    assert len(memo) == 1
+    assert memo.misses == 2
+
+
+def test_level_data_memo() -> None:
+    memo = LevelDataMemo(size=10, memoize_editors=True)
+
+    first = zip_level_string("0123456789")
+    second = zip_level_string("abcde")
+
+    assert memo.unzip(first) == "0123456789"
+    assert memo.unzip(first) == "0123456789"
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    memo.unzip(second)  # evicts the first entry, as the total size exceeds 10
+
+    assert len(memo) == 1
+    assert memo.unzip(first) == "0123456789"
+    assert memo.hit_rate == 0.25
+
+    string = (
+        "kS38,1_40_2_125_3_255_11_255_12_255_13_255_4_-1_6_1000_7_1_15_1_18_0_8_1;1,1,2,15,3,15;"
+    )
+
+    data = zip_level_string(string)
+
+    memo.size = len(string)
+
+    editor = open_level_editor(data, memo)
+
+    assert memo.total > len(string)  # the editor data counts towards the size
+
+    other = open_level_editor(data, memo)
+
+    assert other == editor and other is not editor
+    assert (memo.editor_hits, memo.editor_misses) == (1, 1)
+
+
+def scan_level(level: LevelModel) -> Tuple[int, str, int]:
+    return (level.id, level.name, level.rating)
+
+
+def test_benchmark_levels(benchmark) -> None:
+    benchmark(lambda: [LevelModel.from_robtop(string) for string in LEVELS])
+
+
+def test_benchmark_levels_reference(benchmark) -> None:
+    benchmark(lambda: [LevelModel.from_robtop_reference(string) for string in LEVELS])
+
+
+def test_benchmark_level_comments(benchmark) -> None:
+    benchmark(lambda: [LevelCommentInnerModel.from_robtop(string) for string in COMMENTS_INNER])
+
+
+def test_benchmark_level_comments_reference(benchmark) -> None:
+    benchmark(
+        lambda: [LevelCommentInnerModel.from_robtop_reference(string) for string in COMMENTS_INNER]
+    )
+
+
+def test_benchmark_levels_scan(benchmark) -> None:
+    benchmark(lambda: [scan_level(LevelModel.from_robtop(string)) for string in LEVELS])
+
+
+def test_benchmark_levels_scan_lazy(benchmark) -> None:
+    benchmark(lambda: [scan_level(LevelModel.from_robtop_lazy(string)) for string in LEVELS])
@@ -0,0 +1,176 @@
+from os import cpu_count
+from pathlib import Path
+
+from pytest import mark
+
+from gd.api.database import Database
+from gd.api.database.database import LAZY_NAMES, SAVED_LEVELS
+from gd.api.editor import Editor
+from gd.api.header import Header
+from gd.api.levels import CreatedLevelAPI, SavedLevelAPI
+from gd.api.objects import Object
+from gd.api.save_manager import SaveManager
+from gd.binary import VERSION
+from gd.encoding import PARALLEL_THRESHOLD, compress, compress_parallel, decompress
+from gd.level import Level
+
+OBJECT_COUNT = 100_000
+
+WORKERS = sorted({1, 2, cpu_count() or 1})
+
+LEVEL_COUNT = 4  # large enough for saves to be compressed in parallel
+
+
+def create_database(level_count: int = 1) -> Database:
+    database = Database()
+
+    editor = Editor.from_object_iterable(
+        (
+            Object(id=1 + index % 1000, x=index * 7.5, y=index % 300 * 30.0)
+            for index in range(OBJECT_COUNT)
+        ),
+        Header(),
+    )
+
+    processed_data = editor.to_robtop()
+
+    for id in range(1, level_count + 1):
+        level = CreatedLevelAPI.default(id)
+        level.processed_data = processed_data
+
+        database.created_levels.add(level)
+
+    return database
+
+
+DATABASE = create_database()
+LARGE_DATABASE = create_database(LEVEL_COUNT)
+
+
+def test_compress_parallel() -> None:
+    data = DATABASE.dump_levels()
+
+    assert decompress(compress_parallel(data, workers=4)) == data
+    assert decompress(compress(data, workers=4)) == data
+    assert decompress(compress_parallel(bytes(), workers=4)) == bytes()
+
+
+def test_compress_serial_by_default() -> None:
+    data = LARGE_DATABASE.dump_levels()
+
+    assert len(data) >= PARALLEL_THRESHOLD
+
+    assert compress(data) == compress(data, workers=1) != compress(data, workers=2)
+
+
+def test_save_manager_round_trip(tmp_path: Path) -> None:
+    save_manager = SaveManager(Database, level=1, workers=2)
+
+    save_manager.dump(DATABASE, tmp_path, tmp_path)
+
+    database = save_manager.load(tmp_path, tmp_path)
+
+    assert database.created_levels == DATABASE.created_levels
+
+
+def test_lazy_level_data() -> None:
+    database = Database()
+
+    editor = Editor(Header(), [Object(id=1, x=15.0, y=15.0), Object(id=8, x=45.0, y=15.0)])
+
+    level = CreatedLevelAPI.default()
+    level.data = editor.to_bytes()
+
+    database.created_levels.add(level)
+
+    data = database.to_bytes()
+
+    (loaded,) = Database.from_bytes(data).created_levels
+
+    assert loaded.is_data_pending()
+
+    assert Database.from_bytes(data).to_bytes() == data  # the data is written back as-is
+
+    # pending data is compared without being converted
+    (other,) = Database.from_bytes(data).created_levels
+
+    assert other == loaded
+    assert other.is_data_pending() and loaded.is_data_pending()
+
+    different = CreatedLevelAPI.default()
+    different.data = Editor(Header(), [Object(id=1, x=15.0, y=15.0)]).to_bytes()
+
+    assert different != level
+    assert CreatedLevelAPI.from_bytes(different.to_bytes()) != loaded
+    assert loaded.open_editor() == level.open_editor()
+    assert loaded.data == level.data
+
+    assert loaded.processed_data == Editor.from_bytes(level.data).to_robtop()
+    assert not loaded.is_data_pending()
+
+
+def test_level_data_binary_versions() -> None:
+    editor = Editor(Header(), [Object(id=1, x=15.0, y=15.0), Object(id=8, x=45.0, y=15.0)])
+
+    level = Level.default()
+    level.data = editor.to_bytes()
+
+    created_level = CreatedLevelAPI.default()
+    created_level.data = editor.to_bytes()
+
+    for version in range(1, VERSION + 1):
+        loaded = Level.from_bytes(level.to_bytes(version=version), version=version)
+
+        assert loaded.open_editor() == level.open_editor()
+
+        data = created_level.to_bytes(version=version)
+
+        loaded_created = CreatedLevelAPI.from_bytes(data, version=version)
+
+        assert loaded_created.open_editor() == created_level.open_editor()
+        assert loaded_created.to_bytes(version=version) == data
+
+
+def test_lazy_database() -> None:
+    database = Database(player_name="player")
+
+    database.saved_levels.update(SavedLevelAPI.default(id) for id in range(1, 4))
+
+    main, levels = database.dump_parts()
+
+    lazy = Database.load_parts(main, levels, lazy=True)
+
+    assert lazy.player_name == "player"
+    assert not lazy.is_loaded("saved_levels")
+
+    level = lazy.get_saved_level(2)
+
+    assert level is not None and level.id == 2
+    assert lazy.get_saved_level(4) is None
+    assert not lazy.is_loaded("saved_levels")
+
+    level.attempts = 42
+
+    assert lazy.saved_levels[1] is level  # looked up levels are reused
+
+    # raw data of loaded sections is dropped
+    assert lazy.lazy_main_data is not None
+    assert SAVED_LEVELS not in lazy.lazy_main_data
+
+    for name in LAZY_NAMES:
+        getattr(lazy, name)
+
+    assert lazy.lazy_main_data is None and lazy.lazy_levels_data is None
+
+    eager = Database.load_parts(main, levels)
+
+    eager.saved_levels[1].attempts = 42
+
+    assert lazy == eager
+
+
+@mark.parametrize("workers", WORKERS)
+def test_benchmark_save_manager_dump(benchmark, tmp_path: Path, workers: int) -> None:
+    save_manager = SaveManager(Database, workers=workers)
+
+    benchmark(save_manager.dump, LARGE_DATABASE, tmp_path, tmp_path)